@@ -8,10 +8,19 @@ This API provides endpoints for:
 - Text-to-speech generation
 """
 
+import asyncio
+import logging
+import os
 import uuid
-from typing import Optional
-from fastapi import FastAPI, HTTPException, status, UploadFile, File
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Callable, List, Optional
+import orjson
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, status, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
 import sys
 from pathlib import Path
@@ -24,16 +33,64 @@ from api.services.text_processing import TextProcessingService
 from api.services.graph_service import GraphService
 from api.services.llm_service import LLMService
 from api.services.file_extraction import FileExtractionService
+from api.services.openai_client import aclose_http_clients
+from api.services.llm_batcher import DynamicBatcher
 from api.models.graph_models import Node, Edge, Graph
 
+logger = logging.getLogger(__name__)
+
+# Worker threads for blocking SDK calls (matches openai_client.POOL_LIMITS)
+LLM_THREADS = 64
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the Q&A batcher (if enabled) and release the OpenAI connection pools on shutdown."""
+    # Blocking LLM calls run via asyncio.to_thread and mostly wait on the
+    # network, so size the thread pool like the HTTP pool, not the CPU count
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=LLM_THREADS, thread_name_prefix="llm")
+    )
+    if qa_batcher is not None:
+        qa_batcher.start()
+    yield
+    if qa_batcher is not None:
+        await qa_batcher.stop()
+    await aclose_http_clients()
+
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is parsed with orjson instead of the stdlib json module."""
+    
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that hands endpoints an ORJSONRequest, so request bodies decode with orjson."""
+    
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        
+        async def orjson_route_handler(request: Request):
+            return await handler(ORJSONRequest(request.scope, request.receive))
+        
+        return orjson_route_handler
+
+
 ### Create FastAPI instance with custom docs and openapi url
 app = FastAPI(
     title="Interactive Mindmap API",
     description="API for text-to-graph conversion with LLM integration",
     version="0.1.0",
     docs_url="/api/py/docs",
-    openapi_url="/api/py/openapi.json"
+    openapi_url="/api/py/openapi.json",
+    default_response_class=ORJSONResponse,  # orjson encodes large graph payloads much faster
+    lifespan=lifespan
 )
+app.router.route_class = ORJSONRoute  # must be set before any route is declared
 
 # Configure CORS
 app.add_middleware(
@@ -49,6 +106,41 @@ graph_service = GraphService()
 llm_service = LLMService()
 
 
+async def _answer_qa_batch(items: List[dict]) -> List[dict]:
+    """Answer a batch of queued Q&A requests with one OpenAI call."""
+    return await asyncio.to_thread(llm_service.answer_questions, items)
+
+
+# Opt-in: generate each new graph's summary in the background after /text/process
+PRECOMPUTE_SUMMARIES = os.getenv('GRAPH_SUMMARY_PRECOMPUTE', '0') == '1'
+
+
+def _precompute_summary(graph_id: str) -> None:
+    """Background task: generate and store a new graph's summary."""
+    try:
+        llm_service.generate_summary_and_store(graph_service, graph_id)
+    except Exception as e:
+        # The summary endpoint will generate it on demand instead
+        logger.warning("Summary precompute failed for %s: %s", graph_id, e)
+
+
+# Opt-in: coalesce concurrent /llm/qa requests into one OpenAI call
+qa_batcher = (
+    DynamicBatcher(_answer_qa_batch, max_batch_size=8, max_delay=0.1)
+    if os.getenv('LLM_QA_BATCHING', '0') == '1' else None
+)
+
+
+# Upper bound on texts per /api/py/text/process_batch call
+MAX_BATCH_TEXTS = 10
+
+
+@lru_cache(maxsize=1)
+def get_text_processing_service() -> TextProcessingService:
+    """Return the shared text processing service, built on first use."""
+    return TextProcessingService()
+
+
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -97,6 +189,15 @@ class TextProcessResponse(BaseModel):
     metadata: dict = Field(..., description="Processing metadata")
 
 
+class GraphSummaryResponse(BaseModel):
+    """Response model for graph summary endpoint."""
+    
+    graph_id: str = Field(..., description="Graph identifier")
+    summary: str = Field(..., description="Natural language summary of the graph")
+    model: str = Field(..., description="LLM model used")
+    precomputed: bool = Field(..., description="Whether the summary was already stored")
+
+
 class HealthResponse(BaseModel):
     """Response model for health check endpoint."""
     
@@ -278,7 +379,9 @@ async def extract_text_from_file(file: UploadFile = File(...)):
         
         # Extract text
         try:
-            extracted_text = extraction_service.extract_text_from_file(
+            # PDF parsing is CPU-bound; keep it off the event loop
+            extracted_text = await asyncio.to_thread(
+                extraction_service.extract_text_from_file,
                 file_content=file_content,
                 filename=file.filename,
                 content_type=file.content_type
@@ -303,13 +406,126 @@ async def extract_text_from_file(file: UploadFile = File(...)):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error extracting text from file: {str(e)}")
+        logger.exception("Error extracting text from file: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to extract text: {str(e)}"
         )
 
 
+async def _run_pipeline(
+    service: TextProcessingService,
+    request: TextProcessRequest,
+    on_concept: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """
+    Run the text pipeline for one request on a worker thread.
+
+    The pipeline makes blocking OpenAI calls, so it runs off the event loop.
+
+    Args:
+        service: Shared text processing service
+        request: Validated text processing request
+        on_concept: Called (on worker threads) with each raw concept as
+            extraction streams it
+
+    Returns:
+        Output of TextProcessingService.process_text()
+    """
+    return await asyncio.to_thread(
+        service.process_text,
+        text=request.text,
+        min_importance=request.min_importance,
+        min_strength=request.min_strength,
+        extract_rels=request.extract_relationships,
+        generate_embeddings=request.generate_embeddings,
+        on_concept=on_concept
+    )
+
+
+def _store_result_graph(result: dict) -> dict:
+    """
+    Convert a pipeline result into nodes/edges and store it as a new graph.
+
+    Args:
+        result: Output of TextProcessingService.process_text()
+
+    Returns:
+        TextProcessResponse-shaped dict for the stored graph
+    """
+    # Generate unique graph ID
+    graph_id = f"graph_{uuid.uuid4().hex[:12]}"
+    
+    # Convert concepts to Node format
+    nodes = []
+    for i, concept in enumerate(result['concepts']):
+        node = {
+            "id": f"node_{i}",
+            "label": concept['name'],
+            "description": concept['description'],
+            "source_text": concept['source_text'],
+            "confidence": concept['importance'],
+            "metadata": {
+                "index": i,
+                "has_embedding": 'embedding' in concept,
+                "tier": concept.get('tier', 2),  # Tier 1=core, 2=detail
+                "connections": concept.get('connections', 0),
+            },
+            "has_children": False,  # Will be determined by graph structure
+            "tier": concept.get('tier', 2),  # Also at top level for easy access
+        }
+        
+        # Add embedding if present
+        if 'embedding' in concept:
+            node['embedding'] = concept['embedding']
+        
+        nodes.append(node)
+    
+    # Convert relationships to Edge format
+    edges = []
+    for i, rel in enumerate(result.get('relationships', [])):
+        # Find node IDs for source and target
+        source_idx = next(
+            (j for j, c in enumerate(result['concepts']) if c['name'] == rel['source']),
+            None
+        )
+        target_idx = next(
+            (j for j, c in enumerate(result['concepts']) if c['name'] == rel['target']),
+            None
+        )
+        
+        if source_idx is not None and target_idx is not None:
+            edge = {
+                "id": f"edge_{i}",
+                "source": f"node_{source_idx}",
+                "target": f"node_{target_idx}",
+                "relationship_type": rel['type'],
+                "weight": rel['strength'],
+                "confidence": rel['strength'],
+                "metadata": {
+                    "description": rel.get('description', ''),
+                    "inferred": rel.get('inferred', False)  # Track auto-generated links
+                }
+            }
+            edges.append(edge)
+    
+    # Store graph in GraphService for later retrieval
+    graph_service.create_graph(graph_id, nodes, edges)
+    
+    # Build response
+    return {
+        "graph_id": graph_id,
+        "nodes": nodes,
+        "edges": edges,
+        "metadata": {
+            **result['metadata'],
+            "graph_id": graph_id,
+            "node_count": len(nodes),
+            "edge_count": len(edges)
+        }
+    }
+
+
 @app.post(
     "/api/py/text/process",
     response_model=TextProcessResponse,
@@ -321,7 +537,7 @@ async def extract_text_from_file(file: UploadFile = File(...)):
         500: {"model": ErrorResponse, "description": "Processing failed"}
     }
 )
-async def process_text(request: TextProcessRequest):
+async def process_text(request: TextProcessRequest, background_tasks: BackgroundTasks):
     """
     Process raw text and extract a knowledge graph.
     
@@ -350,89 +566,169 @@ async def process_text(request: TextProcessRequest):
     - **metadata**: Processing information (includes chunk_count)
     """
     try:
-        # Initialize text processing service
-        service = TextProcessingService()
+        # Reuse the shared text processing service
+        service = get_text_processing_service()
         
         # Process text with unlimited extraction
-        result = service.process_text(
-            text=request.text,
-            min_importance=request.min_importance,
-            min_strength=request.min_strength,
-            extract_rels=request.extract_relationships,
-            generate_embeddings=request.generate_embeddings
-        )
+        result = await _run_pipeline(service, request)
         
-        # Generate unique graph ID
-        graph_id = f"graph_{uuid.uuid4().hex[:12]}"
-        
-        # Convert concepts to Node format
-        nodes = []
-        for i, concept in enumerate(result['concepts']):
-            node = {
-                "id": f"node_{i}",
-                "label": concept['name'],
-                "description": concept['description'],
-                "source_text": concept['source_text'],
-                "confidence": concept['importance'],
-                "metadata": {
-                    "index": i,
-                    "has_embedding": 'embedding' in concept,
-                    "tier": concept.get('tier', 2),  # Tier 1=core, 2=detail
-                    "connections": concept.get('connections', 0),
-                },
-                "has_children": False,  # Will be determined by graph structure
-                "tier": concept.get('tier', 2),  # Also at top level for easy access
+        response = _store_result_graph(result)
+        if PRECOMPUTE_SUMMARIES:
+            background_tasks.add_task(_precompute_summary, response['graph_id'])
+        return response
+        
+    except ValueError as e:
+        # Input validation errors
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": {
+                    "code": "INVALID_INPUT",
+                    "message": str(e),
+                    "retry": False
+                }
             }
-            
-            # Add embedding if present
-            if 'embedding' in concept:
-                node['embedding'] = concept['embedding']
-            
-            nodes.append(node)
-        
-        # Convert relationships to Edge format
-        edges = []
-        for i, rel in enumerate(result.get('relationships', [])):
-            # Find node IDs for source and target
-            source_idx = next(
-                (j for j, c in enumerate(result['concepts']) if c['name'] == rel['source']),
-                None
-            )
-            target_idx = next(
-                (j for j, c in enumerate(result['concepts']) if c['name'] == rel['target']),
-                None
-            )
-            
-            if source_idx is not None and target_idx is not None:
-                edge = {
-                    "id": f"edge_{i}",
-                    "source": f"node_{source_idx}",
-                    "target": f"node_{target_idx}",
-                    "relationship_type": rel['type'],
-                    "weight": rel['strength'],
-                    "confidence": rel['strength'],
-                    "metadata": {
-                        "description": rel.get('description', ''),
-                        "inferred": rel.get('inferred', False)  # Track auto-generated links
-                    }
+        )
+    
+    except Exception as e:
+        # Processing errors
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": {
+                    "code": "PROCESSING_FAILED",
+                    "message": f"Failed to process text: {str(e)}",
+                    "retry": True
                 }
-                edges.append(edge)
+            }
+        )
+
+
+@app.post(
+    "/api/py/text/process/stream",
+    tags=["Text Processing"],
+    summary="Process text, streaming concepts as they are extracted (server-sent events)",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Concepts and graph as server-sent events"}
+    }
+)
+async def process_text_stream(request: TextProcessRequest, background_tasks: BackgroundTasks):
+    """
+    Process text like /api/py/text/process, streaming concepts as they are found.
+    
+    Takes the same request body. The response is a text/event-stream of:
+    - **concept** events: one raw extracted concept (name, description,
+      importance, source_text, level, parent) as soon as the model finishes
+      writing it, before duplicates are merged
+    - one final **done** event: the /api/py/text/process response
+      (graph_id, nodes, edges, metadata) for the stored graph
+    - an **error** event instead of **done** if processing fails
+    
+    The first concept typically arrives within seconds, long before the
+    full graph (merge, relationships, hierarchy) is ready.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    def on_concept(concept: dict) -> None:
+        # Called on the pipeline's extraction threads
+        payload = {k: v for k, v in concept.items() if k != 'embedding'}
+        loop.call_soon_threadsafe(queue.put_nowait, payload)
+    
+    async def events():
+        service = get_text_processing_service()
+        pipeline = asyncio.ensure_future(_run_pipeline(service, request, on_concept))
         
-        # Store graph in GraphService for later retrieval
-        graph_service.create_graph(graph_id, nodes, edges)
+        def finished(task: asyncio.Future) -> None:
+            # Mark a failure as retrieved even if the client already left;
+            # result() below still raises it
+            if not task.cancelled():
+                task.exception()
+            # Queued after every concept the worker thread already sent
+            queue.put_nowait(None)
         
-        # Build response
-        return {
-            "graph_id": graph_id,
-            "nodes": nodes,
-            "edges": edges,
-            "metadata": {
-                **result['metadata'],
-                "graph_id": graph_id,
-                "node_count": len(nodes),
-                "edge_count": len(edges)
+        pipeline.add_done_callback(finished)
+        
+        while (concept := await queue.get()) is not None:
+            yield _sse("concept", concept)
+        
+        try:
+            response = _store_result_graph(pipeline.result())
+        except ValueError as e:
+            yield _sse("error", {
+                "error": {"code": "INVALID_INPUT", "message": str(e), "retry": False}
+            })
+            return
+        except Exception as e:
+            logger.warning("Text processing stream failed: %s", e)
+            yield _sse("error", {
+                "error": {
+                    "code": "PROCESSING_FAILED",
+                    "message": f"Failed to process text: {str(e)}",
+                    "retry": True
+                }
+            })
+            return
+        
+        if PRECOMPUTE_SUMMARIES:
+            background_tasks.add_task(_precompute_summary, response['graph_id'])
+        yield _sse("done", response)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=background_tasks
+    )
+
+
+@app.post(
+    "/api/py/text/process_batch",
+    response_model=List[TextProcessResponse],
+    tags=["Text Processing"],
+    summary="Process several texts and extract one knowledge graph per text",
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid input"},
+        500: {"model": ErrorResponse, "description": "Processing failed"}
+    }
+)
+async def process_text_batch(requests: List[TextProcessRequest], background_tasks: BackgroundTasks):
+    """
+    Process a list of texts in one call, one stored graph per text.
+    
+    All texts share one service instance (tokenizer, HTTP pool, rate
+    limiter) and run concurrently on worker threads, so N graphs cost one
+    round trip instead of N. Each item accepts the same fields as
+    /api/py/text/process. The call fails as a whole if any text fails.
+    
+    **Returns:**
+    - List of /api/py/text/process responses, in request order
+    """
+    if not requests or len(requests) > MAX_BATCH_TEXTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": {
+                    "code": "INVALID_INPUT",
+                    "message": f"Batch must contain 1-{MAX_BATCH_TEXTS} texts, got {len(requests)}",
+                    "retry": False
+                }
             }
-        }
+        )
+    
+    try:
+        service = get_text_processing_service()
+        results = await asyncio.gather(
+            *(_run_pipeline(service, request) for request in requests)
+        )
+        responses = [_store_result_graph(result) for result in results]
+        if PRECOMPUTE_SUMMARIES:
+            for response in responses:
+                background_tasks.add_task(_precompute_summary, response['graph_id'])
+        return responses
         
     except ValueError as e:
         # Input validation errors
@@ -454,7 +750,7 @@ async def process_text(request: TextProcessRequest):
             detail={
                 "error": {
                     "code": "PROCESSING_FAILED",
-                    "message": f"Failed to process text: {str(e)}",
+                    "message": f"Failed to process texts: {str(e)}",
                     "retry": True
                 }
             }
@@ -863,12 +1159,15 @@ async def explain_relationship(request: ExplainRelationshipRequest):
         )
         relationship_type = edge.get('relationship_type') if edge else None
         
-        # Generate explanation using LLM service
-        explanation = llm_service.explain_relationship(
+        # Generate explanation using LLM service (blocking SDK call, so it
+        # runs in a worker thread and other requests keep being served)
+        explanation = await asyncio.to_thread(
+            llm_service.explain_relationship,
             source_node=source_node,
             target_node=target_node,
             path=path_nodes,
-            relationship_type=relationship_type
+            relationship_type=relationship_type,
+            graph_id=request.graph_id
         )
         
         return {
@@ -876,7 +1175,7 @@ async def explain_relationship(request: ExplainRelationshipRequest):
             "source_node": source_node,
             "target_node": target_node,
             "path": path_nodes,
-            "model": llm_service.model
+            "model": llm_service.model_config["explain"]
         }
         
     except HTTPException:
@@ -897,6 +1196,37 @@ async def explain_relationship(request: ExplainRelationshipRequest):
         )
 
 
+def _qa_context(request: QARequest) -> dict:
+    """
+    Build the graph context for a Q&A request.
+    
+    Raises:
+        HTTPException: 404 if the graph does not exist
+    """
+    # Check if graph exists
+    G = graph_service.get_graph(request.graph_id)
+    if not G:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": {
+                    "code": "GRAPH_NOT_FOUND",
+                    "message": f"Graph '{request.graph_id}' not found",
+                    "retry": False
+                }
+            }
+        )
+    
+    # Top-K nodes around the focus node (within context_hops), or the
+    # graph's most important nodes when there is no focus
+    return llm_service.select_context(
+        graph_service,
+        request.graph_id,
+        node_id=request.node_id,
+        hops=request.context_hops
+    )
+
+
 @app.post(
     "/api/py/llm/qa",
     response_model=QAResponse,
@@ -938,45 +1268,19 @@ async def answer_question(request: QARequest):
     Citations: [Python, Web Development, Data Science]
     """
     try:
-        # Check if graph exists
-        G = graph_service.get_graph(request.graph_id)
-        if not G:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": {
-                        "code": "GRAPH_NOT_FOUND",
-                        "message": f"Graph '{request.graph_id}' not found",
-                        "retry": False
-                    }
-                }
-            )
-        
-        # Build graph context
-        if request.node_id:
-            # Focus context around specific node
-            graph_context = llm_service.get_node_context(
-                graph_service,
-                request.graph_id,
-                request.node_id,
-                max_hops=request.context_hops
-            )
-        else:
-            # Use entire graph as context
-            nodes = graph_service.get_all_nodes(request.graph_id)
-            edges = graph_service.get_all_edges(request.graph_id)
-            graph_context = {
-                "nodes": nodes,
-                "edges": edges,
-                "paths": []
-            }
+        graph_context = _qa_context(request)
         
         # Answer the question using LLM service
-        result = llm_service.answer_question(
-            question=request.question,
-            graph_context=graph_context,
-            conversation_history=request.conversation_history
-        )
+        qa_args = {
+            "question": request.question,
+            "graph_context": graph_context,
+            "conversation_history": request.conversation_history
+        }
+        if qa_batcher is not None:
+            result = await qa_batcher.submit(qa_args)
+        else:
+            # Blocking SDK call: run it in a worker thread, not on the event loop
+            result = await asyncio.to_thread(llm_service.answer_question, **qa_args)
         
         return {
             "question": request.question,
@@ -1003,4 +1307,161 @@ async def answer_question(request: QARequest):
                     "retry": True
                 }
             }
-        )
\ No newline at end of file
+        )
+
+
+def _sse(event: str, payload: dict) -> bytes:
+    """Encode one server-sent event with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(payload) + b"\n\n"
+
+
+@app.post(
+    "/api/py/llm/qa/stream",
+    tags=["LLM Operations"],
+    summary="Stream an answer about the knowledge graph (server-sent events)",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Answer as server-sent events"},
+        404: {"model": ErrorResponse, "description": "Graph not found"}
+    }
+)
+async def answer_question_stream(request: QARequest):
+    """
+    Answer a question like /api/py/llm/qa, streaming the answer as it is generated.
+    
+    Takes the same request body. The response is a text/event-stream of:
+    - **delta** events: `{"text": "..."}` with the next piece of the answer
+    - one final **done** event: the /api/py/llm/qa response fields
+      (answer, confidence, sources, citations, context_nodes, model)
+    - an **error** event instead of **done** if generation fails midway
+    
+    Disconnecting stops generation upstream, so an abandoned answer does not
+    keep consuming tokens.
+    """
+    try:
+        graph_context = _qa_context(request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": {
+                    "code": "QA_FAILED",
+                    "message": f"Failed to answer question: {str(e)}",
+                    "retry": True
+                }
+            }
+        )
+    
+    async def events():
+        try:
+            async for event, payload in llm_service.answer_question_stream(
+                request.question, graph_context, request.conversation_history
+            ):
+                if event == "delta":
+                    yield _sse("delta", {"text": payload})
+                else:
+                    yield _sse("done", {
+                        "question": request.question,
+                        **payload,
+                        "context_nodes": len(graph_context.get('nodes', []))
+                    })
+        except Exception as e:
+            logger.warning("Q&A stream failed: %s", e)
+            yield _sse("error", {
+                "error": {
+                    "code": "QA_FAILED",
+                    "message": f"Failed to answer question: {str(e)}",
+                    "retry": True
+                }
+            })
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get(
+    "/api/py/graph/{graph_id}/summary",
+    response_model=GraphSummaryResponse,
+    tags=["LLM Operations"],
+    summary="Get a natural language summary of the graph",
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"model": ErrorResponse, "description": "Graph not found"},
+        500: {"model": ErrorResponse, "description": "Summary generation failed"}
+    }
+)
+async def get_graph_summary(graph_id: str):
+    """
+    Get a summary of the whole graph.
+    
+    Returns the stored summary when one exists (precomputed after graph
+    creation when GRAPH_SUMMARY_PRECOMPUTE=1, or saved by an earlier call);
+    otherwise generates it now and stores it for later requests.
+    
+    **Returns:**
+    - **summary**: 2-3 paragraph overview of the graph
+    - **model**: LLM model used
+    - **precomputed**: True if no LLM call was needed
+    """
+    if not graph_service.graph_exists(graph_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": {
+                    "code": "GRAPH_NOT_FOUND",
+                    "message": f"Graph '{graph_id}' not found",
+                    "retry": False
+                }
+            }
+        )
+    
+    stored = graph_service.get_graph_summary(graph_id)
+    if stored:
+        return {
+            "graph_id": graph_id,
+            "summary": stored['summary'],
+            "model": stored['model'],
+            "precomputed": True
+        }
+    
+    try:
+        summary = await asyncio.to_thread(
+            llm_service.generate_summary_and_store, graph_service, graph_id
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": {
+                    "code": "SUMMARY_FAILED",
+                    "message": f"Failed to generate summary: {str(e)}",
+                    "retry": True
+                }
+            }
+        )
+    
+    if summary is None:
+        # Deleted while the summary was being generated
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": {
+                    "code": "GRAPH_NOT_FOUND",
+                    "message": f"Graph '{graph_id}' not found",
+                    "retry": False
+                }
+            }
+        )
+    
+    return {
+        "graph_id": graph_id,
+        "summary": summary,
+        "model": llm_service.model_config["summary"],
+        "precomputed": False
+    }
@@ -10,9 +10,12 @@ All models use Pydantic for validation and serialization.
 """
 
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer, field_validator
 from datetime import datetime
 
+import numpy as np
+import orjson
+
 
 class Node(BaseModel):
     """
@@ -46,9 +49,10 @@ class Node(BaseModel):
         description="Original text excerpt this concept was extracted from"
     )
     
-    embedding: Optional[List[float]] = Field(
+    embedding: Optional[Any] = Field(
         default=None,
-        description="Vector embedding for semantic similarity (1536 dimensions for OpenAI)"
+        description="Vector embedding for semantic similarity (1536 dimensions for OpenAI), "
+                    "stored as a float32 NumPy array"
     )
     
     confidence: float = Field(
@@ -73,6 +77,41 @@ class Node(BaseModel):
         description="Timestamp when this node was created"
     )
     
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def _embedding_to_float32(cls, v: Any) -> Optional[np.ndarray]:
+        """Store embeddings as one contiguous float32 buffer instead of boxed floats."""
+        if v is None:
+            return None
+        arr = np.asarray(v, dtype=np.float32)
+        if arr.ndim != 1:
+            raise ValueError(f"embedding must be a 1-D vector, got shape {arr.shape}")
+        return arr
+    
+    @field_serializer("embedding")
+    def _serialize_embedding(self, v: Optional[np.ndarray]) -> Optional[List[float]]:
+        """
+        Dump embeddings as plain lists of float32 values.
+        
+        Goes through orjson (as Graph.to_json_bytes() does) rather than
+        tolist(), which would widen each value to its float64 expansion
+        (0.1 -> 0.10000000149011612); both JSON paths then emit 0.1.
+        """
+        if v is None:
+            return None
+        return orjson.loads(orjson.dumps(v, option=orjson.OPT_SERIALIZE_NUMPY))
+    
+    def __eq__(self, other: Any) -> bool:
+        """Field-wise equality, comparing embeddings by value (ndarray == is elementwise)."""
+        if not isinstance(other, Node):
+            return NotImplemented
+        a, b = self.embedding, other.embedding
+        if (a is None) != (b is None) or (a is not None and not np.array_equal(a, b)):
+            return False
+        mine = {k: v for k, v in self.__dict__.items() if k != "embedding"}
+        theirs = {k: v for k, v in other.__dict__.items() if k != "embedding"}
+        return type(self) is type(other) and mine == theirs
+    
     class Config:
         # Allow the model to be used with arbitrary types
         json_schema_extra = {
@@ -251,4 +290,34 @@ class Graph(BaseModel):
             edge for edge in self.edges 
             if edge.source == node_id or edge.target == node_id
         ]
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the graph to JSON with orjson, one node/edge at a time.
+        
+        Each model's field dict is encoded straight into a growing bytearray,
+        so large graphs are written without first building the full
+        model_dump() tree of dicts and lists.
+        
+        Returns:
+            UTF-8 JSON with the same fields as model_dump_json()
+        """
+        option = orjson.OPT_SERIALIZE_NUMPY  # float32 node embeddings
+        buf = bytearray(b'{"graph_id":')
+        buf += orjson.dumps(self.graph_id)
+        for key, items in ((b"nodes", self.nodes), (b"edges", self.edges)):
+            buf += b',"' + key + b'":['
+            for i, item in enumerate(items):
+                if i:
+                    buf += b","
+                buf += orjson.dumps(item.__dict__, option=option)
+            buf += b"]"
+        buf += b',"metadata":'
+        buf += orjson.dumps(self.metadata, option=option)
+        buf += b',"created_at":'
+        buf += orjson.dumps(self.created_at)
+        buf += b',"updated_at":'
+        buf += orjson.dumps(self.updated_at)
+        buf += b"}"
+        return bytes(buf)
 
@@ -0,0 +1,74 @@
+"""
+msgspec mirrors of the graph data models.
+
+Node, Edge and Graph here carry the same fields, defaults and range checks
+as the Pydantic models in graph_models.py, but are msgspec Structs decoded
+by msgspec's C JSON decoder. They exist so test_models_ms.py can run the
+model checks against both implementations and compare bulk decode speed;
+the application itself still uses the Pydantic models.
+
+msgspec is a development dependency (requirements-dev.txt), so this module
+is not re-exported from api.models.
+"""
+
+from datetime import datetime
+from typing import Annotated, Any, Dict, List, Optional
+
+import msgspec
+
+# Scores constrained to 0-1, like Field(ge=0.0, le=1.0) on the Pydantic models
+Score = Annotated[float, msgspec.Meta(ge=0.0, le=1.0)]
+NonNegative = Annotated[float, msgspec.Meta(ge=0.0)]
+
+
+class Node(msgspec.Struct, kw_only=True):
+    """A concept node in the knowledge graph (see graph_models.Node)."""
+
+    id: str
+    label: str
+    description: str
+    source_text: str
+    embedding: Optional[List[float]] = None
+    confidence: Score = 1.0
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+    has_children: bool = False
+    created_at: Optional[datetime] = msgspec.field(default_factory=datetime.now)
+
+
+class Edge(msgspec.Struct, kw_only=True):
+    """A relationship between two nodes (see graph_models.Edge)."""
+
+    id: str
+    source: str
+    target: str
+    relationship_type: str
+    weight: NonNegative = 1.0
+    confidence: Score = 1.0
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+    created_at: Optional[datetime] = msgspec.field(default_factory=datetime.now)
+
+
+class Graph(msgspec.Struct, kw_only=True):
+    """The complete knowledge graph (see graph_models.Graph)."""
+
+    graph_id: str
+    nodes: List[Node] = msgspec.field(default_factory=list)
+    edges: List[Edge] = msgspec.field(default_factory=list)
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+    created_at: Optional[datetime] = msgspec.field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = msgspec.field(default_factory=datetime.now)
+
+    @property
+    def node_count(self) -> int:
+        """Returns the number of nodes in the graph."""
+        return len(self.nodes)
+
+    @property
+    def edge_count(self) -> int:
+        """Returns the number of edges in the graph."""
+        return len(self.edges)
+
+
+# Reusable decoders (building one per call would redo the type analysis)
+node_list_decoder = msgspec.json.Decoder(List[Node])
+graph_decoder = msgspec.json.Decoder(Graph)
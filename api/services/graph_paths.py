@@ -0,0 +1,47 @@
+"""
+Memoized path queries over stored graphs.
+
+A stored graph only changes through GraphService, which bumps its version
+on every mutation (touch_graph), so a path computed for (graph, version,
+source, target) stays valid and repeat lookups for hot node pairs skip the
+traversal. Entries are keyed by the graph object itself, not its ID, so
+graphs from different GraphService instances never collide.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import networkx as nx
+
+# Most (graph, source, target) results kept before least recently used are evicted
+PATH_CACHE_SIZE = 10_000
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def shortest_path(
+    G: nx.Graph,
+    version: int,
+    source: str,
+    target: str
+) -> Optional[Tuple[str, ...]]:
+    """
+    Find the shortest path between two nodes, memoized per graph version.
+
+    Args:
+        G: Stored NetworkX graph (both nodes must be in it)
+        version: Graph version from GraphService.get_graph_version()
+        source: Source node ID
+        target: Target node ID
+
+    Returns:
+        Tuple of node IDs in the path, or None if no path exists
+    """
+    try:
+        return tuple(nx.shortest_path(G, source, target))
+    except nx.NetworkXNoPath:
+        return None
+
+
+def clear_path_cache() -> None:
+    """Drop all memoized paths (and the references they hold to graphs)."""
+    shortest_path.cache_clear()
@@ -11,7 +11,7 @@ Graphs are stored in-memory for fast access.
 """
 
 import networkx as nx
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple
 from datetime import datetime
 import sys
 from pathlib import Path
@@ -19,6 +19,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from api.services.graph_paths import clear_path_cache, shortest_path
+
 
 class GraphService:
     """
@@ -90,6 +92,68 @@ class GraphService:
             G.add_edge(source, target, **attributes)
         
         # Store graph with metadata
+        self._store_graph(graph_id, G, directed)
+        
+        return G
+    
+    def create_graph_columnar(
+        self,
+        graph_id: str,
+        node_ids: Sequence[str],
+        node_labels: Sequence[str],
+        sources: Sequence[str],
+        targets: Sequence[str],
+        directed: bool = True
+    ) -> nx.Graph:
+        """
+        Create a graph from column arrays instead of per-node/edge dicts.
+        
+        Nodes are given as parallel id/label columns and edges as parallel
+        source/target columns (lists or NumPy string arrays), which avoids
+        building one dict per node and edge for large graphs. Only the
+        'label' node attribute is set; use create_graph() for richer data.
+        
+        Args:
+            graph_id: Unique identifier for the graph
+            node_ids: Node IDs
+            node_labels: Node labels, parallel to node_ids
+            sources: Edge source node IDs
+            targets: Edge target node IDs, parallel to sources
+            directed: Whether to create a directed graph (default: True)
+            
+        Returns:
+            NetworkX graph object
+            
+        Raises:
+            ValueError: If graph_id already exists or if the columns are invalid
+        """
+        if graph_id in self._graphs:
+            raise ValueError(f"Graph with ID '{graph_id}' already exists")
+        if len(node_ids) != len(node_labels):
+            raise ValueError("node_ids and node_labels must have the same length")
+        if len(sources) != len(targets):
+            raise ValueError("sources and targets must have the same length")
+        
+        G = nx.DiGraph() if directed else nx.Graph()
+        G.add_nodes_from(zip(node_ids, ({'label': label} for label in node_labels)))
+        if G.number_of_nodes() != len(node_ids):
+            raise ValueError("node_ids must be unique")
+        
+        # add_edges_from() would silently create missing endpoints
+        missing = (set(sources) | set(targets)) - set(G)
+        if missing:
+            raise ValueError(f"Edge endpoints not found in graph: {sorted(missing)[:5]}")
+        G.add_edges_from(zip(sources, targets))
+        
+        self._store_graph(graph_id, G, directed)
+        
+        return G
+    
+    def _store_graph(self, graph_id: str, G: nx.Graph, directed: bool) -> None:
+        """Store a built graph together with its metadata."""
+        if graph_id in self._graphs:
+            # Release the replaced graph from memoized paths, as delete_graph() does
+            clear_path_cache()
         self._graphs[graph_id] = {
             'graph': G,
             'metadata': {
@@ -97,11 +161,12 @@ class GraphService:
                 'node_count': G.number_of_nodes(),
                 'edge_count': G.number_of_edges(),
                 'directed': directed,
-                'created_at': datetime.now().isoformat()
-            }
+                'created_at': datetime.now().isoformat(),
+                'version': 1
+            },
+            # Derived data (e.g. LLM summary), valid for metadata['version']
+            'summary': None
         }
-        
-        return G
     
     def get_graph(self, graph_id: str) -> Optional[nx.Graph]:
         """
@@ -129,6 +194,73 @@ class GraphService:
         graph_data = self._graphs.get(graph_id)
         return graph_data['metadata'] if graph_data else None
     
+    def get_graph_version(self, graph_id: str) -> Optional[int]:
+        """
+        Get the graph's version, for use in cache keys of derived data.
+        
+        Args:
+            graph_id: Unique identifier for the graph
+            
+        Returns:
+            Version number or None if not found
+        """
+        graph_data = self._graphs.get(graph_id)
+        return graph_data['metadata']['version'] if graph_data else None
+    
+    def touch_graph(self, graph_id: str) -> None:
+        """
+        Mark a graph as modified: bump its version and drop derived data.
+        
+        Anything that mutates a stored graph must call this so cached
+        summaries and prompts built from the old version are not reused.
+        
+        Args:
+            graph_id: Unique identifier for the graph
+        """
+        graph_data = self._graphs.get(graph_id)
+        if graph_data:
+            graph_data['metadata']['version'] += 1
+            graph_data['summary'] = None
+    
+    def set_graph_summary(
+        self,
+        graph_id: str,
+        summary: str,
+        model: str,
+        version: int
+    ) -> bool:
+        """
+        Store a generated summary for a graph.
+        
+        Args:
+            graph_id: Unique identifier for the graph
+            summary: Summary text
+            model: Model that generated it
+            version: Graph version the summary was built from
+            
+        Returns:
+            True if stored, False if the graph is gone or has changed since
+        """
+        graph_data = self._graphs.get(graph_id)
+        if not graph_data or graph_data['metadata']['version'] != version:
+            return False
+        graph_data['summary'] = {'summary': summary, 'model': model, 'version': version}
+        return True
+    
+    def get_graph_summary(self, graph_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored summary for a graph.
+        
+        Args:
+            graph_id: Unique identifier for the graph
+            
+        Returns:
+            Dictionary with 'summary', 'model' and 'version', or None if
+            the graph is missing or no summary has been stored
+        """
+        graph_data = self._graphs.get(graph_id)
+        return graph_data['summary'] if graph_data else None
+    
     def graph_exists(self, graph_id: str) -> bool:
         """
         Check if a graph exists.
@@ -153,6 +285,8 @@ class GraphService:
         """
         if graph_id in self._graphs:
             del self._graphs[graph_id]
+            # Release the deleted graph from memoized paths
+            clear_path_cache()
             return True
         return False
     
@@ -503,11 +637,9 @@ class GraphService:
         if not G or source not in G or target not in G:
             return None
         
-        try:
-            path = nx.shortest_path(G, source, target)
-            return path
-        except nx.NetworkXNoPath:
-            return None
+        # Memoized per graph version (see graph_paths)
+        path = shortest_path(G, self.get_graph_version(graph_id), source, target)
+        return list(path) if path is not None else None
     
     def get_all_paths(
         self,
@@ -538,6 +670,31 @@ class GraphService:
         except nx.NetworkXNoPath:
             return []
     
+    def count_paths(
+        self,
+        graph_id: str,
+        source: str,
+        target: str,
+        max_length: int = 5
+    ) -> int:
+        """
+        Count simple paths between two nodes without materializing them.
+        
+        Args:
+            graph_id: Unique identifier for the graph
+            source: Source node ID
+            target: Target node ID
+            max_length: Maximum path length
+            
+        Returns:
+            Number of simple paths (0 if the graph or either node is missing)
+        """
+        G = self.get_graph(graph_id)
+        if not G or source not in G or target not in G:
+            return 0
+        
+        return sum(1 for _ in nx.all_simple_paths(G, source, target, cutoff=max_length))
+    
     def get_nodes_within_distance(
         self,
         graph_id: str,
@@ -0,0 +1,154 @@
+"""
+Dynamic batching for concurrent LLM requests.
+
+Requests that arrive within a short window are collected and handed to a
+batch handler together, so a burst of N requests becomes one upstream call
+instead of N. Each caller still awaits only its own result. Batches are
+dispatched as independent tasks, so a new batch does not wait for the
+previous one's upstream call to finish.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+class DynamicBatcher:
+    """Queue-backed batcher: one worker task collects batches, each dispatched as its own task."""
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        max_batch_size: int = 8,
+        max_delay: float = 0.1
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            handler: Coroutine taking a list of items and returning one result
+                per item, in order
+            max_batch_size: Most items handed to the handler at once
+            max_delay: Seconds to wait for more items after the first arrives
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background worker is active."""
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start the worker on the running event loop (call from app startup)."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the worker and in-flight batches, and fail every request not yet answered."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        # Cancelled dispatches fail their own callers (see _dispatch)
+        inflight = list(self._inflight)
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+        self._inflight.clear()
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue one item and wait for its result.
+
+        Args:
+            item: Payload passed to the handler as part of a batch
+
+        Returns:
+            The handler's result for this item
+
+        Raises:
+            RuntimeError: If the batcher has not been started
+            Exception: Whatever the handler raised for this batch
+        """
+        if not self.running:
+            raise RuntimeError("Batcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and dispatch them forever."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[Any, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+
+            try:
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Stopped mid-collection: these callers are off the queue already
+                self._fail(batch, RuntimeError("Batcher stopped"))
+                raise
+
+            # Callers that gave up (e.g. client disconnected) are dropped
+            batch = [(item, future) for item, future in batch if not future.cancelled()]
+            if batch:
+                # Run concurrently with later batches instead of blocking collection
+                task = asyncio.create_task(self._dispatch(batch))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run the handler for one batch and resolve every caller's future."""
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch handler returned {len(results)} results for {len(batch)} items"
+                )
+        except asyncio.CancelledError:
+            self._fail(batch, RuntimeError("Batcher stopped"))
+            raise
+        except Exception as e:
+            logger.exception("Batch of %d failed", len(batch))
+            self._fail(batch, e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[Any, asyncio.Future]], error: BaseException) -> None:
+        """Resolve every still-pending caller in batch with error."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
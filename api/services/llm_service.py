@@ -7,22 +7,88 @@ This service uses GPT-4 to:
 3. Provide context-aware responses using graph structure
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
-from typing import Dict, List, Any, Optional
-from openai import OpenAI
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import orjson
+from openai import AsyncOpenAI, OpenAI
 from pathlib import Path
 from dotenv import load_dotenv
 
+from api.services.openai_batch import submit_batch, wait_for_batch
+from api.services.openai_client import get_async_openai_client, get_openai_client
+from api.services.rate_limit import alimited_create, limited_create
+from api.services.redis_cache import get_response_cache, request_key
+
+logger = logging.getLogger(__name__)
+
+# Cache key for an explanation: (graph_id, source_id, target_id, relationship_type, path node IDs)
+ExplanationKey = Tuple[str, str, str, Optional[str], Tuple[str, ...]]
+
 
 class LLMService:
     """Service for LLM-powered explanations and Q&A."""
     
-    def __init__(self, model: Optional[str] = None):
+    # Tasks that can each be routed to their own model
+    MODEL_TASKS = ("explain", "qa", "summary")
+    
+    # Explanations kept per service (least recently used are evicted first)
+    EXPLANATION_CACHE_SIZE = 1024
+    
+    # Most nodes kept in a Q&A context, and selected contexts memoized per service
+    CONTEXT_TOP_K = 50
+    SELECTED_CONTEXT_CACHE_SIZE = 256
+    
+    # Shared (Redis) cache lifetimes in seconds: explanations of an unchanged
+    # edge stay valid, answers and summaries should refresh sooner
+    EXPLANATION_TTL = 7 * 24 * 3600
+    QA_TTL = 3600
+    SUMMARY_TTL = 900
+    
+    # Max concurrent OpenAI calls when fanning out async explanations
+    ASYNC_CONCURRENCY = 8
+    
+    # System prompt for single and batched Q&A
+    QA_SYSTEM_PROMPT = (
+        "You are a helpful assistant that answers questions based on a knowledge graph. "
+        "Use the provided graph data to give accurate, well-sourced answers. "
+        "If the graph doesn't contain enough information, say so clearly. "
+        "Always cite specific concepts when answering."
+    )
+    
+    # Closing instruction appended after the question
+    QA_INSTRUCTIONS = (
+        "Based on this knowledge graph, please answer the question. "
+        "Reference specific concepts and relationships in your answer. "
+        "If the graph doesn't contain enough information to answer fully, say so."
+    )
+    
+    # System prompt shared by the sync and async explanation paths
+    EXPLANATION_SYSTEM_PROMPT = (
+        "You are an expert at explaining complex relationships between concepts. "
+        "Provide clear, concise explanations that help users understand how "
+        "different ideas are connected."
+    )
+    
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        model_config: Optional[Dict[str, str]] = None
+    ):
         """
         Initialize the LLM service.
         
         Args:
             model: OpenAI model to use (default: from env or gpt-4o-mini)
+            model_config: Optional per-task models keyed by "explain", "qa"
+                and "summary"; tasks not listed use LLM_MODEL_<TASK> from env,
+                then the base model
         """
         # Load environment variables
         project_root = Path(__file__).parent.parent.parent
@@ -34,15 +100,49 @@ class LLMService:
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
         
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
         self.model = model or os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+        
+        # Per-task model routing, so short tasks can use a cheaper tier
+        model_config = model_config or {}
+        self.model_config = {
+            task: model_config.get(task) or os.getenv(f"LLM_MODEL_{task.upper()}") or self.model
+            for task in self.MODEL_TASKS
+        }
+        
+        # Graphs are immutable once stored, so an explanation for the same
+        # edge and path never changes; keep them to skip repeat OpenAI calls
+        self._explanation_cache: "OrderedDict[ExplanationKey, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Replies shared across workers and restarts (no-op without REDIS_URL)
+        self.response_cache = get_response_cache()
+        
+        # Identical chat requests currently being sent, so concurrent
+        # duplicates wait for the first one instead of paying twice
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Trimmed Q&A contexts by (graph_id, graph version, node_id, hops, k)
+        self._selected_context_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+    
+    @property
+    def client(self) -> OpenAI:
+        """OpenAI client bound to the shared HTTP/2 connection pool."""
+        return get_openai_client(self.api_key)
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Shared AsyncOpenAI client for the *_async methods (pooled per event loop)."""
+        return get_async_openai_client(self.api_key)
     
     def explain_relationship(
         self,
         source_node: Dict[str, Any],
         target_node: Dict[str, Any],
         path: List[Dict[str, Any]],
-        relationship_type: Optional[str] = None
+        relationship_type: Optional[str] = None,
+        graph_id: Optional[str] = None
     ) -> str:
         """
         Generate a natural language explanation of the relationship between two nodes.
@@ -55,10 +155,21 @@ class LLMService:
             target_node: Target node data (must include 'label' and optionally 'description')
             path: List of nodes in the path from source to target
             relationship_type: Optional explicit relationship type
+            graph_id: Graph the nodes belong to; when given, the explanation is
+                cached per (graph, source, target, type, path) and reused
             
         Returns:
             Natural language explanation string
         """
+        key = None
+        if graph_id is not None:
+            key = self._explanation_key(
+                graph_id, source_node, target_node, path, relationship_type
+            )
+            cached = self._get_cached_explanation(key)
+            if cached is not None:
+                return cached
+        
         # Build the prompt with graph context
         prompt = self._build_relationship_prompt(
             source_node, target_node, path, relationship_type
@@ -66,27 +177,227 @@ class LLMService:
         
         try:
             # Call GPT-4 for explanation
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert at explaining complex relationships between concepts. Provide clear, concise explanations that help users understand how different ideas are connected."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=4000  # Increased to max for detailed explanations
+            explanation = self._complete_text(
+                self._explanation_request(prompt), self.EXPLANATION_TTL
             )
             
+        except Exception as e:
+            raise Exception(f"Failed to generate explanation: {str(e)}")
+        
+        if key is not None:
+            self._cache_explanation(key, explanation)
+        return explanation
+    
+    async def explain_relationship_async(
+        self,
+        source_node: Dict[str, Any],
+        target_node: Dict[str, Any],
+        path: List[Dict[str, Any]],
+        relationship_type: Optional[str] = None,
+        graph_id: Optional[str] = None
+    ) -> str:
+        """
+        Async variant of explain_relationship() using the AsyncOpenAI client.
+        
+        Shares the prompt and the explanation cache with the sync method.
+        
+        Args:
+            source_node: Source node data
+            target_node: Target node data
+            path: List of nodes in the path from source to target
+            relationship_type: Optional explicit relationship type
+            graph_id: Graph the nodes belong to (enables caching)
+            
+        Returns:
+            Natural language explanation string
+        """
+        key = None
+        if graph_id is not None:
+            key = self._explanation_key(
+                graph_id, source_node, target_node, path, relationship_type
+            )
+            cached = self._get_cached_explanation(key)
+            if cached is not None:
+                return cached
+        
+        prompt = self._build_relationship_prompt(
+            source_node, target_node, path, relationship_type
+        )
+        
+        try:
+            response = await alimited_create(
+                self.async_client.chat.completions,
+                **self._explanation_request(prompt)
+            )
             explanation = response.choices[0].message.content.strip()
-            return explanation
             
         except Exception as e:
             raise Exception(f"Failed to generate explanation: {str(e)}")
+        
+        if key is not None:
+            self._cache_explanation(key, explanation)
+        return explanation
+    
+    async def explain_relationships_async(
+        self,
+        source_node: Dict[str, Any],
+        target_nodes: List[Dict[str, Any]],
+        relationship_type: Optional[str] = None,
+        graph_id: Optional[str] = None
+    ) -> List[str]:
+        """
+        Explain how one node relates to each of several neighbors, concurrently.
+        
+        Each explanation uses the direct path [source, target]. At most
+        ASYNC_CONCURRENCY calls are in flight at once, so wall time is about
+        one round trip per ASYNC_CONCURRENCY targets instead of one per target.
+        
+        Args:
+            source_node: Hub node data
+            target_nodes: Neighbor nodes to explain
+            relationship_type: Optional relationship type shared by all edges
+            graph_id: Graph the nodes belong to (enables caching)
+            
+        Returns:
+            Explanations in the same order as target_nodes
+        """
+        semaphore = asyncio.Semaphore(self.ASYNC_CONCURRENCY)
+        
+        async def explain(target: Dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.explain_relationship_async(
+                    source_node,
+                    target,
+                    [source_node, target],
+                    relationship_type=relationship_type,
+                    graph_id=graph_id
+                )
+        
+        return await asyncio.gather(*(explain(target) for target in target_nodes))
+    
+    def _complete(self, body: Dict[str, Any]) -> Any:
+        """
+        Send a chat completion, sharing it with identical concurrent requests.
+        
+        Singleflight: while a request with the same body is in flight, other
+        callers wait for its response instead of issuing their own call.
+        Nothing is kept once it completes (caching is done by the callers).
+        
+        Args:
+            body: chat.completions.create arguments
+            
+        Returns:
+            ChatCompletion response
+        """
+        key = hashlib.sha1(
+            json.dumps(body, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            response = limited_create(self.client.chat.completions, **body)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _complete_text(self, body: Dict[str, Any], ttl: int) -> str:
+        """
+        Get the reply text for a chat request, via the shared response cache.
+        
+        Args:
+            body: chat.completions.create arguments
+            ttl: Seconds to keep a new reply in the shared cache
+            
+        Returns:
+            Stripped reply text
+        """
+        return self.response_cache.get_or_set(
+            request_key(body),
+            lambda: self._complete(body).choices[0].message.content.strip(),
+            ttl
+        )
+    
+    def _explanation_request(self, prompt: str) -> Dict[str, Any]:
+        """Chat completion arguments for a relationship explanation prompt."""
+        return {
+            "model": self.model_config["explain"],
+            "messages": [
+                {"role": "system", "content": self.EXPLANATION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 4000  # Increased to max for detailed explanations
+        }
+    
+    @staticmethod
+    def _explanation_key(
+        graph_id: str,
+        source_node: Dict[str, Any],
+        target_node: Dict[str, Any],
+        path: List[Dict[str, Any]],
+        relationship_type: Optional[str]
+    ) -> ExplanationKey:
+        """Build the explanation cache key from node IDs (labels if IDs are missing)."""
+        def node_key(node: Dict[str, Any]) -> str:
+            return node.get('id') or node.get('label', '')
+        
+        return (
+            graph_id,
+            node_key(source_node),
+            node_key(target_node),
+            relationship_type,
+            tuple(node_key(node) for node in path)
+        )
+    
+    def _get_cached_explanation(self, key: ExplanationKey) -> Optional[str]:
+        """Return a cached explanation and mark it recently used, or None."""
+        with self._cache_lock:
+            explanation = self._explanation_cache.get(key)
+            if explanation is not None:
+                self._explanation_cache.move_to_end(key)
+            return explanation
+    
+    def _cache_explanation(self, key: ExplanationKey, explanation: str) -> None:
+        """Store an explanation, evicting the least recently used beyond the cache size."""
+        with self._cache_lock:
+            self._explanation_cache[key] = explanation
+            self._explanation_cache.move_to_end(key)
+            while len(self._explanation_cache) > self.EXPLANATION_CACHE_SIZE:
+                self._explanation_cache.popitem(last=False)
+    
+    def clear_cache(self, graph_id: Optional[str] = None) -> None:
+        """
+        Drop cached explanations.
+        
+        Call this whenever a graph is modified or deleted.
+        
+        Args:
+            graph_id: Only drop entries for this graph (default: drop everything)
+        """
+        with self._cache_lock:
+            if graph_id is None:
+                self._explanation_cache.clear()
+                self._selected_context_cache.clear()
+                return
+            for key in [k for k in self._explanation_cache if k[0] == graph_id]:
+                del self._explanation_cache[key]
+            for key in [k for k in self._selected_context_cache if k[0] == graph_id]:
+                del self._selected_context_cache[key]
     
     def _build_relationship_prompt(
         self,
@@ -162,64 +473,268 @@ class LLMService:
         Returns:
             Dictionary with 'answer', 'confidence', 'sources', and 'citations'
         """
-        # Build the prompt with graph context
-        prompt = self._build_qa_prompt(question, graph_context)
-        
         try:
-            # Build messages with conversation history
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that answers questions based on a knowledge graph. Use the provided graph data to give accurate, well-sourced answers. If the graph doesn't contain enough information, say so clearly. Always cite specific concepts when answering."
-                }
-            ]
+            # Call GPT-4 for answer
+            answer = self._complete_text(
+                self.qa_batch_request(
+                    question, graph_context, conversation_history, max_tokens
+                ),
+                self.QA_TTL
+            )
+            return self._qa_result(answer, graph_context)
             
-            # Add conversation history if provided
-            if conversation_history:
-                for entry in conversation_history[-5:]:  # Keep last 5 exchanges
-                    if 'question' in entry:
-                        messages.append({
-                            "role": "user",
-                            "content": entry['question']
-                        })
-                    if 'answer' in entry:
-                        messages.append({
-                            "role": "assistant",
-                            "content": entry['answer']
-                        })
+        except Exception as e:
+            raise Exception(f"Failed to answer question: {str(e)}")
+    
+    async def answer_question_stream(
+        self,
+        question: str,
+        graph_context: Dict[str, Any],
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        max_tokens: int = 4000
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Streaming variant of answer_question() using the AsyncOpenAI client.
+        
+        Yields ("delta", text) for each piece of the answer as it arrives,
+        then one ("result", dict) with the same fields answer_question()
+        returns. Closing the generator early (e.g. the HTTP client went
+        away) closes the upstream stream so no more tokens are generated.
+        
+        Args:
+            question: User's question
+            graph_context: Relevant graph data (nodes, edges, paths)
+            conversation_history: Previous Q&A pairs for context
+            max_tokens: Maximum tokens for response
             
-            # Add current question
-            messages.append({
-                "role": "user",
-                "content": prompt
-            })
+        Yields:
+            (event, payload) tuples
+        """
+        try:
+            stream = await alimited_create(
+                self.async_client.chat.completions,
+                **self.qa_batch_request(
+                    question, graph_context, conversation_history, max_tokens
+                ),
+                stream=True
+            )
+        except Exception as e:
+            raise Exception(f"Failed to answer question: {str(e)}")
+        
+        parts: List[str] = []
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield "delta", delta
+        finally:
+            await stream.close()
+        
+        yield "result", self._qa_result("".join(parts).strip(), graph_context)
+    
+    def answer_questions(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Answer several independent questions with a single OpenAI call.
+        
+        Each question is sent as a numbered block with its own graph context
+        (and recent history), and the model returns a JSON array of answers.
+        If the reply cannot be matched back to the questions, each question
+        is answered on its own with answer_question().
+        
+        Args:
+            items: Dicts with 'question', 'graph_context' and optional
+                'conversation_history' (the answer_question() arguments)
             
-            # Call GPT-4 for answer
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
+        Returns:
+            One answer_question()-style result per item, in order
+        """
+        if len(items) == 1:
+            return [self.answer_question(**items[0])]
+        
+        blocks = []
+        for i, item in enumerate(items, 1):
+            block = f"### Question {i}\n"
+            for entry in (item.get('conversation_history') or [])[-5:]:
+                if 'question' in entry:
+                    block += f"Earlier question: {entry['question']}\n"
+                if 'answer' in entry:
+                    block += f"Earlier answer: {entry['answer']}\n"
+            block += self._build_qa_prompt(item['question'], item['graph_context'])
+            blocks.append(block)
+        
+        prompt = (
+            f"Answer each of the {len(items)} independent questions below, using "
+            "only the graph data given with that question.\n\n"
+            + "\n\n".join(blocks)
+            + f'\n\nReply with JSON: {{"answers": [<{len(items)} answer strings, in question order>]}}'
+        )
+        
+        try:
+            response = limited_create(
+                self.client.chat.completions,
+                model=self.model_config["qa"],
+                messages=[
+                    {"role": "system", "content": self.QA_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
                 temperature=0.7,
-                max_tokens=max_tokens
+                max_tokens=min(16000, 2000 * len(items))
             )
+            answers = orjson.loads(response.choices[0].message.content).get('answers')
+        except Exception as e:
+            logger.warning("Batched Q&A call failed, answering individually: %s", e)
+            answers = None
+        
+        if not isinstance(answers, list) or len(answers) != len(items) \
+                or not all(isinstance(a, str) for a in answers):
+            return [self.answer_question(**item) for item in items]
+        
+        return [
+            self._qa_result(answer.strip(), item['graph_context'])
+            for answer, item in zip(answers, items)
+        ]
+    
+    # ------------------------------------------------------------------
+    # OpenAI Batch API (offline / bulk work at half price, minutes latency)
+    # ------------------------------------------------------------------
+    
+    def explanation_batch_request(
+        self,
+        source_node: Dict[str, Any],
+        target_node: Dict[str, Any],
+        path: List[Dict[str, Any]],
+        relationship_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Chat completion body for one relationship explanation.
+        
+        Same request explain_relationship() sends; use it as a job in run_batch().
+        """
+        prompt = self._build_relationship_prompt(
+            source_node, target_node, path, relationship_type
+        )
+        return self._explanation_request(prompt)
+    
+    def qa_batch_request(
+        self,
+        question: str,
+        graph_context: Dict[str, Any],
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        max_tokens: int = 4000
+    ) -> Dict[str, Any]:
+        """
+        Chat completion body for one question.
+        
+        Same request answer_question() sends; use it as a job in run_batch().
+        """
+        messages = self._compose_messages(
+            self._build_context(graph_context), question, conversation_history
+        )
+        
+        return {
+            "model": self.model_config["qa"],
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": max_tokens
+        }
+    
+    def summary_batch_request(
+        self,
+        nodes: List[Dict[str, Any]],
+        edges: List[Dict[str, Any]],
+        max_tokens: int = 2000
+    ) -> Dict[str, Any]:
+        """
+        Chat completion body for one graph summary.
+        
+        Same request generate_summary() sends; use it as a job in run_batch().
+        """
+        return {
+            "model": self.model_config["summary"],
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert at summarizing complex information. Create clear, concise summaries that highlight key concepts and relationships."
+                },
+                {
+                    "role": "user",
+                    "content": self._build_summary_prompt(nodes, edges)
+                }
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens
+        }
+    
+    def run_batch(
+        self,
+        jobs: Dict[str, Dict[str, Any]],
+        poll_interval: float = 15.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, str]:
+        """
+        Run chat completions through the OpenAI Batch API and wait for them.
+        
+        Batch jobs cost half as much and do not count against the per-minute
+        rate limits, but take minutes (up to 24h) to finish. Use this for
+        non-interactive work such as bulk summary regeneration or test runs.
+        
+        Args:
+            jobs: Mapping of custom_id to request body, built with the
+                *_batch_request() helpers
+            poll_interval: Seconds between batch status checks
+            timeout: Give up after this many seconds (None waits for the window)
             
-            answer = response.choices[0].message.content.strip()
-            
-            # Extract mentioned concepts for source tracking
-            sources = self._extract_sources(answer, graph_context)
-            
-            # Build citations from sources
-            citations = self._build_citations(sources, graph_context)
+        Returns:
+            Mapping of custom_id to generated text. Jobs that failed are missing.
             
-            return {
-                "answer": answer,
-                "confidence": "high" if len(sources) > 0 else "medium",
-                "sources": sources,
-                "citations": citations,
-                "model": self.model
-            }
+        Raises:
+            Exception: If the batch cannot be submitted, fails, or times out
+        """
+        batch_id = submit_batch(
+            self.client,
+            [{"custom_id": custom_id, "body": body} for custom_id, body in jobs.items()],
+            endpoint="/v1/chat/completions"
+        )
+        results = wait_for_batch(
+            self.client, batch_id, poll_interval=poll_interval, timeout=timeout
+        )
+        
+        texts = {}
+        for custom_id, body in results.items():
+            try:
+                texts[custom_id] = body["choices"][0]["message"]["content"].strip()
+            except (KeyError, IndexError, TypeError, AttributeError):
+                logger.warning("Batch %s: unreadable result for %s", batch_id, custom_id)
+        return texts
+    
+    def _qa_result(self, answer: str, graph_context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Attach sources and citations to a generated answer.
+        
+        Args:
+            answer: Generated answer text
+            graph_context: Graph context the answer was based on
             
-        except Exception as e:
-            raise Exception(f"Failed to answer question: {str(e)}")
+        Returns:
+            Dictionary with 'answer', 'confidence', 'sources', 'citations' and 'model'
+        """
+        # Extract mentioned concepts for source tracking
+        sources = self._extract_sources(answer, graph_context)
+        
+        # Build citations from sources
+        citations = self._build_citations(sources, graph_context)
+        
+        return {
+            "answer": answer,
+            "confidence": "high" if len(sources) > 0 else "medium",
+            "sources": sources,
+            "citations": citations,
+            "model": self.model_config["qa"]
+        }
     
     def _build_qa_prompt(
         self,
@@ -227,7 +742,7 @@ class LLMService:
         graph_context: Dict[str, Any]
     ) -> str:
         """
-        Build a prompt for Q&A with graph context.
+        Build a single-message prompt for Q&A with graph context.
         
         Args:
             question: User's question
@@ -236,44 +751,96 @@ class LLMService:
         Returns:
             Formatted prompt string
         """
-        prompt = f"Question: {question}\n\n"
-        prompt += "**Available Knowledge Graph Data:**\n\n"
+        return f"Question: {question}\n\n{self._build_context(graph_context)}{self.QA_INSTRUCTIONS}"
+    
+    def _compose_messages(
+        self,
+        context: str,
+        question: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Build Q&A chat messages with the graph context first.
+        
+        The system prompt and context block come before anything that varies
+        per question, so follow-up questions on the same graph share a
+        prompt prefix that OpenAI's automatic prompt caching can reuse.
+        
+        Args:
+            context: Serialized graph context from _build_context()
+            question: User's question
+            conversation_history: Previous Q&A pairs (last 5 are kept)
+            
+        Returns:
+            Messages for chat.completions.create
+        """
+        messages = [
+            {"role": "system", "content": self.QA_SYSTEM_PROMPT},
+            {"role": "user", "content": context}
+        ]
+        
+        # Add conversation history if provided
+        if conversation_history:
+            for entry in conversation_history[-5:]:  # Keep last 5 exchanges
+                if 'question' in entry:
+                    messages.append({"role": "user", "content": entry['question']})
+                if 'answer' in entry:
+                    messages.append({"role": "assistant", "content": entry['answer']})
+        
+        # Add current question
+        messages.append({
+            "role": "user",
+            "content": f"Question: {question}\n\n{self.QA_INSTRUCTIONS}"
+        })
+        return messages
+    
+    def _build_context(self, graph_context: Dict[str, Any]) -> str:
+        """
+        Serialize the graph context block used in Q&A prompts.
+        
+        Args:
+            graph_context: Graph data including nodes and edges
+            
+        Returns:
+            "Available Knowledge Graph Data" block
+        """
+        nodes = (graph_context.get('nodes') or [])[:10]  # Limit to 10 nodes
+        edges = (graph_context.get('edges') or [])[:10]  # Limit to 10 edges
+        paths = (graph_context.get('paths') or [])[:5]
+        
+        context = "**Available Knowledge Graph Data:**\n\n"
         
         # Add nodes
-        if 'nodes' in graph_context and graph_context['nodes']:
-            prompt += "**Concepts:**\n"
-            for node in graph_context['nodes'][:10]:  # Limit to 10 nodes
+        if nodes:
+            context += "**Concepts:**\n"
+            for node in nodes:
                 label = node.get('label', 'Unknown')
                 desc = node.get('description', '')
-                prompt += f"- {label}"
+                context += f"- {label}"
                 if desc:
-                    prompt += f": {desc}"
-                prompt += "\n"
-            prompt += "\n"
+                    context += f": {desc}"
+                context += "\n"
+            context += "\n"
         
         # Add relationships
-        if 'edges' in graph_context and graph_context['edges']:
-            prompt += "**Relationships:**\n"
-            for edge in graph_context['edges'][:10]:  # Limit to 10 edges
+        if edges:
+            context += "**Relationships:**\n"
+            for edge in edges:
                 source = edge.get('source', 'Unknown')
                 target = edge.get('target', 'Unknown')
                 rel_type = edge.get('relationship_type', 'related to')
-                prompt += f"- {source} {rel_type} {target}\n"
-            prompt += "\n"
+                context += f"- {source} {rel_type} {target}\n"
+            context += "\n"
         
         # Add paths if available
-        if 'paths' in graph_context and graph_context['paths']:
-            prompt += "**Connection Paths:**\n"
-            for i, path_info in enumerate(graph_context['paths'][:5], 1):
+        if paths:
+            context += "**Connection Paths:**\n"
+            for i, path_info in enumerate(paths, 1):
                 path = path_info.get('path', [])
-                prompt += f"{i}. {' → '.join(path)}\n"
-            prompt += "\n"
+                context += f"{i}. {' → '.join(path)}\n"
+            context += "\n"
         
-        prompt += "Based on this knowledge graph, please answer the question. "
-        prompt += "Reference specific concepts and relationships in your answer. "
-        prompt += "If the graph doesn't contain enough information to answer fully, say so."
-        
-        return prompt
+        return context
     
     def _extract_sources(
         self,
@@ -292,15 +859,14 @@ class LLMService:
         """
         sources = []
         
-        if 'nodes' not in graph_context:
-            return sources
-        
-        # Check which node labels appear in the answer
-        for node in graph_context['nodes']:
+        # Check which node labels appear in the answer (lowercased once,
+        # not once per node)
+        answer_lower = answer.lower()
+        for node in self._citation_nodes(graph_context):
             label = node.get('label', '')
             node_id = node.get('id', '')
             
-            if label and label.lower() in answer.lower():
+            if label and label.lower() in answer_lower:
                 sources.append(node_id)
         
         return sources
@@ -322,23 +888,30 @@ class LLMService:
         """
         citations = []
         
-        if 'nodes' not in graph_context:
-            return citations
+        # Index nodes by ID once instead of scanning the list per source
+        # (first occurrence wins, as with the scan)
+        nodes_by_id = {}
+        for node in self._citation_nodes(graph_context):
+            nodes_by_id.setdefault(node.get('id'), node)
         
         # Build citations for each source
         for source_id in sources:
-            for node in graph_context['nodes']:
-                if node.get('id') == source_id:
-                    citations.append({
-                        'node_id': source_id,
-                        'label': node.get('label', 'Unknown'),
-                        'description': node.get('description', ''),
-                        'source_text': node.get('source_text', '')
-                    })
-                    break
+            node = nodes_by_id.get(source_id)
+            if node is not None:
+                citations.append({
+                    'node_id': source_id,
+                    'label': node.get('label', 'Unknown'),
+                    'description': node.get('description', ''),
+                    'source_text': node.get('source_text', '')
+                })
         
         return citations
     
+    @staticmethod
+    def _citation_nodes(graph_context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Nodes an answer may cite: citation_nodes if present, else the prompt's nodes."""
+        return graph_context.get('citation_nodes') or graph_context.get('nodes') or []
+    
     def get_node_context(
         self,
         graph_service,
@@ -409,6 +982,97 @@ class LLMService:
             "focus_node": node_id
         }
     
+    def select_context(
+        self,
+        graph_service,
+        graph_id: str,
+        node_id: Optional[str] = None,
+        hops: int = 2,
+        k: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a bounded Q&A context: at most k nodes, most relevant first.
+        
+        With node_id, the focus node's neighborhood (see get_node_context)
+        is kept, nearest nodes first. Without it, the k most important nodes
+        of the whole graph are kept (core tier first, then confidence).
+        Edges and paths are limited to the kept nodes, and embeddings are
+        dropped, since they never go into a prompt.
+        
+        Only the prompt is bounded: every candidate node (the whole
+        neighborhood, or the whole graph) is kept under 'citation_nodes', so
+        answers can cite concepts that were cut from the prompt.
+        
+        Results are memoized per (graph, graph version, node, hops, k), so
+        repeat questions on an unchanged graph skip the traversal.
+        
+        Args:
+            graph_service: GraphService instance
+            graph_id: Graph identifier
+            node_id: Optional focus node
+            hops: Neighborhood radius around node_id
+            k: Most nodes to keep (default: CONTEXT_TOP_K)
+            
+        Returns:
+            Dictionary with nodes, edges, paths and citation_nodes (and
+            focus_node with node_id)
+        """
+        k = k or self.CONTEXT_TOP_K
+        version = graph_service.get_graph_version(graph_id)
+        if version is None:
+            return {"nodes": [], "edges": [], "paths": []}
+        
+        key = (graph_id, version, node_id, hops, k)
+        with self._cache_lock:
+            context = self._selected_context_cache.get(key)
+            if context is not None:
+                self._selected_context_cache.move_to_end(key)
+                return context
+        
+        if node_id:
+            context = self.get_node_context(graph_service, graph_id, node_id, max_hops=hops)
+            distance = {p['target']: p['length'] for p in context['paths']}
+            distance[node_id] = 0
+            ranked = sorted(
+                context['nodes'],
+                key=lambda n: (distance.get(n['id'], hops + 1), self._importance_rank(n))
+            )
+        else:
+            context = {
+                "nodes": graph_service.get_all_nodes(graph_id),
+                "edges": graph_service.get_all_edges(graph_id),
+                "paths": []
+            }
+            ranked = sorted(context['nodes'], key=self._importance_rank)
+        
+        citation_nodes = [
+            {field: value for field, value in n.items() if field != 'embedding'}
+            for n in ranked
+        ]
+        nodes = citation_nodes[:k]
+        kept = {n['id'] for n in nodes}
+        context = {
+            **context,
+            "nodes": nodes,
+            "citation_nodes": citation_nodes,
+            "edges": [
+                e for e in context['edges']
+                if e.get('source') in kept and e.get('target') in kept
+            ],
+            "paths": [p for p in context['paths'] if p.get('target') in kept]
+        }
+        
+        with self._cache_lock:
+            self._selected_context_cache[key] = context
+            while len(self._selected_context_cache) > self.SELECTED_CONTEXT_CACHE_SIZE:
+                self._selected_context_cache.popitem(last=False)
+        return context
+    
+    @staticmethod
+    def _importance_rank(node: Dict[str, Any]) -> Tuple[int, float]:
+        """Sort key putting core-tier, high-confidence nodes first."""
+        return (node.get('tier', 2), -float(node.get('confidence') or 0.0))
+    
     def generate_summary(
         self,
         nodes: List[Dict[str, Any]],
@@ -426,31 +1090,40 @@ class LLMService:
         Returns:
             Natural language summary of the graph
         """
-        prompt = self._build_summary_prompt(nodes, edges)
-        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert at summarizing complex information. Create clear, concise summaries that highlight key concepts and relationships."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=max_tokens
+            return self._complete_text(
+                self.summary_batch_request(nodes, edges, max_tokens), self.SUMMARY_TTL
             )
             
-            summary = response.choices[0].message.content.strip()
-            return summary
-            
         except Exception as e:
             raise Exception(f"Failed to generate summary: {str(e)}")
     
+    def generate_summary_and_store(self, graph_service, graph_id: str) -> Optional[str]:
+        """
+        Generate a graph's summary and store it with the graph.
+        
+        Meant to run in the background right after a graph is created, so
+        summary requests become a read. The result is only stored if the
+        graph has not changed while the summary was being generated.
+        
+        Args:
+            graph_service: GraphService instance
+            graph_id: Graph identifier
+            
+        Returns:
+            The summary, or None if the graph no longer exists
+        """
+        version = graph_service.get_graph_version(graph_id)
+        if version is None:
+            return None
+        
+        summary = self.generate_summary(
+            graph_service.get_all_nodes(graph_id),
+            graph_service.get_all_edges(graph_id)
+        )
+        graph_service.set_graph_summary(graph_id, summary, self.model_config["summary"], version)
+        return summary
+    
     def _build_summary_prompt(
         self,
         nodes: List[Dict[str, Any]],
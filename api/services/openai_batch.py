@@ -0,0 +1,118 @@
+"""
+Helpers for the OpenAI Batch API.
+
+Batch jobs are billed at half the on-demand price and do not count
+against the per-minute rate limits, at the cost of latency (results
+arrive within the completion window, usually minutes). Use them for
+offline, throughput-bound workloads only.
+"""
+
+import io
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import orjson
+from openai import OpenAI
+
+# Terminal batch states that never produce an output file
+FAILED_STATES = {"failed", "expired", "cancelled"}
+
+
+def submit_batch(
+    client: OpenAI,
+    requests: List[Dict[str, Any]],
+    endpoint: str,
+    completion_window: str = "24h"
+) -> str:
+    """
+    Upload a JSONL file of requests and start a batch job.
+
+    Args:
+        client: OpenAI client
+        requests: Dicts with 'custom_id' and 'body' (the API request body)
+        endpoint: Target endpoint, e.g. "/v1/chat/completions" or "/v1/embeddings"
+        completion_window: Batch completion window (OpenAI only accepts "24h")
+
+    Returns:
+        Batch job ID
+
+    Raises:
+        Exception: If the upload or batch creation fails
+    """
+    lines = [
+        json.dumps({
+            "custom_id": r["custom_id"],
+            "method": "POST",
+            "url": endpoint,
+            "body": r["body"]
+        })
+        for r in requests
+    ]
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+    try:
+        batch_file = client.files.create(
+            file=("batch.jsonl", io.BytesIO(payload)),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=endpoint,
+            completion_window=completion_window
+        )
+        return batch.id
+    except Exception as e:
+        raise Exception(f"Batch submission failed: {e}")
+
+
+def wait_for_batch(
+    client: OpenAI,
+    batch_id: str,
+    poll_interval: float = 15.0,
+    timeout: Optional[float] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Poll a batch job until it finishes and return its results.
+
+    Args:
+        client: OpenAI client
+        batch_id: Batch job ID returned by submit_batch()
+        poll_interval: Seconds between status checks
+        timeout: Give up after this many seconds (None waits for the window)
+
+    Returns:
+        Mapping of custom_id to response body for every successful request.
+        Requests that errored are left out; callers decide how to handle gaps.
+
+    Raises:
+        Exception: If the batch fails, expires, is cancelled, or times out
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            break
+        if batch.status in FAILED_STATES:
+            raise Exception(f"Batch {batch_id} ended with status '{batch.status}'")
+        if deadline is not None and time.monotonic() >= deadline:
+            raise Exception(f"Batch {batch_id} timed out in status '{batch.status}'")
+        time.sleep(poll_interval)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    if not batch.output_file_id:
+        return results
+
+    # Raw bytes straight into orjson, without decoding the whole file to str
+    content = client.files.content(batch.output_file_id).content
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            continue
+        results[record["custom_id"]] = response.get("body", {})
+
+    return results
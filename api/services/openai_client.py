@@ -0,0 +1,153 @@
+"""
+Shared OpenAI client and HTTP connection pool.
+
+Every service talks to the same OpenAI host, so they share one keep-alive
+connection pool (HTTP/2 multiplexed) instead of each client instance
+opening its own connections and paying a TLS handshake per request.
+
+Async callers get the same arrangement through get_async_openai_client(),
+backed by a pooled httpx.AsyncClient with the same limits.
+
+The pools are closed by the FastAPI lifespan on shutdown; the next call to
+get_openai_client() / get_async_openai_client() transparently builds a
+fresh pool. Scripts that never run the lifespan (the test suites, CLI
+helpers) have the sync pool closed at interpreter exit instead.
+
+Clients are built with max_retries=0: the SDK's own retries would absorb
+429s before rate_limit.limited_create() sees them, so the limiter owns
+retries and backoff instead.
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Dict, Optional
+
+import httpx
+from openai import AsyncOpenAI, OpenAI, DEFAULT_TIMEOUT
+
+# Pool sizing for concurrent chat + embedding requests
+POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# SDK-level retries; limited_create() retries 429s itself (see module docstring)
+MAX_RETRIES = 0
+
+_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_clients: Dict[str, OpenAI] = {}
+
+_async_http_client: Optional[httpx.AsyncClient] = None
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_clients: Dict[str, AsyncOpenAI] = {}
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        Pooled httpx.Client with HTTP/2 enabled
+    """
+    global _http_client
+    with _lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(
+                http2=True,
+                limits=POOL_LIMITS,
+                timeout=DEFAULT_TIMEOUT
+            )
+            _clients.clear()
+        return _http_client
+
+
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Return an OpenAI client for api_key bound to the shared pool.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        Cached OpenAI client instance
+    """
+    http_client = get_http_client()
+    with _lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = OpenAI(api_key=api_key, http_client=http_client, max_retries=MAX_RETRIES)
+            _clients[api_key] = client
+        return client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Return the async HTTP client for the running event loop.
+
+    Connections are bound to the loop that opened them, so the pool is
+    rebuilt if called from a different loop (e.g. successive asyncio.run()
+    calls in scripts). Must be called from inside a coroutine.
+
+    Returns:
+        Pooled httpx.AsyncClient with HTTP/2 enabled
+    """
+    global _async_http_client, _async_loop
+    loop = asyncio.get_running_loop()
+    with _lock:
+        if (_async_http_client is None or _async_http_client.is_closed
+                or _async_loop is not loop):
+            _async_http_client = httpx.AsyncClient(
+                http2=True,
+                limits=POOL_LIMITS,
+                timeout=DEFAULT_TIMEOUT
+            )
+            _async_loop = loop
+            _async_clients.clear()
+        return _async_http_client
+
+
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """
+    Return an AsyncOpenAI client for api_key bound to the shared async pool.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        Cached AsyncOpenAI client instance
+    """
+    http_client = get_async_http_client()
+    with _lock:
+        client = _async_clients.get(api_key)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=api_key, http_client=http_client, max_retries=MAX_RETRIES
+            )
+            _async_clients[api_key] = client
+        return client
+
+
+async def aclose_http_clients() -> None:
+    """Close both the sync and async pools (call from the FastAPI lifespan)."""
+    global _async_http_client, _async_loop
+    close_http_clients()
+    with _lock:
+        http_client = _async_http_client
+        _async_http_client = None
+        _async_loop = None
+        _async_clients.clear()
+    if http_client is not None:
+        await http_client.aclose()
+
+
+def close_http_clients() -> None:
+    """Close the shared sync pool and drop clients bound to it."""
+    global _http_client
+    with _lock:
+        if _http_client is not None:
+            _http_client.close()
+        _http_client = None
+        _clients.clear()
+
+
+# Close keep-alive connections cleanly when a script exits without the lifespan
+atexit.register(close_http_clients)
@@ -0,0 +1,193 @@
+"""
+Adaptive concurrency limiting for OpenAI calls.
+
+All services share one limiter because OpenAI rate limits apply per
+organization, not per service instance. The limit follows AIMD: it grows
+by about one slot per window of successful calls, and halves when the
+rate-limit headers show the quota nearly spent or when a 429 comes back.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Mapping, Optional
+
+from openai import RateLimitError
+
+# Never grow past the shared HTTP pool size (see openai_client.POOL_LIMITS)
+MAX_CONCURRENCY = 64
+
+# Back off once less than this fraction of the request/token quota is left
+LOW_QUOTA_FRACTION = 0.1
+
+_RATE_LIMIT_HEADERS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-limit-requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-limit-tokens"),
+)
+
+
+class AdaptiveLimiter:
+    """Thread-safe AIMD concurrency limit."""
+
+    def __init__(self, initial: int, min_limit: int = 1, max_limit: int = MAX_CONCURRENCY):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting number of concurrent calls
+            min_limit: Floor for the limit after decreases
+            max_limit: Ceiling for the limit after increases
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    @contextmanager
+    def slot(self):
+        """Hold one concurrency slot for the duration of the block."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify()
+
+    def on_success(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Record a successful call and adjust the limit from its headers.
+
+        Args:
+            headers: Response headers carrying x-ratelimit-* values
+        """
+        if headers is not None and _quota_low(headers):
+            self._decrease()
+            return
+        with self._cond:
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+    def on_rate_limited(self) -> None:
+        """Record a 429 response."""
+        self._decrease()
+
+    def _decrease(self) -> None:
+        with self._cond:
+            self._limit = max(float(self.min_limit), self._limit / 2)
+
+
+def _quota_low(headers: Mapping[str, str]) -> bool:
+    """Return True if any rate-limit quota is under LOW_QUOTA_FRACTION."""
+    for remaining_key, limit_key in _RATE_LIMIT_HEADERS:
+        try:
+            remaining = float(headers[remaining_key])
+            limit = float(headers[limit_key])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if limit > 0 and remaining / limit < LOW_QUOTA_FRACTION:
+            return True
+    return False
+
+
+_limiter: Optional[AdaptiveLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> AdaptiveLimiter:
+    """
+    Return the process-wide limiter, sized from LLM_CONCURRENCY (default 8).
+
+    Returns:
+        Shared AdaptiveLimiter
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = AdaptiveLimiter(int(os.getenv("LLM_CONCURRENCY", "8")))
+        return _limiter
+
+
+def limited_create(resource: Any, max_attempts: int = 5, **kwargs) -> Any:
+    """
+    Call resource.create(**kwargs) under the shared limiter.
+
+    Uses the SDK's raw-response API to read rate-limit headers, and retries
+    429s with jittered exponential backoff. For streamed calls the slot is
+    held until the response headers arrive, not for the whole stream.
+
+    Args:
+        resource: SDK resource such as client.chat.completions or client.embeddings
+        max_attempts: Attempts before a 429 is re-raised
+        **kwargs: Arguments for resource.create
+
+    Returns:
+        The parsed SDK response (or Stream when stream=True)
+
+    Raises:
+        RateLimitError: If every attempt was rate limited
+    """
+    limiter = get_limiter()
+    for attempt in range(max_attempts):
+        with limiter.slot():
+            try:
+                raw = resource.with_raw_response.create(**kwargs)
+            except RateLimitError:
+                limiter.on_rate_limited()
+                if attempt == max_attempts - 1:
+                    raise
+            else:
+                limiter.on_success(raw.headers)
+                return raw.parse()
+        # Sleep outside the slot so other callers are not blocked
+        time.sleep(_backoff(attempt))
+
+
+async def alimited_create(resource: Any, max_attempts: int = 5, **kwargs) -> Any:
+    """
+    Async counterpart of limited_create() for AsyncOpenAI resources.
+
+    Feeds the same limiter from response headers and 429s, and retries 429s
+    with the same backoff. It does not wait for a slot: the limiter blocks
+    threads, which would stall the event loop.
+
+    Args:
+        resource: Async SDK resource such as async_client.chat.completions
+        max_attempts: Attempts before a 429 is re-raised
+        **kwargs: Arguments for resource.create
+
+    Returns:
+        The parsed SDK response (or AsyncStream when stream=True)
+
+    Raises:
+        RateLimitError: If every attempt was rate limited
+    """
+    limiter = get_limiter()
+    for attempt in range(max_attempts):
+        try:
+            raw = await resource.with_raw_response.create(**kwargs)
+        except RateLimitError:
+            limiter.on_rate_limited()
+            if attempt == max_attempts - 1:
+                raise
+        else:
+            limiter.on_success(raw.headers)
+            return await raw.parse()
+        await asyncio.sleep(_backoff(attempt))
+
+
+def _backoff(attempt: int) -> float:
+    """Jittered exponential backoff in seconds for a retry after attempt."""
+    return min(30.0, 0.5 * 2 ** attempt) * (0.5 + random.random())
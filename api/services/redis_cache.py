@@ -0,0 +1,176 @@
+"""
+Shared LLM response cache backed by Redis.
+
+The in-process caches in LLMService are lost on restart and are not shared
+between uvicorn workers. When REDIS_URL is set, generated texts are also
+stored in Redis (zlib-compressed JSON, with a TTL), keyed by a SHA-256 of
+the full chat request, so every worker and every deploy reuses them.
+
+If Redis is unreachable the cache falls back to a small in-process TTL
+cache and retries Redis after a short pause, so an outage costs neither
+errors nor a connect timeout per request. Without REDIS_URL (or without
+the redis package) the cache is disabled and every lookup is a miss.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import redis
+except ImportError:  # Redis is optional; the shared cache is then disabled
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds to skip Redis after a failed call before trying it again
+RETRY_AFTER = 30.0
+
+# Entries kept in the in-process fallback while Redis is down
+FALLBACK_SIZE = 1024
+
+
+def request_key(body: Dict[str, Any]) -> str:
+    """
+    Cache key for a chat completion request.
+
+    Args:
+        body: chat.completions.create arguments (model, messages, ...)
+
+    Returns:
+        Hex SHA-256 of the canonical JSON body
+    """
+    encoded = json.dumps(body, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResponseCache:
+    """Redis-backed text cache with an in-process fallback."""
+
+    def __init__(self, url: Optional[str] = None, prefix: str = "llm:"):
+        """
+        Initialize the cache.
+
+        Args:
+            url: Redis URL (default: REDIS_URL from env; unset disables the cache)
+            prefix: Namespace prepended to every key
+        """
+        url = url or os.getenv("REDIS_URL")
+        self.prefix = prefix
+        self.enabled = bool(url) and redis is not None
+        self._redis = (
+            redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+            if self.enabled else None
+        )
+        self._down_until = 0.0
+        self._fallback: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if url and redis is None:
+            logger.warning("REDIS_URL is set but the redis package is not installed")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Key from request_key()
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        if self._redis_up():
+            try:
+                raw = self._redis.get(self.prefix + key)
+            except redis.RedisError as e:
+                self._mark_down(e)
+            else:
+                return json.loads(zlib.decompress(raw)) if raw is not None else None
+        return self._fallback_get(key)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """
+        Store a JSON-serializable value for ttl seconds.
+
+        Args:
+            key: Key from request_key()
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        if not self.enabled:
+            return
+        if self._redis_up():
+            try:
+                self._redis.set(self.prefix + key, zlib.compress(json.dumps(value).encode()), ex=ttl)
+                return
+            except redis.RedisError as e:
+                self._mark_down(e)
+        with self._lock:
+            self._fallback[key] = (time.monotonic() + ttl, value)
+            self._fallback.move_to_end(key)
+            while len(self._fallback) > FALLBACK_SIZE:
+                self._fallback.popitem(last=False)
+
+    def get_or_set(self, key: str, compute: Callable[[], Any], ttl: int) -> Any:
+        """
+        Return the cached value, or compute, store and return it.
+
+        Args:
+            key: Key from request_key()
+            compute: Called on a miss to produce the value
+            ttl: Time to live in seconds for a computed value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value, ttl)
+        return value
+
+    def _redis_up(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _mark_down(self, error: Exception) -> None:
+        if self._redis_up():
+            logger.warning("Redis unavailable, using in-process cache for %ss: %s", RETRY_AFTER, error)
+        self._down_until = time.monotonic() + RETRY_AFTER
+
+    def _fallback_get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._fallback.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._fallback[key]
+                return None
+            self._fallback.move_to_end(key)
+            return value
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Return the process-wide response cache, configured from REDIS_URL.
+
+    Returns:
+        Shared ResponseCache
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
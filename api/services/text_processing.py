@@ -15,10 +15,21 @@ in the knowledge graph.
 """
 
 import os
+import hashlib
 import json
+import logging
 import re
+import threading
 import numpy as np
-from typing import List, Dict, Any, Optional
+import orjson
+import tiktoken
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 from openai import OpenAI
 from dotenv import load_dotenv
 import sys
@@ -28,10 +39,300 @@ from textwrap import shorten
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from api.services.openai_batch import submit_batch, wait_for_batch
+from api.services.openai_client import get_openai_client
+from api.services.rate_limit import limited_create
+
 # Load environment variables
 env_path = project_root / '.env.local'
 load_dotenv(env_path)
 
+logger = logging.getLogger(__name__)
+
+# Sentence-ending punctuation followed by whitespace or end of text
+# (skips decimals like 3.14 and dotted names like file.txt)
+_SENTENCE_END = re.compile(r'[.!?](?=\s|$)')
+
+# Relationship types the extraction prompts allow, in prompt order; check
+# membership against the frozenset rather than a regex alternation
+RELATIONSHIP_TYPES = (
+    "is-a", "part-of", "related-to", "causes", "enables",
+    "requires", "uses", "implements", "contrasts-with",
+)
+RELATIONSHIP_TYPE_SET = frozenset(RELATIONSHIP_TYPES)
+_ALLOWED_TYPES_LINE = ", ".join(f'"{t}"' for t in RELATIONSHIP_TYPES)
+
+# System prompt for concept extraction: every fixed instruction, with no
+# per-call content, so it is a byte-identical prefix of each request and only
+# the user message (the text) varies
+EXTRACTION_SYSTEM_PROMPT = """You are an expert at concept mining.
+Return ALL salient, distinct concepts the text supports (no arbitrary limits).
+
+For each concept return:
+- name: 2–5 words, canonical
+- description: 1–2 sentences, faithful to the text
+- importance: 0.0–1.0 (how central to the text)
+- source_text: short evidence quote from the text
+- level: 1, 2, or 3  (1=core themes, 2=subtopics of a level-1, 3=details/examples)
+- parent: the parent concept's exact name if level>1, else null
+
+Analyze the text and return ALL meaningful concepts,
+including core themes (level 1), subtopics (level 2), and details/examples (level 3).
+Be inclusive; avoid merging distinct ideas.
+
+Important:
+- Use { "concepts": [...] } EXACT JSON.
+- If two concepts are related but distinct, keep both.
+
+Return ONLY valid JSON:
+{"concepts":[{...},{...}]}"""
+
+
+class ErrorCode(IntEnum):
+    """Outcome of validate_text_input(), for callers that branch on it."""
+    
+    OK = 0
+    EMPTY = 1
+    TOO_SHORT = 2
+    TOO_LONG = 3
+
+
+# Shared validate_text_input() results that carry no per-call detail
+_VALID_TEXT = (True, ErrorCode.OK, "")
+_EMPTY_TEXT = (False, ErrorCode.EMPTY, "Text cannot be empty")
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Optional["tiktoken.Encoding"]:
+    """
+    Return the tokenizer for a model, loading each encoding only once.
+    
+    Falls back to o200k_base for model names tiktoken does not know.
+    tiktoken downloads the BPE file on first use, so on an offline or
+    firewalled host this returns None (once, cached) and callers estimate
+    token counts instead.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning("Could not load the tokenizer for %s, estimating token counts instead: %s", model, e)
+        return None
+
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the graph kernels below then run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def _component_labels(src: np.ndarray, dst: np.ndarray, n: int) -> np.ndarray:
+    """
+    Label the connected components of an undirected edge list.
+    
+    Array union-find with path halving; each root is the lowest index of
+    its component, so labels are numbered 0..k-1 in order of first member.
+    
+    Args:
+        src: int32 source index per edge
+        dst: int32 target index per edge
+        n: Number of nodes
+        
+    Returns:
+        int32 array with the component label of each node
+    """
+    parent = np.arange(n, dtype=np.int32)
+    for e in range(src.shape[0]):
+        a = src[e]
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        b = dst[e]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a < b:
+            parent[b] = a
+        elif b < a:
+            parent[a] = b
+    
+    labels = np.empty(n, dtype=np.int32)
+    next_label = 0
+    for i in range(n):
+        r = i
+        while parent[r] != r:
+            r = parent[r]
+        if r == i:
+            labels[i] = next_label
+            next_label += 1
+        else:
+            labels[i] = labels[r]
+    return labels
+
+
+@njit(cache=True)
+def _pick_repair_edges(comp_id: np.ndarray, centrality: np.ndarray, main: int):
+    """
+    Pair each component's most central node with the main component's.
+    
+    Ties go to the lowest index, matching Python's max().
+    
+    Args:
+        comp_id: int32 component label per node (from _component_labels)
+        centrality: float32 score per node
+        main: Label of the component every other one is bridged to
+        
+    Returns:
+        Tuple of int32 (sources, targets), one edge per non-main component
+        in label order
+    """
+    k = comp_id.max() + 1
+    best = np.full(k, -1, dtype=np.int32)
+    for i in range(comp_id.shape[0]):
+        c = comp_id[i]
+        if best[c] < 0 or centrality[i] > centrality[best[c]]:
+            best[c] = i
+    
+    src = np.empty(k - 1, dtype=np.int32)
+    dst = np.empty(k - 1, dtype=np.int32)
+    j = 0
+    for c in range(k):
+        if c != main:
+            src[j] = best[c]
+            dst[j] = best[main]
+            j += 1
+    return src, dst
+
+
+@dataclass
+class ConceptTable:
+    """
+    Struct-of-arrays view of a concept list.
+    
+    Hierarchy building and metadata scans work on these contiguous arrays
+    instead of per-dict lookups; concept dicts are only updated at the end.
+    Embedding rows are L2-normalized, so a dot product is a cosine similarity.
+    Rows for concepts without an embedding are zero and flagged in has_embedding.
+    """
+    names: np.ndarray          # object, (N,)
+    importances: np.ndarray    # float32, (N,)
+    tiers: np.ndarray          # int8, (N,); 0 until assigned
+    connections: np.ndarray    # int32, (N,)
+    embeddings: np.ndarray     # float32, (N, D)
+    has_embedding: np.ndarray  # bool, (N,)
+    
+    @classmethod
+    def from_concepts(cls, concepts: List[Dict[str, Any]]) -> "ConceptTable":
+        """
+        Build a table from concept dictionaries.
+        
+        Args:
+            concepts: List of concept dictionaries
+            
+        Returns:
+            ConceptTable with one row per concept
+        """
+        n = len(concepts)
+        dim = next((len(c['embedding']) for c in concepts if c.get('embedding') is not None), 0)
+        
+        embeddings = np.zeros((n, dim), dtype=np.float32)
+        has_embedding = np.zeros(n, dtype=bool)
+        for i, c in enumerate(concepts):
+            emb = c.get('embedding')
+            if emb is not None and dim and len(emb) == dim:
+                embeddings[i] = emb
+                has_embedding[i] = True
+        
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.divide(embeddings, norms, out=embeddings, where=norms > 0)
+        
+        return cls(
+            names=np.array([c.get('name', '') for c in concepts], dtype=object),
+            importances=np.array([c.get('importance', 0.5) for c in concepts], dtype=np.float32),
+            tiers=np.zeros(n, dtype=np.int8),
+            connections=np.zeros(n, dtype=np.int32),
+            embeddings=embeddings,
+            has_embedding=has_embedding,
+        )
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def write_back(self, concepts: List[Dict[str, Any]]) -> None:
+        """Copy tier and connection counts onto the concept dictionaries."""
+        for c, tier, conn in zip(concepts, self.tiers.tolist(), self.connections.tolist()):
+            c['tier'] = tier
+            c['connections'] = conn
+
+
+class ConceptStreamParser:
+    """
+    Incrementally pull concept objects out of a streamed JSON response.
+    
+    Expects the extraction shape {"concepts": [{...}, {...}]}. Each object
+    in the array is returned by feed() as soon as its closing brace
+    arrives, so downstream work can start before generation finishes.
+    """
+    
+    def __init__(self):
+        self.buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._start = -1
+    
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Append streamed text and return any concept objects it completed.
+        
+        Args:
+            text: Next piece of the model output
+            
+        Returns:
+            Concept dictionaries completed by this piece (may be empty)
+        """
+        self.buffer += text
+        done: List[Dict[str, Any]] = []
+        buf = self.buffer
+        
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._depth += 1
+                # Depth 1 is the wrapper object, 2 the array, 3 a concept
+                if self._depth == 3 and ch == '{':
+                    self._start = i
+            elif ch in '}]':
+                if self._depth == 3 and ch == '}' and self._start >= 0:
+                    try:
+                        obj = orjson.loads(buf[self._start:i + 1])
+                        if isinstance(obj, dict):
+                            done.append(obj)
+                    except json.JSONDecodeError:
+                        pass
+                    self._start = -1
+                self._depth -= 1
+        
+        self._pos = len(buf)
+        return done
+
+
 class TextProcessingService:
     """
     Service for processing text and extracting concepts and relationships.
@@ -41,6 +342,47 @@ class TextProcessingService:
     - Relationships between concepts with types and strengths
     """
     
+    # Accepted input length in characters (validate_text_input)
+    MIN_TEXT_LENGTH = 100
+    MAX_TEXT_LENGTH = 50000
+    
+    # Maximum number of inputs accepted by a single embeddings request
+    MAX_EMBEDDING_BATCH = 2048
+    
+    # Embeddings kept per service as float32 vectors (~6KB each at 1536 dims)
+    EMBEDDING_CACHE_SIZE = 4096
+    
+    # Token counts kept per service, keyed by sha1 of the text (the texts are not kept)
+    TOKEN_COUNT_CACHE_SIZE = 4096
+    
+    # Texts under this many tokens are extracted in a single LLM call
+    SINGLE_PASS_MAX_TOKENS = 750
+    
+    # Token budget for the focus list of one relationship-extraction batch
+    RELATIONSHIP_BATCH_MAX_TOKENS = 600
+    
+    # Side length of the similarity tiles scored at once during dedup
+    SIM_TILE = 512
+    
+    # Fast path (TEXT_FAST_PATH=1): single-chunk texts with at most this many
+    # concepts skip semantic dedup and component repair
+    FAST_PATH_MAX_CONCEPTS = 12
+    
+    # Concepts per embedding request while extraction is still streaming
+    EMBED_MICRO_BATCH = 32
+    EMBED_WORKERS = 4
+    
+    # Chunks of one text extracted concurrently (limited_create still applies
+    # the shared rate limit to every call)
+    EXTRACT_WORKERS = 8
+    
+    # Extraction output budget (max_tokens): grows with the input, since a
+    # longer text supports more concepts, within fixed bounds; stops a
+    # runaway generation on a short text from running to the hard ceiling
+    EXTRACTION_MIN_OUTPUT_TOKENS = 1024
+    EXTRACTION_OUTPUT_PER_INPUT_TOKEN = 6
+    EXTRACTION_MAX_OUTPUT_TOKENS = 8000
+    
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None, embedding_model: Optional[str] = None):
         """
         Initialize the text processing service.
@@ -57,7 +399,85 @@ class TextProcessingService:
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.fast_path = os.getenv('TEXT_FAST_PATH', '0') == '1'
+        
+        # Embeddings by sha1(model + text); the same concept text is embedded
+        # once even across chunks, documents and repeat requests
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_lock = threading.Lock()
+        
+        # Token counts by sha1(text), so repeat counts of the same concept
+        # name or document skip the encoder without pinning the text
+        self._token_counts: "OrderedDict[str, int]" = OrderedDict()
+        self._token_count_lock = threading.Lock()
+    
+    @property
+    def client(self) -> OpenAI:
+        """OpenAI client bound to the shared HTTP/2 connection pool."""
+        return get_openai_client(self.api_key)
+    
+    def count_tokens(self, text: str) -> int:
+        """
+        Count tokens in text using the generation model's tokenizer.
+        
+        The tokenizer is loaded on the first call. If it cannot be loaded
+        (e.g. no network for tiktoken's download), approx_tokens() is used.
+        
+        Args:
+            text: Text to tokenize
+            
+        Returns:
+            Number of tokens
+        """
+        key = hashlib.sha1(text.encode()).hexdigest()
+        with self._token_count_lock:
+            count = self._token_counts.get(key)
+            if count is not None:
+                self._token_counts.move_to_end(key)
+                return count
+        
+        enc = _get_encoding(self.model)
+        count = len(enc.encode(text)) if enc is not None else self.approx_tokens(text)
+        
+        with self._token_count_lock:
+            self._token_counts[key] = count
+            if len(self._token_counts) > self.TOKEN_COUNT_CACHE_SIZE:
+                self._token_counts.popitem(last=False)
+        return count
+    
+    @staticmethod
+    def approx_tokens(text: str) -> int:
+        """
+        Estimate the token count of text without encoding it (~4 chars per token).
+        
+        Args:
+            text: Text to estimate
+            
+        Returns:
+            Approximate number of tokens
+        """
+        return len(text) >> 2
+    
+    def _under_token_limit(self, text: str, limit: int) -> bool:
+        """
+        Whether text has fewer than limit tokens, encoding it only near the limit.
+        
+        A text with fewer UTF-8 bytes than limit is always under it (every
+        token covers at least one byte), and one estimated at more than twice
+        the limit is taken as over it. Anything in between is counted exactly.
+        
+        Args:
+            text: Text to check
+            limit: Token limit
+            
+        Returns:
+            True if text is (or is certainly) under the limit
+        """
+        if len(text) < limit and len(text.encode("utf-8")) < limit:
+            return True
+        if self.approx_tokens(text) > 2 * limit:
+            return False
+        return self.count_tokens(text) < limit
     
     @staticmethod
     def _clean_json_block(s: str) -> str:
@@ -99,12 +519,15 @@ class TextProcessingService:
         """
         chunks, start = [], 0
         n = len(text)
+        # Find every sentence end once; each window then bisects into the list
+        ends = [m.end() for m in _SENTENCE_END.finditer(text)]
         
         while start < n:
             end = min(n, start + target)
-            # Try to cut at sentence boundary
-            cut = text.rfind('.', start, end)
-            if cut == -1 or cut <= start + 200:
+            # Try to cut at the last sentence boundary in the window
+            k = bisect_right(ends, end) - 1
+            cut = ends[k] if k >= 0 else -1
+            if cut <= start + 200:
                 cut = end
             chunks.append(text[start:cut].strip())
             start = max(cut - overlap, cut)
@@ -127,7 +550,37 @@ class TextProcessingService:
         for i in range(0, len(items), size):
             yield items[i:i+size]
     
-    def validate_text_input(self, text: str) -> tuple[bool, str]:
+    def _batch_by_tokens(
+        self,
+        names: List[str],
+        max_items: int,
+        max_tokens: int
+    ) -> List[List[str]]:
+        """
+        Split concept names into batches bounded by count and token total.
+        
+        Args:
+            names: Concept names to batch
+            max_items: Maximum names per batch
+            max_tokens: Maximum total tokens per batch
+            
+        Yields:
+            Batches of names
+        """
+        batch: List[str] = []
+        batch_tokens = 0
+        for name in names:
+            # +1 for the ", " separator used when the batch is rendered
+            tokens = self.count_tokens(name) + 1
+            if batch and (len(batch) >= max_items or batch_tokens + tokens > max_tokens):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(name)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+    
+    def validate_text_input(self, text: str) -> tuple[bool, ErrorCode, str]:
         """
         Validate text input meets requirements.
         
@@ -135,38 +588,52 @@ class TextProcessingService:
             text: Input text to validate
             
         Returns:
-            Tuple of (is_valid, error_message)
+            Tuple of (is_valid, code, error_message)
             - is_valid: True if text passes validation
+            - code: ErrorCode.OK if valid, otherwise why it was rejected
             - error_message: Empty if valid, error description if invalid
         """
-        # Check if text is empty or None
-        if not text or not text.strip():
-            return False, "Text cannot be empty"
+        # Check if text is empty or None (isspace() stops at the first
+        # non-space character instead of copying the text like strip())
+        if not text or text.isspace():
+            return _EMPTY_TEXT
+        
+        n = len(text)
         
         # Check minimum length
-        if len(text) < 100:
-            return False, f"Text must be at least 100 characters (got {len(text)})"
+        if n < self.MIN_TEXT_LENGTH:
+            return False, ErrorCode.TOO_SHORT, f"Text must be at least {self.MIN_TEXT_LENGTH} characters (got {n})"
         
         # Check maximum length
-        if len(text) > 50000:
-            return False, f"Text cannot exceed 50,000 characters (got {len(text)})"
+        if n > self.MAX_TEXT_LENGTH:
+            return False, ErrorCode.TOO_LONG, f"Text cannot exceed {self.MAX_TEXT_LENGTH:,} characters (got {n})"
         
-        return True, ""
+        return _VALID_TEXT
     
     def extract_concepts(
         self,
         text: str,
         min_importance: float = 0.0,  # No filtering by default - LLM decides
+        embed: bool = False,
+        on_concept: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Extract ALL salient concepts from text using GPT-4.
+        Extract ALL salient concepts from text with the configured chat model.
         
         No artificial limit on count. We rely on chunking for coverage.
         The LLM returns as many concepts as it deems meaningful.
         
+        The completion is streamed and concepts are parsed as they arrive.
+        With embed=True, each group of EMBED_MICRO_BATCH finished concepts is
+        embedded on a worker thread while the model is still generating, so
+        embedding latency hides behind generation.
+        
         Args:
             text: Input text to analyze
             min_importance: Minimum importance score (0-1) for concepts
+            embed: Also attach an 'embedding' to each concept
+            on_concept: Called with each accepted concept as soon as it is
+                parsed, before embeddings are attached (e.g. to stream it)
             
         Returns:
             List of concept dictionaries with keys:
@@ -182,81 +649,79 @@ class TextProcessingService:
             Exception: If API call fails
         """
         # Validate input
-        is_valid, error_msg = self.validate_text_input(text)
+        is_valid, _, error_msg = self.validate_text_input(text)
         if not is_valid:
             raise ValueError(error_msg)
         
-        # Build the extraction prompt
-        system_prompt = """You are an expert at concept mining.
-Return ALL salient, distinct concepts the text supports (no arbitrary limits).
-
-For each concept return:
-- name: 2–5 words, canonical
-- description: 1–2 sentences, faithful to the text
-- importance: 0.0–1.0 (how central to the text)
-- source_text: short evidence quote from the text
-- level: 1, 2, or 3  (1=core themes, 2=subtopics of a level-1, 3=details/examples)
-- parent: the parent concept's exact name if level>1, else null
-
-Return ONLY valid JSON:
-{"concepts":[{...},{...}]}"""
-
-        user_prompt = f"""Analyze the text and return ALL meaningful concepts,
-including core themes (level 1), subtopics (level 2), and details/examples (level 3).
-Be inclusive; avoid merging distinct ideas.
-
-TEXT:
-{text}
-
-Important:
-- Use {{ "concepts": [...] }} EXACT JSON.
-- If two concepts are related but distinct, keep both.
-"""
-
         try:
-            # Call OpenAI API with JSON mode
-            response = self.client.chat.completions.create(
-                model=self.model,
-                response_format={"type": "json_object"},  # Enforce JSON output
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.2,  # Low temperature for consistent extraction
-                max_tokens=8000  # Allow comprehensive extraction
-            )
-            
-            # Parse response
-            raw = response.choices[0].message.content
-            cleaned = self._clean_json_block(raw)
-            data = json.loads(cleaned)
-            concepts = data.get("concepts", [])
-            
-            # Validate concepts is a list
-            if not isinstance(concepts, list):
-                raise Exception(f"Expected 'concepts' to be a list, got {type(concepts)}")
-            
-            # Filter out invalid concepts and ensure required fields
-            valid_concepts = []
-            for c in concepts:
-                if not isinstance(c, dict):
-                    continue
-                # Ensure required fields exist with defaults
-                if not c.get("name"):
-                    continue
-                c.setdefault("description", "")
-                c.setdefault("importance", 0.5)
-                c.setdefault("source_text", "")
-                c.setdefault("level", 1)
-                c.setdefault("parent", None)
+            with ThreadPoolExecutor(max_workers=self.EMBED_WORKERS) as pool:
+                # Call OpenAI API with JSON mode, streaming the output
+                stream = limited_create(
+                    self.client.chat.completions,
+                    **self._extraction_request(text),
+                    stream=True,
+                    stream_options={"include_usage": True}
+                )
+                
+                parser = ConceptStreamParser()
+                concepts: List[Dict[str, Any]] = []
+                pending: List[Dict[str, Any]] = []
+                jobs = []
+                
+                def flush():
+                    texts = [f"{c.get('name','')}: {c.get('description','')}" for c in pending]
+                    jobs.append((list(pending), pool.submit(self.generate_embeddings_batch, texts)))
+                    pending.clear()
+                
+                # Parse concepts as soon as each object closes
+                for chunk in stream:
+                    if not chunk.choices:
+                        # The final chunk carries only usage
+                        if chunk.usage is not None:
+                            self._log_prompt_cache(chunk.usage)
+                        continue
+                    if chunk.choices[0].finish_reason == "length":
+                        logger.warning(
+                            "Concept extraction hit its output token budget; "
+                            "concepts after the last complete one were dropped"
+                        )
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    for c in parser.feed(delta):
+                        if not self._normalize_concept(c, min_importance):
+                            continue
+                        concepts.append(c)
+                        if on_concept:
+                            on_concept(c)
+                        if embed:
+                            pending.append(c)
+                            if len(pending) >= self.EMBED_MICRO_BATCH:
+                                flush()
                 
-                # Only filter by min_importance if specified
-                if min_importance > 0 and c.get("importance", 0) < min_importance:
-                    continue
-                    
-                valid_concepts.append(c)
+                raw = parser.buffer
+                if not concepts:
+                    # Nothing matched the streaming shape; parse the whole response
+                    concepts = self._parse_concepts(raw, min_importance)
+                    if on_concept:
+                        for c in concepts:
+                            on_concept(c)
+                    if embed:
+                        pending.extend(concepts)
+                
+                if embed and pending:
+                    flush()
+                
+                # Attach embeddings; failed groups stay unembedded and are
+                # retried by the merge step
+                for group, job in jobs:
+                    try:
+                        for c, e in zip(group, job.result()):
+                            c['embedding'] = e
+                    except Exception as e:
+                        logger.warning("Streaming embedding batch failed: %s", e)
             
-            return valid_concepts
+            return concepts
             
         except json.JSONDecodeError as e:
             # Safely truncate response without breaking JSON strings in error message
@@ -266,6 +731,116 @@ Important:
         except Exception as e:
             raise Exception(f"Concept extraction failed: {str(e)}")
     
+    def _extraction_request(self, text: str) -> Dict[str, Any]:
+        """
+        Build the chat-completion request body for concept extraction.
+        
+        Shared by the on-demand and Batch API paths so both send the same prompt.
+        
+        Args:
+            text: Input text to analyze
+            
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        # Everything fixed lives in EXTRACTION_SYSTEM_PROMPT so the prefix is
+        # stable; only the text varies between requests
+        user_prompt = f"""TEXT:
+{text}"""
+        return {
+            "model": self.model,
+            "response_format": {"type": "json_object"},  # Enforce JSON output
+            "messages": [
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": 0.2,  # Low temperature for consistent extraction
+            "max_tokens": self._extraction_max_tokens(text)
+        }
+    
+    def _extraction_max_tokens(self, text: str) -> int:
+        """
+        Output token budget for extracting concepts from text.
+        
+        Scales with the input's token count between
+        EXTRACTION_MIN_OUTPUT_TOKENS and EXTRACTION_MAX_OUTPUT_TOKENS.
+        
+        Args:
+            text: Input text to analyze
+            
+        Returns:
+            max_tokens for the extraction request
+        """
+        budget = self.EXTRACTION_MIN_OUTPUT_TOKENS + self.EXTRACTION_OUTPUT_PER_INPUT_TOKEN * self.count_tokens(text)
+        return min(budget, self.EXTRACTION_MAX_OUTPUT_TOKENS)
+    
+    @staticmethod
+    def _log_prompt_cache(usage: Any) -> None:
+        """
+        Log how much of an extraction prompt OpenAI served from its prompt cache.
+        
+        Args:
+            usage: CompletionUsage of a chat completion
+        """
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cached = getattr(details, 'cached_tokens', None) or 0
+        logger.debug("Extraction prompt: %d tokens, %d cached", usage.prompt_tokens, cached)
+    
+    def _parse_concepts(self, raw: str, min_importance: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Parse an extraction response into validated concept dictionaries.
+        
+        Args:
+            raw: Raw message content returned by the model
+            min_importance: Minimum importance score (0-1) for concepts
+            
+        Returns:
+            List of concept dictionaries with defaults filled in
+            
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+            Exception: If the JSON does not contain a concept list
+        """
+        cleaned = self._clean_json_block(raw)
+        data = orjson.loads(cleaned)
+        concepts = data.get("concepts", [])
+        
+        # Validate concepts is a list
+        if not isinstance(concepts, list):
+            raise Exception(f"Expected 'concepts' to be a list, got {type(concepts)}")
+        
+        # Filter out invalid concepts and ensure required fields
+        return [c for c in concepts if self._normalize_concept(c, min_importance)]
+    
+    @staticmethod
+    def _normalize_concept(c: Any, min_importance: float = 0.0) -> bool:
+        """
+        Fill in default fields on a concept and decide whether to keep it.
+        
+        Args:
+            c: Candidate concept parsed from the model output
+            min_importance: Minimum importance score (0-1) for concepts
+            
+        Returns:
+            True if the concept is valid and passes the importance filter
+        """
+        if not isinstance(c, dict):
+            return False
+        # Ensure required fields exist with defaults
+        if not c.get("name"):
+            return False
+        c.setdefault("description", "")
+        c.setdefault("importance", 0.5)
+        c.setdefault("source_text", "")
+        c.setdefault("level", 1)
+        c.setdefault("parent", None)
+        
+        # Only filter by min_importance if specified
+        if min_importance > 0 and c.get("importance", 0) < min_importance:
+            return False
+        
+        return True
+    
     def _merge_dupes_by_embedding(
         self, 
         concepts: List[Dict[str, Any]], 
@@ -274,8 +849,12 @@ Important:
         """
         Merge duplicate concepts using semantic similarity of embeddings.
         
-        Concepts with similarity >= sim_thresh are merged into one.
-        The highest-importance concept becomes the canonical version.
+        Concepts with similarity >= sim_thresh are merged into one, and
+        merging is transitive: pairs are clustered with union-find, so
+        A~B and B~C merge all three even when A and C fall below the
+        threshold. The highest-importance concept becomes the canonical
+        version; importances are not summed, since they feed node
+        confidence which must stay within 0-1.
         
         Args:
             concepts: List of concept dictionaries
@@ -287,49 +866,115 @@ Important:
         if not concepts:
             return concepts
         
-        # Ensure all concepts have embeddings
-        need_embed = any('embedding' not in c for c in concepts)
-        if need_embed:
-            # Generate embeddings for concepts missing them
-            texts = [f"{c.get('name','')}: {c.get('description','')}" for c in concepts]
+        # Embed only the concepts missing a vector, in one batched request
+        needs_emb = [c for c in concepts if 'embedding' not in c]
+        if needs_emb:
+            texts = [f"{c.get('name','')}: {c.get('description','')}" for c in needs_emb]
             embeds = self.generate_embeddings_batch(texts)
-            for i, c in enumerate(concepts):
-                c['embedding'] = embeds[i]
-        
-        # Merge duplicates by similarity
-        out, used = [], [False] * len(concepts)
-        
-        for i, c in enumerate(concepts):
-            if used[i]:
-                continue
-            
-            # Start a new group with this concept
-            group = [c]
-            used[i] = True
-            
-            # Find all similar concepts
-            for j in range(i + 1, len(concepts)):
-                if used[j]:
-                    continue
-                
-                if 'embedding' in c and 'embedding' in concepts[j]:
-                    sim = self.cosine_similarity(c['embedding'], concepts[j]['embedding'])
-                    if sim >= sim_thresh:
-                        group.append(concepts[j])
-                        used[j] = True
-            
-            # Keep highest-importance as canonical
-            best = max(group, key=lambda g: g.get('importance', 0))
+            for c, e in zip(needs_emb, embeds):
+                c['embedding'] = e
+        
+        # Normalize in float32 and store as float16: half the bytes per tile
+        emb = self._normalized_f16([c.get('embedding') for c in concepts])
+        has_emb = np.array([c.get('embedding') is not None for c in concepts], dtype=bool)
+        
+        # Above-threshold pairs (i < j) between embedded concepts
+        rows, cols = self._similar_pairs(emb, sim_thresh)
+        keep = has_emb[rows] & has_emb[cols]
+        
+        # Cluster transitively: A~B and B~C puts A, B and C in one group
+        labels = _component_labels(
+            rows[keep].astype(np.int32),
+            cols[keep].astype(np.int32),
+            len(concepts)
+        )
+        
+        # Sort members by cluster, then importance (highest first), then
+        # position, so each cluster's canonical concept leads its run
+        n = len(concepts)
+        importance = np.fromiter((c.get('importance', 0) for c in concepts), dtype=np.float64, count=n)
+        order = np.lexsort((np.arange(n), -importance, labels))
+        sorted_labels = labels[order]
+        starts = np.flatnonzero(np.r_[True, sorted_labels[1:] != sorted_labels[:-1]])
+        members = np.split(order, starts[1:])
+        
+        # Merge each cluster, in order of its first member (np.unique lists
+        # clusters in the same ascending-label order as members)
+        _, first_member = np.unique(labels, return_index=True)
+        out = []
+        for k in np.argsort(first_member).tolist():
+            group = members[k].tolist()
+            best = concepts[group[0]]
             
             # Add aliases for merged concepts
-            aliases = list({g.get('name') for g in group if g is not best})
-            if aliases:
-                best['aliases'] = aliases
+            if len(group) > 1:
+                aliases = list({concepts[i].get('name') for i in group[1:]})
+                if aliases:
+                    best['aliases'] = aliases
             
             out.append(best)
         
         return out
     
+    @classmethod
+    def _similar_pairs(cls, emb: np.ndarray, sim_thresh: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find all row pairs whose cosine similarity reaches sim_thresh.
+        
+        Scores the upper triangle of emb @ emb.T in SIM_TILE x SIM_TILE tiles
+        and thresholds each tile immediately, so peak memory is one tile
+        (~1 MB in float32) rather than the full N x N matrix.
+        
+        Args:
+            emb: L2-normalized embedding matrix, shape (N, D)
+            sim_thresh: Similarity threshold
+            
+        Returns:
+            Tuple of int arrays (rows, cols) with rows[k] < cols[k]
+        """
+        n = emb.shape[0]
+        tile = cls.SIM_TILE
+        rows: List[np.ndarray] = [np.empty(0, dtype=np.intp)]
+        cols: List[np.ndarray] = [np.empty(0, dtype=np.intp)]
+        
+        for i in range(0, n, tile):
+            left = emb[i:i + tile].astype(np.float32)
+            for j in range(i, n, tile):
+                mask = (left @ emb[j:j + tile].astype(np.float32).T) >= sim_thresh
+                if i == j:
+                    # Diagonal tile: keep strictly-upper pairs only
+                    mask = np.triu(mask, k=1)
+                r, c = np.nonzero(mask)
+                rows.append(r + i)
+                cols.append(c + j)
+        
+        return np.concatenate(rows), np.concatenate(cols)
+    
+    @staticmethod
+    def _normalized_f16(vectors: List[Optional[List[float]]]) -> np.ndarray:
+        """
+        Stack embeddings into an L2-normalized float16 matrix.
+        
+        Normalization happens in float32 before the downcast, so a float32
+        dot product of two rows is their cosine similarity to ~1e-3, well
+        inside the margin of the dedup threshold. Missing vectors become
+        zero rows.
+        
+        Args:
+            vectors: Embedding per concept, or None when missing
+            
+        Returns:
+            float16 array of shape (N, D)
+        """
+        dim = next((len(v) for v in vectors if v is not None), 0)
+        mat = np.zeros((len(vectors), dim), dtype=np.float32)
+        for i, v in enumerate(vectors):
+            if v is not None and dim and len(v) == dim:
+                mat[i] = v
+        norms = np.linalg.norm(mat, axis=1, keepdims=True)
+        np.divide(mat, norms, out=mat, where=norms > 0)
+        return mat.astype(np.float16)
+    
     def extract_relationships_all(
         self,
         text: str,
@@ -347,7 +992,8 @@ Important:
             text: Original input text
             concepts: List of extracted concepts
             min_strength: Minimum relationship strength (0-1)
-            batch_size: Size of concept batches (for token safety)
+            batch_size: Maximum concepts per batch (batches are also capped
+                by RELATIONSHIP_BATCH_MAX_TOKENS)
             
         Returns:
             List of relationship dictionaries with keys:
@@ -363,16 +1009,19 @@ Important:
         if not concepts:
             return []
         
-        # Extract all concept names
-        all_names = [c.get('name', '') for c in concepts if c.get('name')]
+        # Extract all concept names and number them 0..N-1 once
+        name_index = self._name_index(concepts)
+        all_names = list(name_index)
         relationships: List[Dict[str, Any]] = []
+        # (source index, target index, type) of every edge kept so far
+        seen = set()
         
         # Build system prompt for relationship extraction
         system_prompt = """You identify relationships among a provided list of concepts.
 Return ALL meaningful edges you can justify from the text.
 
 Allowed types:
-- "is-a", "part-of", "related-to", "causes", "enables", "requires", "uses", "implements", "contrasts-with"
+- """ + _ALLOWED_TYPES_LINE + """
 
 For each relationship:
 - source: exact concept name
@@ -388,7 +1037,12 @@ Return ONLY JSON:
         names_context = "\n".join(f"- {n}" for n in all_names)
         
         # Process in batches (for token safety, not limiting output)
-        for batch in self._batch(all_names, size=batch_size):
+        batches = self._batch_by_tokens(
+            all_names,
+            max_items=batch_size,
+            max_tokens=self.RELATIONSHIP_BATCH_MAX_TOKENS
+        )
+        for batch in batches:
             user_prompt = f"""TEXT:
 {text}
 
@@ -402,7 +1056,8 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
             
             try:
                 # Call OpenAI API with JSON mode
-                response = self.client.chat.completions.create(
+                response = limited_create(
+                    self.client.chat.completions,
                     model=self.model,
                     response_format={"type": "json_object"},  # Enforce JSON output
                     messages=[
@@ -416,47 +1071,172 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
                 # Parse response
                 raw = response.choices[0].message.content
                 cleaned = self._clean_json_block(raw)
-                data = json.loads(cleaned)
+                data = orjson.loads(cleaned)
                 rels = data.get("relationships", [])
                 
                 # Ensure rels is a list
                 if not isinstance(rels, list):
-                    print(f"Warning: relationships is not a list, got {type(rels)}")
+                    logger.warning("relationships is not a list, got %s", type(rels))
                     rels = []
                 
-                # Filter by min_strength if requested
-                if min_strength > 0:
-                    rels = [r for r in rels if isinstance(r, dict) and r.get("strength", 0) >= min_strength]
-                
-                # Sanity check: only keep edges whose endpoints actually exist
-                keep = []
-                sset = set(all_names)
-                for r in rels:
-                    if not isinstance(r, dict):
-                        continue
-                    s, t = r.get("source", ""), r.get("target", "")
-                    if s in sset and t in sset and s != t:
-                        keep.append(r)
-                
-                relationships.extend(keep)
+                relationships.extend(
+                    self._filter_relationships(rels, name_index, seen, min_strength)
+                )
                 
             except json.JSONDecodeError as e:
                 # Safely log JSON errors without breaking
                 safe_preview = raw[:300].replace('"', "'") if 'raw' in locals() else 'N/A'
-                print(f"Relationship batch JSON parse failed: {e}. Preview: {safe_preview}")
+                logger.warning("Relationship batch JSON parse failed: %s. Preview: %s", e, safe_preview)
             except Exception as e:
-                print(f"Relationship batch failed: {str(e)}")
+                logger.warning("Relationship batch failed: %s", e)
         
-        # Deduplicate edges by (source, target, type)
-        seen = set()
-        unique = []
-        for r in relationships:
-            key = (r.get('source'), r.get('target'), r.get('type'))
+        return relationships
+    
+    def extract_relationships_batch(
+        self,
+        items: List[Dict[str, Any]],
+        min_strength: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Extract relationships for several small texts in one LLM call.
+        
+        Every {text, concepts} pair is JSON-encoded into a single prompt and
+        the model answers with one relationship list per item, so N short
+        documents cost one round trip instead of N. Meant for inputs that
+        fit a single prompt; use extract_relationships_all for long texts.
+        
+        Args:
+            items: Dicts with 'text' and 'concepts' (concept dicts as
+                returned by extract_concepts, or objects with a name attribute)
+            min_strength: Minimum relationship strength (0-1)
+            
+        Returns:
+            One list of relationship dictionaries per item, in input order
+            (same keys as extract_relationships_all)
+            
+        Raises:
+            Exception: If the API call fails or the response cannot be parsed
+        """
+        if not items:
+            return []
+        
+        name_indexes: List[Dict[str, int]] = []
+        payload = []
+        for i, item in enumerate(items):
+            name_index = self._name_index(item.get('concepts', []))
+            name_indexes.append(name_index)
+            payload.append({"id": i, "text": item.get('text', ''), "concepts": list(name_index)})
+        
+        system_prompt = """You identify relationships among provided lists of concepts.
+You receive several independent items, each with its own text and concept list.
+For each item, return ALL meaningful edges you can justify from that item's text,
+using only that item's concept names.
+
+Allowed types:
+- """ + _ALLOWED_TYPES_LINE + """
+
+For each relationship:
+- source: exact concept name
+- target: exact concept name
+- type: one of the above
+- strength: 0.0–1.0 (confidence)
+- description: one sentence rationale with evidence
+
+Return ONLY JSON, one entry per item id:
+{"results":[{"id":0,"relationships":[{...}]},{"id":1,"relationships":[...]}]}"""
+        
+        try:
+            response = limited_create(
+                self.client.chat.completions,
+                model=self.model,
+                response_format={"type": "json_object"},  # Enforce JSON output
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": f"ITEMS:\n{json.dumps(payload, ensure_ascii=False)}"},
+                ],
+                temperature=0.2,  # Low temperature for consistent extraction
+                max_tokens=8000
+            )
+            raw = response.choices[0].message.content
+            data = orjson.loads(self._clean_json_block(raw))
+        except Exception as e:
+            raise Exception(f"Batch relationship extraction failed: {str(e)}")
+        
+        results = data.get("results", [])
+        if not isinstance(results, list):
+            logger.warning("results is not a list, got %s", type(results))
+            results = []
+        
+        # Route each answer back to its item by id; items the model skipped get []
+        by_id: Dict[int, List[Any]] = {}
+        for entry in results:
+            if isinstance(entry, dict) and isinstance(entry.get("id"), int):
+                rels = entry.get("relationships", [])
+                by_id[entry["id"]] = rels if isinstance(rels, list) else []
+        
+        return [
+            self._filter_relationships(by_id.get(i, []), name_index, set(), min_strength)
+            for i, name_index in enumerate(name_indexes)
+        ]
+    
+    @staticmethod
+    def _name_index(concepts: List[Any]) -> Dict[str, int]:
+        """
+        Number the distinct concept names 0..N-1 in first-seen order.
+        
+        Accepts concept dicts or lightweight records with a name attribute
+        (e.g. slotted dataclasses), since only the name is needed here.
+        
+        Args:
+            concepts: Concept dicts or objects with a name
+            
+        Returns:
+            Concept name -> index, skipping concepts without a name
+        """
+        name_index: Dict[str, int] = {}
+        for c in concepts:
+            name = c.get('name') if isinstance(c, dict) else getattr(c, 'name', None)
+            if name:
+                name_index.setdefault(name, len(name_index))
+        return name_index
+    
+    @staticmethod
+    def _filter_relationships(
+        rels: List[Any],
+        name_index: Dict[str, int],
+        seen: set,
+        min_strength: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Keep well-formed relationships between known, distinct concepts.
+        
+        Edges are deduplicated by (source, target, type) against seen, which
+        is updated in place so it can be shared across batches.
+        
+        Args:
+            rels: Relationship objects as returned by the model
+            name_index: Concept name -> index for the allowed endpoints
+            seen: (source index, target index, type) of edges already kept
+            min_strength: Minimum relationship strength (0-1)
+            
+        Returns:
+            The relationships that passed, in their original order
+        """
+        kept = []
+        for r in rels:
+            if not isinstance(r, dict):
+                continue
+            if min_strength > 0 and r.get("strength", 0) < min_strength:
+                continue
+            s = name_index.get(r.get("source", ""))
+            t = name_index.get(r.get("target", ""))
+            if s is None or t is None or s == t:
+                continue
+            key = (s, t, r.get('type'))
             if key not in seen:
                 seen.add(key)
-                unique.append(r)
-        
-        return unique
+                kept.append(r)
+        return kept
     
     def generate_embedding(self, text: str) -> List[float]:
         """
@@ -471,9 +1251,15 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
         Raises:
             Exception: If embedding generation fails
         """
+        key = self._embedding_key(text)
+        cached = self._get_cached_embeddings([key])
+        if key in cached:
+            return cached[key].tolist()
+        
         try:
             # Call OpenAI embedding API
-            response = self.client.embeddings.create(
+            response = limited_create(
+                self.client.embeddings,
                 model=self.embedding_model,
                 input=text
             )
@@ -481,16 +1267,20 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
             # Extract embedding from response
             embedding = response.data[0].embedding
             
-            return embedding
-            
         except Exception as e:
             raise Exception(f"Embedding generation failed: {e}")
+        
+        self._cache_embeddings({key: embedding})
+        return embedding
     
     def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for multiple texts in a single API call.
         
         This is more efficient than calling generate_embedding() multiple times.
+        Only texts not already in the embedding cache are sent (each distinct
+        text once); inputs beyond MAX_EMBEDDING_BATCH are split into several
+        requests.
         
         Args:
             texts: List of text strings to generate embeddings for
@@ -504,20 +1294,51 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
         if not texts:
             return []
         
+        keys = [self._embedding_key(text) for text in texts]
+        found = self._get_cached_embeddings(keys)
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        
         try:
-            # Call OpenAI embedding API with batch
-            response = self.client.embeddings.create(
-                model=self.embedding_model,
-                input=texts
-            )
-            
-            # Extract embeddings from response
-            embeddings = [item.embedding for item in response.data]
-            
-            return embeddings
+            fresh: Dict[str, List[float]] = {}
+            # The embeddings endpoint accepts at most 2048 inputs per request
+            for batch in self._batch(list(missing.items()), size=self.MAX_EMBEDDING_BATCH):
+                response = limited_create(
+                    self.client.embeddings,
+                    model=self.embedding_model,
+                    input=[text for _, text in batch]
+                )
+                for (key, _), item in zip(batch, response.data):
+                    fresh[key] = item.embedding
             
         except Exception as e:
             raise Exception(f"Batch embedding generation failed: {e}")
+        
+        self._cache_embeddings(fresh)
+        return [fresh[key] if key in fresh else found[key].tolist() for key in keys]
+    
+    def _embedding_key(self, text: str) -> str:
+        """Embedding cache key for a text under the current embedding model."""
+        return hashlib.sha1(f"{self.embedding_model}\0{text}".encode()).hexdigest()
+    
+    def _get_cached_embeddings(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Return cached embeddings for the given keys (misses are left out)."""
+        found = {}
+        with self._embedding_lock:
+            for key in keys:
+                vector = self._embedding_cache.get(key)
+                if vector is not None:
+                    self._embedding_cache.move_to_end(key)
+                    found[key] = vector
+        return found
+    
+    def _cache_embeddings(self, embeddings: Dict[str, List[float]]) -> None:
+        """Store embeddings, evicting the least recently used beyond the cache size."""
+        with self._embedding_lock:
+            for key, embedding in embeddings.items():
+                self._embedding_cache[key] = np.asarray(embedding, dtype=np.float32)
+                self._embedding_cache.move_to_end(key)
+            while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
     
     def add_embeddings_to_concepts(
         self, 
@@ -556,7 +1377,7 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
             
         except Exception as e:
             # Log error but don't fail - return concepts without embeddings
-            print(f"Warning: Failed to add embeddings: {e}")
+            logger.warning("Failed to add embeddings: %s", e)
             return concepts
     
     @staticmethod
@@ -610,193 +1431,143 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
         if not concepts:
             return concepts, relationships
         
-        if len(concepts) == 1:
-            # Single concept - mark as tier 1
-            concepts[0]['tier'] = 1
-            concepts[0]['connections'] = 0
-            return concepts, relationships
+        _, new_relationships = self._connect_and_tier(concepts, relationships)
+        return concepts, relationships + new_relationships
+    
+    def _connect_and_tier(
+        self,
+        concepts: List[Dict[str, Any]],
+        relationships: List[Dict[str, Any]]
+    ) -> tuple[ConceptTable, List[Dict[str, Any]]]:
+        """
+        Bridge disconnected components and assign tiers on a ConceptTable.
         
-        # Step 1: Build adjacency structure for connectivity analysis
-        concept_names = {c['name']: i for i, c in enumerate(concepts)}
-        concept_connections = {c['name']: 0 for c in concepts}
-        adjacency = {c['name']: set() for c in concepts}
-        
-        # Build adjacency list (undirected)
-        for rel in relationships:
-            source = rel.get('source', '')
-            target = rel.get('target', '')
-            if source in concept_names and target in concept_names:
-                adjacency[source].add(target)
-                adjacency[target].add(source)
-                concept_connections[source] += 1
-                concept_connections[target] += 1
-        
-        # Step 2: Find connected components using BFS
-        def find_connected_components():
-            visited = set()
-            components = []
-            
-            for concept in concepts:
-                name = concept['name']
-                if name not in visited:
-                    # BFS to find component
-                    component = set()
-                    queue = [name]
-                    
-                    while queue:
-                        current = queue.pop(0)
-                        if current not in visited:
-                            visited.add(current)
-                            component.add(current)
-                            # Add unvisited neighbors
-                            for neighbor in adjacency[current]:
-                                if neighbor not in visited:
-                                    queue.append(neighbor)
-                    
-                    components.append(component)
-            
-            return components
+        Components are labelled by an array union-find kernel (JIT-compiled
+        when Numba is installed), and bridge candidates are scored with one
+        matrix product per component instead of pairwise cosine calls. Tier and connection counts are
+        written back onto the concept dictionaries.
+        
+        Args:
+            concepts: Non-empty list of concept dictionaries
+            relationships: List of relationship dictionaries
+            
+        Returns:
+            Tuple of (concept table, inferred relationships to append)
+        """
+        tbl = ConceptTable.from_concepts(concepts)
+        
+        if len(tbl) == 1:
+            # Single concept - mark as tier 1
+            tbl.tiers[0] = 1
+            tbl.write_back(concepts)
+            return tbl, []
+        
+        # Step 1: Encode explicit relationships as index arrays (undirected)
+        concept_index: Dict[str, int] = {}
+        for i, name in enumerate(tbl.names.tolist()):
+            concept_index.setdefault(name, i)
+        pairs = [
+            (concept_index[rel.get('source', '')], concept_index[rel.get('target', '')])
+            for rel in relationships
+            if rel.get('source', '') in concept_index and rel.get('target', '') in concept_index
+        ]
+        edges = np.array(pairs, dtype=np.int32).reshape(-1, 2)
+        src, dst = edges[:, 0], edges[:, 1]
+        tbl.connections += np.bincount(src, minlength=len(tbl)).astype(np.int32)
+        tbl.connections += np.bincount(dst, minlength=len(tbl)).astype(np.int32)
+        
+        # Step 2: Label the connected components
+        comp_id = _component_labels(src, dst, len(tbl))
+        sizes = np.bincount(comp_id)
+        members = np.split(np.argsort(comp_id, kind='stable'), np.cumsum(sizes)[:-1])
+        remaining = len(sizes)
+        logger.debug("Found %d connected component(s)", remaining)
         
         # Step 3: Connect all components into ONE graph
         new_relationships = []
-        components = find_connected_components()
-        
-        print(f"Found {len(components)} connected component(s)")
         
-        # If multiple components exist, connect them
-        if len(components) > 1:
+        def add_bridge(s: int, t: int, strength: float, description: str):
+            new_relationships.append({
+                'source': concepts[s]['name'],
+                'target': concepts[t]['name'],
+                'type': 'related-to',
+                'strength': strength,
+                'description': description,
+                'inferred': True
+            })
+            tbl.connections[s] += 1
+            tbl.connections[t] += 1
+        
+        if remaining > 1:
             # Strategy: Connect each component to the main (largest) component
-            main_component = max(components, key=len)
+            main = int(np.argmax(sizes))
+            main_idx = members[main]
+            main_embedded = main_idx[tbl.has_embedding[main_idx]]
+            fallback_src, fallback_dst = _pick_repair_edges(comp_id, tbl.importances, main)
             
-            for component in components:
-                if component == main_component:
-                    continue
-                
+            for k, comp_idx in enumerate(m for label, m in enumerate(members) if label != main):
                 # Find best connection between this component and main component
-                best_source = None
-                best_target = None
-                best_similarity = -1
-                
-                for source_name in component:
-                    source_concept = next(c for c in concepts if c['name'] == source_name)
-                    
-                    if 'embedding' in source_concept:
-                        for target_name in main_component:
-                            target_concept = next(c for c in concepts if c['name'] == target_name)
-                            
-                            if 'embedding' in target_concept:
-                                similarity = self.cosine_similarity(
-                                    source_concept['embedding'],
-                                    target_concept['embedding']
-                                )
-                                if similarity > best_similarity:
-                                    best_similarity = similarity
-                                    best_source = source_name
-                                    best_target = target_name
+                comp_embedded = comp_idx[tbl.has_embedding[comp_idx]]
                 
-                # Create bridge connection
-                if best_source and best_target:
-                    new_relationships.append({
-                        'source': best_source,
-                        'target': best_target,
-                        'type': 'related-to',
-                        'strength': max(0.5, float(best_similarity * 0.8)),
-                        'description': f'Bridge connection (component merge)',
-                        'inferred': True
-                    })
-                    # Update adjacency
-                    adjacency[best_source].add(best_target)
-                    adjacency[best_target].add(best_source)
+                if comp_embedded.size and main_embedded.size:
+                    sims = tbl.embeddings[comp_embedded] @ tbl.embeddings[main_embedded].T
+                    r, c = np.unravel_index(int(np.argmax(sims)), sims.shape)
+                    add_bridge(
+                        int(comp_embedded[r]),
+                        int(main_embedded[c]),
+                        max(0.5, float(sims[r, c] * 0.8)),
+                        'Bridge connection (component merge)'
+                    )
                 else:
                     # Fallback: connect highest importance from each
-                    source_concept = max(
-                        [c for c in concepts if c['name'] in component],
-                        key=lambda x: x.get('importance', 0)
-                    )
-                    target_concept = max(
-                        [c for c in concepts if c['name'] in main_component],
-                        key=lambda x: x.get('importance', 0)
-                    )
-                    new_relationships.append({
-                        'source': source_concept['name'],
-                        'target': target_concept['name'],
-                        'type': 'related-to',
-                        'strength': 0.6,
-                        'description': 'Bridge connection (fallback)',
-                        'inferred': True
-                    })
-        
-        # Step 4: Ensure isolated nodes are connected
-        # Re-check connectivity after adding bridges
-        for rel in new_relationships:
-            source = rel.get('source', '')
-            target = rel.get('target', '')
-            if source in concept_connections:
-                concept_connections[source] += 1
-            if target in concept_connections:
-                concept_connections[target] += 1
-        
-        # Find any remaining isolated nodes
-        isolated = [c for c in concepts if concept_connections[c['name']] == 0]
-        
-        for isolated_concept in isolated:
-            # Connect to nearest neighbor by embedding similarity
-            if 'embedding' in isolated_concept:
-                best_match = None
-                best_similarity = -1
-                
-                for concept in concepts:
-                    if concept['name'] != isolated_concept['name'] and 'embedding' in concept:
-                        similarity = self.cosine_similarity(
-                            isolated_concept['embedding'],
-                            concept['embedding']
-                        )
-                        if similarity > best_similarity:
-                            best_similarity = similarity
-                            best_match = concept
-                
-                if best_match:
-                    new_relationships.append({
-                        'source': isolated_concept['name'],
-                        'target': best_match['name'],
-                        'type': 'related-to',
-                        'strength': max(0.5, float(best_similarity * 0.8)),
-                        'description': 'Connectivity link',
-                        'inferred': True
-                    })
-                    concept_connections[isolated_concept['name']] += 1
-                    concept_connections[best_match['name']] += 1
+                    add_bridge(int(fallback_src[k]), int(fallback_dst[k]), 0.6, 'Bridge connection (fallback)')
+                remaining -= 1
+        
+        # Step 4: Connect any node still without edges to its nearest neighbor
+        isolated = np.flatnonzero((tbl.connections == 0) & tbl.has_embedding)
+        for i in isolated.tolist():
+            if tbl.connections[i] > 0:
+                continue
+            sims = tbl.embeddings @ tbl.embeddings[i]
+            sims[~tbl.has_embedding] = -np.inf
+            sims[i] = -np.inf
+            best_match = int(np.argmax(sims))
+            if np.isfinite(sims[best_match]):
+                add_bridge(i, best_match, max(0.5, float(sims[best_match] * 0.8)), 'Connectivity link')
         
         # Step 5: Assign tiers based on importance + connectivity
-        for concept in concepts:
-            importance = concept.get('importance', 0.5)
-            connections = concept_connections[concept['name']]
-            
-            # Core concepts: high importance (>0.7) OR well-connected (>=2 connections)
-            if importance > 0.7 or connections >= 2:
-                concept['tier'] = 1
-            else:
-                concept['tier'] = 2
-            
-            # Store connection count
-            concept['connections'] = connections
+        # Core concepts: high importance (>0.7) OR well-connected (>=2 connections)
+        core = (tbl.importances > 0.7) | (tbl.connections >= 2)
+        tbl.tiers[:] = np.where(core, 1, 2)
         
         # Step 6: Ensure at least one tier-1 concept exists
-        tier1_concepts = [c for c in concepts if c.get('tier') == 1]
-        if not tier1_concepts and concepts:
+        if not core.any():
             # Promote the highest importance concept to tier 1
-            highest = max(concepts, key=lambda x: x.get('importance', 0))
-            highest['tier'] = 1
+            tbl.tiers[int(np.argmax(tbl.importances))] = 1
         
-        # Combine all relationships
-        enhanced_relationships = relationships + new_relationships
+        tbl.write_back(concepts)
         
-        # Verify connectivity
-        final_components = find_connected_components()
-        print(f"Final graph has {len(final_components)} connected component(s) - Target: 1")
-        print(f"Added {len(new_relationships)} inferred relationships for connectivity")
+        logger.debug("Final graph has %d connected component(s) - Target: 1", remaining)
+        logger.debug("Added %d inferred relationships for connectivity", len(new_relationships))
         
-        return concepts, enhanced_relationships
+        return tbl, new_relationships
+    
+    def _split_for_extraction(self, text: str) -> List[str]:
+        """
+        Split text into the chunks sent to concept extraction.
+        
+        Args:
+            text: Validated input text
+            
+        Returns:
+            List of chunks (the whole text for short inputs)
+        """
+        # Optimization: Skip chunking for short texts (single LLM call is faster).
+        # Decided on real token count near the limit so token-dense text is
+        # not over-chunked; long texts skip encoding entirely.
+        if self._under_token_limit(text, self.SINGLE_PASS_MAX_TOKENS):
+            return [text]
+        return self._chunk(text) or [text]
     
     def process_text(
         self,
@@ -804,7 +1575,9 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
         min_importance: float = 0.0,  # LLM decides; keep everything by default
         min_strength: float = 0.0,    # Keep all edges by default
         extract_rels: bool = True,
-        generate_embeddings: bool = True
+        generate_embeddings: bool = True,
+        batch: bool = False,
+        on_concept: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Process text with NO artificial caps - unlimited concepts and edges.
@@ -822,6 +1595,12 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
             min_strength: Minimum strength score (0-1) for relationships
             extract_rels: Whether to extract relationships (default: True)
             generate_embeddings: Whether to generate embeddings (default: True)
+            batch: Run extraction and embeddings through the Batch API
+                (half price, minutes-to-hours latency; see process_text_batch)
+            on_concept: Called with each raw concept as extraction streams it,
+                before dedup and merging (not supported with batch=True).
+                Chunks are extracted concurrently, so it may be called from
+                several threads at once
             
         Returns:
             Dictionary containing:
@@ -833,37 +1612,210 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
             ValueError: If text validation fails
             Exception: If processing fails
         """
+        if batch:
+            return self.process_text_batch(
+                [text],
+                min_importance=min_importance,
+                min_strength=min_strength,
+                extract_rels=extract_rels,
+                generate_embeddings=generate_embeddings
+            )[0]
+        
         # Validate input
-        is_valid, error_msg = self.validate_text_input(text)
+        is_valid, _, error_msg = self.validate_text_input(text)
         if not is_valid:
             raise ValueError(error_msg)
         
         # Step 1: Chunk for comprehensive recall
-        # Optimization: Skip chunking for texts < 3000 chars (single LLM call is faster)
-        if len(text) < 3000:
-            chunks = [text]
+        chunks = self._split_for_extraction(text)
+        
+        logger.debug("Processing %d chunk(s) for %d characters", len(chunks), len(text))
+        
+        # Step 2: Extract ALL concepts per chunk (no limits). Chunks are
+        # independent, so their LLM calls run concurrently and the step takes
+        # about as long as the slowest chunk; results keep chunk order.
+        def extract_chunk(chunk: str) -> List[Dict[str, Any]]:
+            chunk_concepts = self.extract_concepts(
+                chunk,
+                min_importance=min_importance,
+                embed=generate_embeddings,
+                on_concept=on_concept
+            )
+            logger.debug("Found %d concepts in a %d-character chunk", len(chunk_concepts), len(chunk))
+            return chunk_concepts
+        
+        if len(chunks) == 1:
+            per_chunk = [extract_chunk(chunks[0])]
         else:
-            chunks = self._chunk(text)
-            if not chunks:
-                chunks = [text]
+            with ThreadPoolExecutor(max_workers=min(self.EXTRACT_WORKERS, len(chunks))) as pool:
+                per_chunk = list(pool.map(extract_chunk, chunks))
+        
+        concepts_all: List[Dict[str, Any]] = [c for chunk_concepts in per_chunk for c in chunk_concepts]
+        
+        # Short-text fast path: one chunk with a handful of concepts has no
+        # cross-chunk duplicates to merge and little structure to repair
+        fast_path = (
+            self.fast_path
+            and len(chunks) == 1
+            and len(concepts_all) <= self.FAST_PATH_MAX_CONCEPTS
+        )
+        
+        return self._finish_pipeline(
+            text,
+            len(chunks),
+            concepts_all,
+            min_strength=min_strength,
+            extract_rels=extract_rels,
+            generate_embeddings=generate_embeddings,
+            fast_path=fast_path
+        )
+    
+    def process_text_batch(
+        self,
+        texts: List[str],
+        min_importance: float = 0.0,
+        min_strength: float = 0.0,
+        extract_rels: bool = True,
+        generate_embeddings: bool = True,
+        poll_interval: float = 15.0,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process many texts through the OpenAI Batch API.
+        
+        Concept extraction for every chunk of every text goes out as one
+        chat-completion batch, and all concept embeddings as one embeddings
+        batch. Batch jobs cost half as much and do not consume on-demand rate
+        limits, but take minutes to hours, so this is for offline corpora only.
+        Relationship extraction still runs on demand because each text's
+        batches depend on its merged concept list.
+        
+        Args:
+            texts: Input texts to process
+            min_importance: Minimum importance score (0-1) for concepts
+            min_strength: Minimum strength score (0-1) for relationships
+            extract_rels: Whether to extract relationships (default: True)
+            generate_embeddings: Whether to generate embeddings (default: True)
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for each batch job (None waits for the window)
+            
+        Returns:
+            One process_text()-shaped result per input text, in input order.
+            Chunks whose batch request failed are skipped and counted in
+            metadata['failed_chunks'].
+            
+        Raises:
+            ValueError: If any text fails validation
+            Exception: If a batch job fails or times out
+        """
+        for text in texts:
+            is_valid, _, error_msg = self.validate_text_input(text)
+            if not is_valid:
+                raise ValueError(error_msg)
         
-        print(f"Processing {len(chunks)} chunk(s) for {len(text)} characters")
+        if not texts:
+            return []
         
-        # Step 2: Extract ALL concepts per chunk (no limits)
-        concepts_all: List[Dict[str, Any]] = []
-        for i, chunk in enumerate(chunks):
-            print(f"  Extracting concepts from chunk {i+1}/{len(chunks)}...")
-            chunk_concepts = self.extract_concepts(chunk, min_importance=min_importance)
-            print(f"    Found {len(chunk_concepts)} concepts")
-            concepts_all.extend(chunk_concepts)
+        # Step 1: One chat-completion batch for every chunk of every text
+        chunks_per_text = [self._split_for_extraction(text) for text in texts]
+        requests = [
+            {"custom_id": f"t{i}-c{j}", "body": self._extraction_request(chunk)}
+            for i, chunks in enumerate(chunks_per_text)
+            for j, chunk in enumerate(chunks)
+        ]
+        logger.info("Submitting extraction batch: %d chunk(s) across %d text(s)", len(requests), len(texts))
+        batch_id = submit_batch(self.client, requests, endpoint="/v1/chat/completions")
+        bodies = wait_for_batch(self.client, batch_id, poll_interval=poll_interval, timeout=timeout)
+        
+        concepts_per_text: List[List[Dict[str, Any]]] = []
+        failed_per_text: List[int] = []
+        for i, chunks in enumerate(chunks_per_text):
+            concepts: List[Dict[str, Any]] = []
+            failed = 0
+            for j in range(len(chunks)):
+                body = bodies.get(f"t{i}-c{j}")
+                try:
+                    raw = body["choices"][0]["message"]["content"]
+                    concepts.extend(self._parse_concepts(raw, min_importance))
+                except Exception:
+                    failed += 1
+            concepts_per_text.append(concepts)
+            failed_per_text.append(failed)
+        
+        # Step 2: One embeddings batch for every extracted concept
+        if generate_embeddings:
+            pending = [c for concepts in concepts_per_text for c in concepts]
+            if pending:
+                texts_to_embed = [f"{c.get('name','')}: {c.get('description','')}" for c in pending]
+                requests = [
+                    {
+                        "custom_id": f"e{k}",
+                        "body": {"model": self.embedding_model, "input": group}
+                    }
+                    for k, group in enumerate(self._batch(texts_to_embed, size=self.MAX_EMBEDDING_BATCH))
+                ]
+                logger.info("Submitting embedding batch: %d concept(s)", len(pending))
+                batch_id = submit_batch(self.client, requests, endpoint="/v1/embeddings")
+                bodies = wait_for_batch(self.client, batch_id, poll_interval=poll_interval, timeout=timeout)
+                
+                for k, group in enumerate(self._batch(pending, size=self.MAX_EMBEDDING_BATCH)):
+                    body = bodies.get(f"e{k}")
+                    if not body:
+                        # Left without a vector; the merge step embeds these on demand
+                        continue
+                    for c, item in zip(group, body.get("data", [])):
+                        c['embedding'] = item["embedding"]
+        
+        # Steps 3-6 per text (embeddings are already attached, so merge makes no calls)
+        results = []
+        for text, chunks, concepts, failed in zip(texts, chunks_per_text, concepts_per_text, failed_per_text):
+            result = self._finish_pipeline(
+                text,
+                len(chunks),
+                concepts,
+                min_strength=min_strength,
+                extract_rels=extract_rels,
+                generate_embeddings=generate_embeddings
+            )
+            result["metadata"]["batch_api"] = True
+            result["metadata"]["failed_chunks"] = failed
+            results.append(result)
         
+        return results
+    
+    def _finish_pipeline(
+        self,
+        text: str,
+        chunk_count: int,
+        concepts_all: List[Dict[str, Any]],
+        min_strength: float,
+        extract_rels: bool,
+        generate_embeddings: bool,
+        fast_path: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run dedup, relationships and hierarchy on extracted concepts.
+        
+        Args:
+            text: Original input text
+            chunk_count: Number of chunks the text was split into
+            concepts_all: Concepts extracted from all chunks
+            min_strength: Minimum strength score (0-1) for relationships
+            extract_rels: Whether to extract relationships
+            generate_embeddings: Whether to generate embeddings
+            fast_path: Skip semantic dedup and connectivity repair; every
+                concept becomes tier 1 (exact-name dedup still runs)
+            
+        Returns:
+            process_text() result dictionary
+        """
         # Step 3: Embed & merge duplicates semantically
-        print(f"  Total concepts before deduplication: {len(concepts_all)}")
-        if generate_embeddings and concepts_all:
-            print(f"  Generating embeddings and merging duplicates...")
+        logger.debug("Total concepts before deduplication: %d", len(concepts_all))
+        if generate_embeddings and concepts_all and not fast_path:
+            logger.debug("Generating embeddings and merging duplicates")
             # _merge_dupes_by_embedding will generate embeddings if missing
             concepts_all = self._merge_dupes_by_embedding(concepts_all, sim_thresh=0.87)
-            print(f"  Concepts after deduplication: {len(concepts_all)}")
+            logger.debug("Concepts after deduplication: %d", len(concepts_all))
         else:
             # Minimal fallback: dedupe by exact name match
             seen_names = set()
@@ -878,26 +1830,35 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
         # Step 4: Extract ALL relationships across concepts (batched for token safety)
         relationships: List[Dict[str, Any]] = []
         if extract_rels and concepts_all:
-            print(f"  Extracting relationships for {len(concepts_all)} concepts...")
+            logger.debug("Extracting relationships for %d concepts", len(concepts_all))
             relationships = self.extract_relationships_all(
                 text=text,
                 concepts=concepts_all,
                 min_strength=min_strength,
             )
-            print(f"  Found {len(relationships)} relationships")
+            logger.debug("Found %d relationships", len(relationships))
         
         # Step 5: Build hierarchy and ensure connectivity
         # This ensures a single connected graph with proper tiers
-        if concepts_all:
-            concepts_all, relationships = self.build_hierarchy_and_connectivity(
-                concepts_all,
-                relationships
-            )
-        
-        # Step 6: Gather metadata
-        tier1_count = sum(1 for c in concepts_all if c.get('tier') == 1)
-        tier2_count = sum(1 for c in concepts_all if c.get('tier') == 2)
+        tier1_count = tier2_count = 0
         inferred_rels = sum(1 for r in relationships if r.get('inferred', False))
+        if concepts_all and fast_path:
+            degree: Dict[str, int] = {}
+            for r in relationships:
+                for end in (r.get('source'), r.get('target')):
+                    degree[end] = degree.get(end, 0) + 1
+            for c in concepts_all:
+                c['tier'] = 1
+                c['connections'] = degree.get(c['name'], 0)
+            tier1_count = len(concepts_all)
+        elif concepts_all:
+            tbl, bridges = self._connect_and_tier(concepts_all, relationships)
+            relationships = relationships + bridges
+            inferred_rels += len(bridges)
+            
+            # Step 6: Gather metadata from the table columns
+            tier1_count = int((tbl.tiers == 1).sum())
+            tier2_count = int((tbl.tiers == 2).sum())
         
         # Build response
         response = {
@@ -914,9 +1875,10 @@ Return JSON with ALL edges you can justify. No arbitrary limits."""
                 "tier2_concepts": tier2_count,
                 "input_length": len(text),
                 "embeddings_generated": bool(generate_embeddings),
-                "hierarchy_enabled": True,
-                "connectivity_ensured": True,
-                "chunk_count": len(chunks)
+                "hierarchy_enabled": not fast_path,
+                "connectivity_ensured": not fast_path,
+                "fast_path": fast_path,
+                "chunk_count": chunk_count
             }
         }
         
@@ -0,0 +1,209 @@
+"""
+Record/replay of OpenAI responses for the LLM and text-processing test suites.
+
+By default every OpenAI call made through limited_create() or
+alimited_create() is answered from a JSON cassette in
+api/tests/cassettes/<name>.json, keyed by a hash of the request, so the
+suites run offline in a few seconds.
+
+    LLM_LIVE=1                 call OpenAI, leave cassettes untouched
+    LLM_LIVE=1 LLM_RECORD=1    call OpenAI and (re)write the cassette
+
+Prompts are built from the replayed extraction output, so a cassette must be
+recorded by running the whole suite, not a single test.
+"""
+
+import hashlib
+import json
+import os
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from unittest import mock
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+# Modules that bind limited_create by name at import time
+PATCHED_MODULES = ("api.services.llm_service", "api.services.text_processing")
+
+# Modules that bind alimited_create by name at import time
+ASYNC_PATCHED_MODULES = ("api.services.llm_service",)
+
+
+def is_live() -> bool:
+    """Whether LLM calls should go to OpenAI."""
+    return os.getenv("LLM_LIVE") == "1"
+
+
+def is_recording() -> bool:
+    """Whether live responses should be written back to the cassette."""
+    return is_live() and os.getenv("LLM_RECORD") == "1"
+
+
+def request_key(kwargs: Dict[str, Any]) -> str:
+    """
+    Hash the parts of a create() call that determine the response.
+
+    Args:
+        kwargs: Keyword arguments passed to resource.create
+
+    Returns:
+        Short hex digest used as the cassette key
+    """
+    payload = {k: v for k, v in kwargs.items() if k not in ("timeout", "extra_headers")}
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class Cassette:
+    """Recorded responses for one test module."""
+
+    def __init__(self, name: str):
+        """
+        Load the cassette file if it exists.
+
+        Args:
+            name: Cassette name, usually the test module name
+        """
+        self.name = name
+        self.path = CASSETTE_DIR / f"{name}.json"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        self._dirty = False
+
+    def replay(self, kwargs: Dict[str, Any]) -> Any:
+        """
+        Return the recorded SDK object for a request.
+
+        Args:
+            kwargs: Keyword arguments of the create() call
+
+        Returns:
+            ChatCompletion, CreateEmbeddingResponse, or an iterator of
+            ChatCompletionChunk for streamed calls
+
+        Raises:
+            LookupError: If the request was never recorded
+        """
+        key = request_key(kwargs)
+        entry = self.entries.get(key)
+        if entry is None:
+            raise LookupError(
+                f"No recorded response for request {key} in {self.path.name}; "
+                f"re-record with LLM_LIVE=1 LLM_RECORD=1"
+            )
+        return _rebuild(entry)
+
+    def record(self, kwargs: Dict[str, Any], response: Any) -> Any:
+        """
+        Store a live response and return it (or a re-iterable copy if streamed).
+
+        Args:
+            kwargs: Keyword arguments of the create() call
+            response: Object returned by the SDK
+
+        Returns:
+            The response, ready for the caller to consume
+        """
+        key = request_key(kwargs)
+        if kwargs.get("stream"):
+            chunks = [chunk.model_dump(mode="json") for chunk in response]
+            self.entries[key] = {"kind": "chat_stream", "data": chunks}
+        elif "input" in kwargs:
+            self.entries[key] = {"kind": "embedding", "data": response.model_dump(mode="json")}
+        else:
+            self.entries[key] = {"kind": "chat", "data": response.model_dump(mode="json")}
+        self._dirty = True
+        return _rebuild(self.entries[key])
+
+    def save(self) -> None:
+        """Write recorded entries to disk if anything changed."""
+        if not self._dirty:
+            return
+        CASSETTE_DIR.mkdir(exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=1, sort_keys=True), encoding="utf-8")
+        self._dirty = False
+
+
+def _rebuild(entry: Dict[str, Any]) -> Any:
+    """Turn a stored cassette entry back into SDK response objects."""
+    from openai.types import CreateEmbeddingResponse
+    from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+    if entry["kind"] == "chat_stream":
+        chunks: List[Any] = [ChatCompletionChunk.model_validate(c) for c in entry["data"]]
+        return iter(chunks)
+    if entry["kind"] == "embedding":
+        return CreateEmbeddingResponse.model_validate(entry["data"])
+    return ChatCompletion.model_validate(entry["data"])
+
+
+class _AsyncChunks:
+    """Async view of replayed stream chunks, shaped like the SDK's AsyncStream."""
+
+    def __init__(self, chunks: Iterator[Any]):
+        self._chunks = chunks
+
+    def __aiter__(self) -> "_AsyncChunks":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def close(self) -> None:
+        pass
+
+
+@contextmanager
+def use_cassette(name: str) -> Iterator[Cassette]:
+    """
+    Route OpenAI calls through a cassette for the duration of the block.
+
+    Does nothing beyond yielding the cassette when LLM_LIVE=1 without
+    LLM_RECORD=1.
+
+    Args:
+        name: Cassette name (file api/tests/cassettes/<name>.json)
+
+    Yields:
+        The active Cassette
+    """
+    import importlib
+
+    from api.services.rate_limit import alimited_create, limited_create
+
+    cassette = Cassette(name)
+    if is_live() and not is_recording():
+        yield cassette
+        return
+
+    def fake_limited_create(resource: Any, max_attempts: int = 5, **kwargs) -> Any:
+        if is_recording():
+            return cassette.record(kwargs, limited_create(resource, max_attempts, **kwargs))
+        return cassette.replay(kwargs)
+
+    async def fake_alimited_create(resource: Any, max_attempts: int = 5, **kwargs) -> Any:
+        if is_recording():
+            response = await alimited_create(resource, max_attempts, **kwargs)
+            if kwargs.get("stream"):
+                response = [chunk async for chunk in response]
+            result = cassette.record(kwargs, response)
+        else:
+            result = cassette.replay(kwargs)
+        return _AsyncChunks(result) if kwargs.get("stream") else result
+
+    with ExitStack() as stack:
+        for module_name in PATCHED_MODULES:
+            module = importlib.import_module(module_name)
+            stack.enter_context(mock.patch.object(module, "limited_create", fake_limited_create))
+        for module_name in ASYNC_PATCHED_MODULES:
+            module = importlib.import_module(module_name)
+            stack.enter_context(mock.patch.object(module, "alimited_create", fake_alimited_create))
+        try:
+            yield cassette
+        finally:
+            cassette.save()
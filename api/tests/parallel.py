@@ -0,0 +1,81 @@
+"""
+Concurrent runner for the script-style test suites.
+
+The test functions in the script-style files (test_llm_api.py,
+test_llm_service.py, test_relationships.py, test_models.py) are
+independent, and the LLM ones spend nearly all their time waiting on
+OpenAI, so main() runs them at the same time with asyncio.gather over
+worker threads: the suite takes about as long as its slowest test instead
+of the sum.
+
+Each test's printed output is buffered in memory and the whole report is
+written to stdout in one call afterwards, in test order, so it reads the
+same as a serial run without a write per printed line. Set
+LLM_TESTS_SERIAL=1 to run one test at a time (e.g. when debugging with
+breakpoints).
+"""
+
+import asyncio
+import io
+import os
+import sys
+import threading
+from typing import Any, Callable, List, Sequence
+
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout stand-in that sends each worker thread's writes to its own buffer."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        return buffer
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self._fallback).write(text)
+
+    def flush(self) -> None:
+        getattr(self._local, "buffer", self._fallback).flush()
+
+
+def run_tests(tests: Sequence[Callable[..., bool]], *args: Any) -> List[bool]:
+    """
+    Run script-style test functions and return their results in order.
+
+    Args:
+        tests: Functions returning True on success
+        *args: Arguments passed to every test (e.g. a shared TestClient)
+
+    Returns:
+        One result per test, in the order given
+    """
+    if os.getenv("LLM_TESTS_SERIAL") == "1":
+        return [test(*args) for test in tests]
+
+    real_stdout = sys.stdout
+    output = _ThreadOutput(real_stdout)
+
+    def run_one(test: Callable[..., bool]):
+        buffer = output.capture()
+        try:
+            return test(*args), buffer.getvalue()
+        except Exception as e:
+            return False, buffer.getvalue() + f"✗ {test.__name__} raised: {e}\n"
+
+    async def run_all():
+        return await asyncio.gather(*(asyncio.to_thread(run_one, test) for test in tests))
+
+    sys.stdout = output
+    try:
+        outcomes = asyncio.run(run_all())
+    finally:
+        sys.stdout = real_stdout
+
+    # One write for the whole report instead of one per test
+    real_stdout.write("".join(text for _, text in outcomes))
+    real_stdout.flush()
+    return [ok for ok, _ in outcomes]
@@ -6,6 +6,7 @@ Tests:
 2. Text processing endpoint with valid input
 3. Text processing endpoint with invalid input
 4. Response format validation
+5. Streaming text processing endpoint (server-sent events)
 
 Run from project root: python api/tests/test_api.py
 Or use pytest: pytest api/tests/test_api.py
@@ -279,6 +280,73 @@ def test_with_embeddings():
         return False
 
 
+def test_process_stream():
+    """Test the streaming text processing endpoint (server-sent events)."""
+    print("\n" + "=" * 60)
+    print("Testing Streaming Text Processing")
+    print("=" * 60)
+    
+    text = """
+    Python is a high-level programming language used for web development and data
+    science. Django and Flask are web frameworks written in Python. NumPy and Pandas
+    are libraries for numerical computing and data analysis. Together they make Python
+    a popular choice for building data-driven web applications.
+    """
+    
+    try:
+        import json
+        
+        print("  → Streaming concepts...")
+        
+        events = []
+        with client.stream(
+            "POST",
+            "/api/py/text/process/stream",
+            json={"text": text, "extract_relationships": True, "generate_embeddings": False}
+        ) as response:
+            if response.status_code != 200:
+                print(f"✗ Stream failed with status {response.status_code}")
+                return False
+            event = None
+            for line in response.iter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: "):
+                    events.append((event, json.loads(line[len("data: "):])))
+        
+        names = [name for name, _ in events]
+        concepts = [payload for name, payload in events if name == "concept"]
+        print(f"✓ Received {len(concepts)} concept events")
+        
+        if names[-1:] != ["done"] or names.count("done") != 1:
+            print(f"✗ Expected a single final done event, got: {names[-3:]}")
+            return False
+        
+        if not concepts:
+            print("✗ Expected concept events before the done event")
+            return False
+        
+        if any('name' not in c or 'embedding' in c for c in concepts):
+            print("✗ Concept events should carry a name and no embedding")
+            return False
+        print(f"✓ First concept: {concepts[0]['name']}")
+        
+        done = events[-1][1]
+        for field in ['graph_id', 'nodes', 'edges', 'metadata']:
+            if field not in done:
+                print(f"✗ Missing '{field}' in done event")
+                return False
+        print(f"✓ Done event has graph {done['graph_id']} with {len(done['nodes'])} nodes")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Streaming test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """Run all API tests."""
     print("\n" + "=" * 60)
@@ -290,6 +358,7 @@ def main():
     process_ok = test_text_processing_endpoint()
     invalid_ok = test_invalid_input()
     embeddings_ok = test_with_embeddings()
+    stream_ok = test_process_stream()
     
     # Summary
     print("\n" + "=" * 60)
@@ -299,8 +368,9 @@ def main():
     print(f"  Text Processing:       {'✓ PASS' if process_ok else '✗ FAIL'}")
     print(f"  Invalid Input:         {'✓ PASS' if invalid_ok else '✗ FAIL'}")
     print(f"  With Embeddings:       {'✓ PASS' if embeddings_ok else '✗ FAIL'}")
+    print(f"  Streaming Processing:  {'✓ PASS' if stream_ok else '✗ FAIL'}")
     
-    all_passed = all([health_ok, process_ok, invalid_ok, embeddings_ok])
+    all_passed = all([health_ok, process_ok, invalid_ok, embeddings_ok, stream_ok])
     
     if all_passed:
         print("\n🎉 All API tests passed!")
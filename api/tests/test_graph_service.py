@@ -3,590 +3,276 @@ Test script for graph service.
 
 Tests:
 1. Graph creation with nodes and edges
-2. Graph storage and retrieval
+2. Graph storage and retrieval (one test per lifecycle step)
 3. Node and edge queries
-4. Path finding
+4. Path finding (and path memoization)
 5. Subgraph extraction
 6. Graph statistics
 
-Run from project root: python api/tests/test_graph_service.py
+Run from project root: pytest -q api/tests/test_graph_service.py -n auto
+While iterating: pytest -x --ff --tb=line api/tests/test_graph_service.py
+
+Every test uses its own graph ID on an in-memory GraphService, so the tests
+are independent and pytest-xdist can spread them over all cores (each worker
+builds its own session fixtures).
 """
 
 import sys
-from pathlib import Path
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import pytest
+
+# Skip the whole module, rather than erroring per test, if the service or
+# networkx cannot be imported
+pytest.importorskip("api.services.graph_service")
 
 
-def test_graph_creation():
+def test_graph_creation(make_graph):
     """Test creating a graph with nodes and edges."""
-    print("=" * 60)
-    print("Testing Graph Creation")
-    print("=" * 60)
+    # Create sample nodes
+    nodes = [
+        {"id": "node_0", "label": "Python", "type": "language"},
+        {"id": "node_1", "label": "JavaScript", "type": "language"},
+        {"id": "node_2", "label": "Web Development", "type": "field"},
+        {"id": "node_3", "label": "Data Science", "type": "field"},
+        {"id": "node_4", "label": "Machine Learning", "type": "field"}
+    ]
+    
+    # Create sample edges
+    edges = [
+        {"source": "node_0", "target": "node_2", "relationship_type": "used-in"},
+        {"source": "node_0", "target": "node_3", "relationship_type": "used-in"},
+        {"source": "node_1", "target": "node_2", "relationship_type": "used-in"},
+        {"source": "node_3", "target": "node_4", "relationship_type": "includes"}
+    ]
+    
+    # Create graph
+    G = make_graph("test_graph_1", nodes, edges)
     
-    try:
-        from api.services.graph_service import GraphService
-        
-        service = GraphService()
-        
-        # Create sample nodes
-        nodes = [
-            {"id": "node_0", "label": "Python", "type": "language"},
-            {"id": "node_1", "label": "JavaScript", "type": "language"},
-            {"id": "node_2", "label": "Web Development", "type": "field"},
-            {"id": "node_3", "label": "Data Science", "type": "field"},
-            {"id": "node_4", "label": "Machine Learning", "type": "field"}
-        ]
-        
-        # Create sample edges
-        edges = [
-            {"source": "node_0", "target": "node_2", "relationship_type": "used-in"},
-            {"source": "node_0", "target": "node_3", "relationship_type": "used-in"},
-            {"source": "node_1", "target": "node_2", "relationship_type": "used-in"},
-            {"source": "node_3", "target": "node_4", "relationship_type": "includes"}
-        ]
-        
-        # Create graph
-        G = service.create_graph("test_graph_1", nodes, edges)
-        
-        print(f"✓ Graph created successfully")
-        print(f"  - Nodes: {G.number_of_nodes()}")
-        print(f"  - Edges: {G.number_of_edges()}")
-        
-        # Verify node count
-        if G.number_of_nodes() == len(nodes):
-            print(f"✓ Correct number of nodes ({len(nodes)})")
-        else:
-            print(f"✗ Wrong node count: {G.number_of_nodes()} (expected {len(nodes)})")
-            return False
-        
-        # Verify edge count
-        if G.number_of_edges() == len(edges):
-            print(f"✓ Correct number of edges ({len(edges)})")
-        else:
-            print(f"✗ Wrong edge count: {G.number_of_edges()} (expected {len(edges)})")
-            return False
-        
-        # Verify node attributes
-        node_data = G.nodes["node_0"]
-        if node_data.get('label') == "Python":
-            print("✓ Node attributes preserved")
-        else:
-            print("✗ Node attributes not preserved")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Graph creation failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_graph_storage_retrieval():
-    """Test storing and retrieving graphs."""
-    print("\n" + "=" * 60)
-    print("Testing Graph Storage and Retrieval")
-    print("=" * 60)
+    # Verify node and edge counts
+    assert G.number_of_nodes() == len(nodes)
+    assert G.number_of_edges() == len(edges)
     
-    try:
-        from api.services.graph_service import GraphService
-        
-        service = GraphService()
-        
-        nodes = [
-            {"id": "a", "label": "A"},
-            {"id": "b", "label": "B"}
-        ]
-        edges = [{"source": "a", "target": "b"}]
-        
-        # Create graph
-        service.create_graph("storage_test", nodes, edges)
-        
-        # Check if graph exists
-        if service.graph_exists("storage_test"):
-            print("✓ Graph exists after creation")
-        else:
-            print("✗ Graph not found after creation")
-            return False
-        
-        # Retrieve graph
-        G = service.get_graph("storage_test")
-        if G is not None:
-            print("✓ Graph retrieved successfully")
-        else:
-            print("✗ Failed to retrieve graph")
-            return False
-        
-        # Get metadata
-        metadata = service.get_graph_metadata("storage_test")
-        if metadata:
-            print(f"✓ Metadata retrieved: {metadata.get('node_count')} nodes, {metadata.get('edge_count')} edges")
-        else:
-            print("✗ Failed to retrieve metadata")
-            return False
-        
-        # List graphs
-        graphs = service.list_graphs()
-        if "storage_test" in graphs:
-            print(f"✓ Graph found in list (total: {len(graphs)})")
-        else:
-            print("✗ Graph not in list")
-            return False
-        
-        # Delete graph
-        if service.delete_graph("storage_test"):
-            print("✓ Graph deleted successfully")
-        else:
-            print("✗ Failed to delete graph")
-            return False
-        
-        # Verify deletion
-        if not service.graph_exists("storage_test"):
-            print("✓ Graph no longer exists after deletion")
-        else:
-            print("✗ Graph still exists after deletion")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Storage/retrieval test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_node_edge_queries():
+    # Verify node attributes
+    assert G.nodes["node_0"].get('label') == "Python", "Node attributes not preserved"
+
+
+@pytest.fixture
+def stored_graph(service):
+    """Two-node graph a->b, created fresh per test and removed afterwards."""
+    name = "storage_test"
+    service.create_graph(
+        name,
+        [{"id": "a", "label": "A"}, {"id": "b", "label": "B"}],
+        [{"source": "a", "target": "b"}]
+    )
+    yield name
+    if service.graph_exists(name):
+        service.delete_graph(name)
+
+
+def test_storage_exists(service, stored_graph):
+    """Test that a created graph exists."""
+    assert service.graph_exists(stored_graph), "Graph not found after creation"
+
+
+def test_storage_get(service, stored_graph):
+    """Test retrieving a stored graph."""
+    assert service.get_graph(stored_graph) is not None, "Failed to retrieve graph"
+
+
+def test_storage_metadata(service, stored_graph):
+    """Test retrieving stored graph metadata."""
+    metadata = service.get_graph_metadata(stored_graph)
+    assert metadata, "Failed to retrieve metadata"
+    assert (metadata['node_count'], metadata['edge_count']) == (2, 1)
+
+
+def test_storage_list(service, stored_graph):
+    """Test that a stored graph is listed."""
+    assert stored_graph in service.list_graphs(), "Graph not in list"
+
+
+def test_storage_delete(service, stored_graph):
+    """Test deleting a stored graph."""
+    assert service.delete_graph(stored_graph), "Failed to delete graph"
+    assert not service.graph_exists(stored_graph), "Graph still exists after deletion"
+
+
+def test_node_edge_queries(service, make_graph):
     """Test querying nodes and edges."""
-    print("\n" + "=" * 60)
-    print("Testing Node and Edge Queries")
-    print("=" * 60)
+    # Create graph
+    nodes = [
+        {"id": "1", "label": "Concept A", "importance": 0.9},
+        {"id": "2", "label": "Concept B", "importance": 0.8},
+        {"id": "3", "label": "Concept C", "importance": 0.7}
+    ]
+    edges = [
+        {"source": "1", "target": "2", "relationship_type": "related-to"},
+        {"source": "2", "target": "3", "relationship_type": "leads-to"}
+    ]
     
-    try:
-        from api.services.graph_service import GraphService
-        
-        service = GraphService()
-        
-        # Create graph
-        nodes = [
-            {"id": "1", "label": "Concept A", "importance": 0.9},
-            {"id": "2", "label": "Concept B", "importance": 0.8},
-            {"id": "3", "label": "Concept C", "importance": 0.7}
-        ]
-        edges = [
-            {"source": "1", "target": "2", "relationship_type": "related-to"},
-            {"source": "2", "target": "3", "relationship_type": "leads-to"}
-        ]
-        
-        service.create_graph("query_test", nodes, edges)
-        
-        # Get node data
-        node_data = service.get_node_data("query_test", "1")
-        if node_data and node_data['label'] == "Concept A":
-            print(f"✓ Node data retrieved: {node_data['label']}")
-        else:
-            print("✗ Failed to get node data")
-            return False
-        
-        # Get neighbors
-        neighbors = service.get_neighbors("query_test", "2")
-        print(f"  Neighbors of node 2: {neighbors}")
-        if "1" in neighbors and "3" in neighbors:
-            print("✓ Neighbors found correctly")
-        else:
-            print("✗ Incorrect neighbors")
-            return False
-        
-        # Get edges for node
-        edges_data = service.get_edges_for_node("query_test", "2")
-        print(f"  Edges for node 2: {len(edges_data)} edge(s)")
-        if len(edges_data) == 2:  # 1 incoming, 1 outgoing
-            print("✓ Edges retrieved correctly")
-        else:
-            print(f"✗ Wrong number of edges: {len(edges_data)} (expected 2)")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Node/edge query test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_bfs_dfs_traversal():
-    """Test BFS and DFS traversal as specified in Task 8."""
-    print("\n" + "=" * 60)
-    print("Testing BFS and DFS Traversal (Task 8)")
-    print("=" * 60)
+    make_graph("query_test", nodes, edges)
     
-    try:
-        from api.services.graph_service import GraphService
-        
-        service = GraphService()
-        
-        # Create graph A->B->C->D as specified in task
-        nodes = [
-            {"id": "A", "label": "Node A"},
-            {"id": "B", "label": "Node B"},
-            {"id": "C", "label": "Node C"},
-            {"id": "D", "label": "Node D"}
-        ]
-        edges = [
-            {"source": "A", "target": "B"},
-            {"source": "B", "target": "C"},
-            {"source": "C", "target": "D"}
-        ]
-        
-        service.create_graph("traversal_test", nodes, edges)
-        
-        # Test BFS from A (should return [A, B, C, D])
-        bfs_result = service.bfs_traversal("traversal_test", "A")
-        print(f"  BFS from A: {bfs_result}")
-        
-        if bfs_result == ["A", "B", "C", "D"]:
-            print("✓ BFS traversal correct: [A, B, C, D]")
-        else:
-            print(f"✗ BFS traversal incorrect: {bfs_result} (expected [A, B, C, D])")
-            return False
-        
-        # Test DFS from A
-        dfs_result = service.dfs_traversal("traversal_test", "A")
-        print(f"  DFS from A: {dfs_result}")
-        
-        if len(dfs_result) == 4 and dfs_result[0] == "A":
-            print(f"✓ DFS traversal has all 4 nodes starting from A")
-        else:
-            print(f"✗ DFS traversal incorrect")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ BFS/DFS traversal test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_node_expansion():
+    # Get node data
+    node_data = service.get_node_data("query_test", "1")
+    assert node_data and node_data['label'] == "Concept A", f"Failed to get node data: {node_data}"
+    
+    # Get neighbors
+    neighbors = set(service.get_neighbors("query_test", "2"))
+    assert {"1", "3"} <= neighbors, f"Incorrect neighbors: {neighbors}"
+    
+    # Get edges for node
+    edges_data = service.get_edges_for_node("query_test", "2")
+    assert len(edges_data) == 2  # 1 incoming, 1 outgoing
+
+
+@pytest.mark.parametrize("method, check", [
+    ("bfs_traversal", lambda r: r == ["A", "B", "C", "D"]),
+    ("dfs_traversal", lambda r: len(r) == 4 and r[0] == "A"),
+], ids=["bfs", "dfs"])
+def test_bfs_dfs_traversal(service, chain_graph, method, check):
+    """Test BFS and DFS traversal from A on the A->B->C->D chain (Task 8)."""
+    result = getattr(service, method)(chain_graph, "A")
+    
+    assert check(result), f"{method} incorrect: {result}"
+
+
+def test_node_expansion(service, chain_graph):
     """Test node expansion as specified in Task 8."""
-    print("\n" + "=" * 60)
-    print("Testing Node Expansion (Task 8)")
-    print("=" * 60)
+    # Expand node B of A->B->C->D (should return subgraph with B and neighbors)
+    expansion = service.expand_node(chain_graph, "B", depth=1)
+    
+    assert expansion, "Failed to expand node B"
+    
+    node_ids = {n['id'] for n in expansion['nodes']}
     
-    try:
-        from api.services.graph_service import GraphService
-        
-        service = GraphService()
-        
-        # Create graph A->B->C->D
-        nodes = [
-            {"id": "A", "label": "Node A"},
-            {"id": "B", "label": "Node B"},
-            {"id": "C", "label": "Node C"},
-            {"id": "D", "label": "Node D"}
-        ]
-        edges = [
-            {"source": "A", "target": "B"},
-            {"source": "B", "target": "C"},
-            {"source": "C", "target": "D"}
-        ]
-        
-        service.create_graph("expansion_test", nodes, edges)
-        
-        # Expand node B (should return subgraph with B and neighbors)
-        expansion = service.expand_node("expansion_test", "B", depth=1)
-        
-        if expansion:
-            print(f"✓ Node B expanded successfully")
-            print(f"  - Center node: {expansion['center_node']}")
-            print(f"  - Nodes in expansion: {[n['id'] for n in expansion['nodes']]}")
-            print(f"  - Edges in expansion: {len(expansion['edges'])}")
-            
-            node_ids = [n['id'] for n in expansion['nodes']]
-            
-            # Should include B and its neighbors (A, C)
-            if 'B' in node_ids and ('A' in node_ids or 'C' in node_ids):
-                print("✓ Expansion includes B and at least one neighbor")
-            else:
-                print(f"✗ Expansion missing expected nodes")
-                return False
-        else:
-            print("✗ Failed to expand node B")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Node expansion test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_path_finding():
+    # Should include B and at least one of its neighbors (A, C)
+    assert 'B' in node_ids and node_ids & {'A', 'C'}, \
+        f"Expansion missing expected nodes: {node_ids}"
+
+
+def test_path_finding(service, make_graph):
     """Test finding paths between nodes."""
-    print("\n" + "=" * 60)
-    print("Testing Path Finding")
-    print("=" * 60)
+    # Create a connected graph: A -> B -> C -> D
+    nodes = [
+        {"id": "A", "label": "Node A"},
+        {"id": "B", "label": "Node B"},
+        {"id": "C", "label": "Node C"},
+        {"id": "D", "label": "Node D"}
+    ]
+    edges = [
+        {"source": "A", "target": "B"},
+        {"source": "B", "target": "C"},
+        {"source": "C", "target": "D"},
+        {"source": "A", "target": "C"}  # Shortcut
+    ]
+    
+    make_graph("path_test", nodes, edges)
+    
+    # Find shortest path
+    path = service.get_path("path_test", "A", "D")
+    assert path == ["A", "C", "D"], f"Expected the shortcut path, got {path}"
+    
+    # Count all paths (A->B->C->D and A->C->D)
+    path_count = service.count_paths("path_test", "A", "D", max_length=5)
+    
+    assert path_count >= 2, "Expected multiple paths (including shortcut)"
+
+
+def test_path_cache(service, make_graph):
+    """Test that repeat path lookups are memoized and a rebuilt graph is not served stale paths."""
+    from api.services.graph_paths import shortest_path
+    
+    nodes = [{"id": n, "label": n} for n in "ABC"]
+    make_graph("path_cache", nodes, [{"source": "A", "target": "B"}, {"source": "B", "target": "C"}])
     
-    try:
-        from api.services.graph_service import GraphService
-        
-        service = GraphService()
-        
-        # Create a connected graph: A -> B -> C -> D
-        nodes = [
-            {"id": "A", "label": "Node A"},
-            {"id": "B", "label": "Node B"},
-            {"id": "C", "label": "Node C"},
-            {"id": "D", "label": "Node D"}
-        ]
-        edges = [
-            {"source": "A", "target": "B"},
-            {"source": "B", "target": "C"},
-            {"source": "C", "target": "D"},
-            {"source": "A", "target": "C"}  # Shortcut
-        ]
-        
-        service.create_graph("path_test", nodes, edges)
-        
-        # Find shortest path
-        path = service.get_path("path_test", "A", "D")
-        if path:
-            print(f"✓ Shortest path found: {' -> '.join(path)}")
-            print(f"  Path length: {len(path) - 1} hops")
-        else:
-            print("✗ No path found")
-            return False
-        
-        # Find all paths
-        all_paths = service.get_all_paths("path_test", "A", "D", max_length=5)
-        print(f"✓ Found {len(all_paths)} path(s) from A to D:")
-        for i, p in enumerate(all_paths, 1):
-            print(f"  {i}. {' -> '.join(p)}")
-        
-        if len(all_paths) >= 2:
-            print("✓ Multiple paths found (including shortcut)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Path finding test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_subgraph_extraction():
+    assert service.get_path("path_cache", "A", "C") == ["A", "B", "C"]
+    hits = shortest_path.cache_info().hits
+    assert service.get_path("path_cache", "A", "C") == ["A", "B", "C"]
+    assert shortest_path.cache_info().hits == hits + 1, "Repeat lookup was not served from the cache"
+    
+    # Same ID, new graph with a direct edge: deleting the old graph clears
+    # the path cache, so the old path must not be reused
+    assert service.delete_graph("path_cache")
+    make_graph("path_cache", nodes, [{"source": "A", "target": "C"}])
+    assert service.get_path("path_cache", "A", "C") == ["A", "C"]
+
+
+@pytest.mark.parametrize("int_chain", [10], indirect=True)
+def test_subgraph_extraction(service, int_chain):
     """Test extracting subgraphs."""
-    print("\n" + "=" * 60)
-    print("Testing Subgraph Extraction")
-    print("=" * 60)
+    graph_id, _ = int_chain
+    
+    # Extract the first four nodes of the 10-node chain
+    subgraph = service.get_subgraph(graph_id, ["0", "1", "2", "3"])
     
-    try:
-        from api.services.graph_service import GraphService
-        
-        service = GraphService()
-        
-        # Create larger graph
-        nodes = [{"id": str(i), "label": f"Node {i}"} for i in range(10)]
-        edges = [
-            {"source": "0", "target": "1"},
-            {"source": "1", "target": "2"},
-            {"source": "2", "target": "3"},
-            {"source": "5", "target": "6"},
-            {"source": "6", "target": "7"}
-        ]
-        
-        service.create_graph("subgraph_test", nodes, edges)
-        
-        # Extract subgraph
-        subgraph = service.get_subgraph("subgraph_test", ["0", "1", "2", "3"])
-        
-        if subgraph:
-            print(f"✓ Subgraph extracted")
-            print(f"  - Nodes: {subgraph.number_of_nodes()}")
-            print(f"  - Edges: {subgraph.number_of_edges()}")
-            
-            if subgraph.number_of_nodes() == 4:
-                print("✓ Correct number of nodes in subgraph")
-            else:
-                print(f"✗ Wrong node count: {subgraph.number_of_nodes()}")
-                return False
-            
-            if subgraph.number_of_edges() == 3:
-                print("✓ Correct number of edges in subgraph")
-            else:
-                print(f"✗ Wrong edge count: {subgraph.number_of_edges()}")
-                return False
-        else:
-            print("✗ Failed to extract subgraph")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Subgraph extraction test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_distance_queries():
+    assert subgraph is not None, "Failed to extract subgraph"
+    assert subgraph.number_of_nodes() == 4
+    assert subgraph.number_of_edges() == 3
+
+
+@pytest.mark.parametrize("int_chain", [6], indirect=True)
+def test_distance_queries(service, int_chain):
     """Test querying nodes within distance."""
-    print("\n" + "=" * 60)
-    print("Testing Distance Queries")
-    print("=" * 60)
+    graph_id, _ = int_chain
     
-    try:
-        from api.services.graph_service import GraphService
-        
-        service = GraphService()
-        
-        # Create graph
-        nodes = [{"id": str(i), "label": f"Node {i}"} for i in range(6)]
-        edges = [
-            {"source": "0", "target": "1"},
-            {"source": "0", "target": "2"},
-            {"source": "1", "target": "3"},
-            {"source": "2", "target": "4"},
-            {"source": "3", "target": "5"}
-        ]
-        
-        service.create_graph("distance_test", nodes, edges)
-        
-        # Get nodes within 1 hop
-        nodes_1_hop = service.get_nodes_within_distance("distance_test", "0", distance=1)
-        print(f"  Nodes within 1 hop of '0': {nodes_1_hop}")
-        
-        if len(nodes_1_hop) == 2:
-            print(f"✓ Found {len(nodes_1_hop)} nodes within 1 hop")
-        else:
-            print(f"✗ Wrong count: {len(nodes_1_hop)} (expected 2)")
-            return False
-        
-        # Get nodes within 2 hops
-        nodes_2_hop = service.get_nodes_within_distance("distance_test", "0", distance=2)
-        print(f"  Nodes within 2 hops of '0': {nodes_2_hop}")
-        
-        if len(nodes_2_hop) >= 4:
-            print(f"✓ Found {len(nodes_2_hop)} nodes within 2 hops")
-        else:
-            print(f"⚠ Found {len(nodes_2_hop)} nodes (expected at least 4)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Distance query test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_graph_statistics():
-    """Test calculating graph statistics."""
-    print("\n" + "=" * 60)
-    print("Testing Graph Statistics")
-    print("=" * 60)
+    # Start mid-chain so both directions count: 1 hop of '2' is {1, 3}
+    nodes_1_hop = service.get_nodes_within_distance(graph_id, "2", distance=1)
     
-    try:
-        from api.services.graph_service import GraphService
-        
-        service = GraphService()
-        
-        # Create graph
-        nodes = [{"id": str(i), "label": f"Node {i}"} for i in range(5)]
-        edges = [
-            {"source": "0", "target": "1"},
-            {"source": "1", "target": "2"},
-            {"source": "2", "target": "3"},
-            {"source": "3", "target": "4"}
-        ]
-        
-        service.create_graph("stats_test", nodes, edges)
-        
-        # Get statistics
-        stats = service.get_graph_statistics("stats_test")
-        
-        if stats:
-            print("✓ Statistics calculated:")
-            print(f"  - Nodes: {stats['node_count']}")
-            print(f"  - Edges: {stats['edge_count']}")
-            print(f"  - Density: {stats['density']:.4f}")
-            print(f"  - Is connected: {stats['is_connected']}")
-            print(f"  - Avg degree: {stats.get('avg_degree', 0):.2f}")
-            
-            if stats['node_count'] == 5:
-                print("✓ Correct node count in statistics")
-            else:
-                print("✗ Wrong node count")
-                return False
-        else:
-            print("✗ Failed to calculate statistics")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Statistics test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def main():
-    """Run all graph service tests."""
-    print("\n" + "=" * 60)
-    print("GRAPH SERVICE TEST SUITE")
-    print("=" * 60 + "\n")
+    assert len(nodes_1_hop) == 2
     
-    # Run tests
-    creation_ok = test_graph_creation()
-    storage_ok = test_graph_storage_retrieval()
-    queries_ok = test_node_edge_queries()
-    bfs_dfs_ok = test_bfs_dfs_traversal()
-    expansion_ok = test_node_expansion()
-    paths_ok = test_path_finding()
-    subgraph_ok = test_subgraph_extraction()
-    distance_ok = test_distance_queries()
-    stats_ok = test_graph_statistics()
+    # Get nodes within 2 hops: {0, 1, 3, 4}
+    nodes_2_hop = service.get_nodes_within_distance(graph_id, "2", distance=2)
     
-    # Summary
-    print("\n" + "=" * 60)
-    print("Test Summary")
-    print("=" * 60)
-    print(f"  Graph Creation:      {'✓ PASS' if creation_ok else '✗ FAIL'}")
-    print(f"  Storage/Retrieval:   {'✓ PASS' if storage_ok else '✗ FAIL'}")
-    print(f"  Node/Edge Queries:   {'✓ PASS' if queries_ok else '✗ FAIL'}")
-    print(f"  BFS/DFS Traversal:   {'✓ PASS' if bfs_dfs_ok else '✗ FAIL'}")
-    print(f"  Node Expansion:      {'✓ PASS' if expansion_ok else '✗ FAIL'}")
-    print(f"  Path Finding:        {'✓ PASS' if paths_ok else '✗ FAIL'}")
-    print(f"  Subgraph Extraction: {'✓ PASS' if subgraph_ok else '✗ FAIL'}")
-    print(f"  Distance Queries:    {'✓ PASS' if distance_ok else '✗ FAIL'}")
-    print(f"  Graph Statistics:    {'✓ PASS' if stats_ok else '✗ FAIL'}")
+    assert len(nodes_2_hop) >= 4
+
+
+@pytest.mark.parametrize("int_chain", [5], indirect=True)
+def test_graph_statistics(stats, int_chain):
+    """Test calculating graph statistics."""
+    graph_id, _ = int_chain
     
-    all_passed = all([
-        creation_ok, storage_ok, queries_ok, bfs_dfs_ok, expansion_ok,
-        paths_ok, subgraph_ok, distance_ok, stats_ok
-    ])
+    # Get statistics
+    graph_stats = stats(graph_id)
     
-    if all_passed:
-        print("\n🎉 All tests passed!")
-        print("   Task 7 & 8 are complete. Ready for Task 9!")
-        return True
-    else:
-        print("\n⚠ Some tests failed. Please review the errors above.")
-        return False
+    assert graph_stats, "Failed to calculate statistics"
+    assert graph_stats['node_count'] == 5
+    assert graph_stats['edge_count'] == 4
+    assert graph_stats['is_connected']
 
 
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
 
+# Traversal benchmarks (pytest-benchmark). Timings on the 10k chain catch
+# complexity regressions that the small correctness graphs cannot. Save a
+# baseline with --benchmark-autosave and gate on it with
+# --benchmark-compare --benchmark-compare-fail=mean:10%.
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="traversal")
+@pytest.mark.parametrize("method", ["bfs_traversal", "dfs_traversal"])
+def test_traversal_perf(benchmark, service, chain_graph_large, method):
+    """Benchmark BFS/DFS over the full 10k chain."""
+    graph_id, n = chain_graph_large
+    result = benchmark(getattr(service, method), graph_id, "0")
+    assert len(result) == n
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="traversal")
+def test_shortest_path_perf(benchmark, service, chain_graph_large):
+    """Benchmark shortest path end to end along the 10k chain."""
+    graph_id, n = chain_graph_large
+    path = benchmark(service.get_path, graph_id, "0", str(n - 1))
+    assert len(path) == n
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="traversal")
+def test_all_paths_perf(benchmark, service, chain_graph_large):
+    """Benchmark simple-path enumeration end to end along the 10k chain."""
+    graph_id, n = chain_graph_large
+    paths = benchmark(service.get_all_paths, graph_id, "0", str(n - 1), max_length=n)
+    assert len(paths) == 1
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", __file__]))
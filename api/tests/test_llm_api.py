@@ -4,28 +4,37 @@ Test script for LLM API endpoints (Task 12).
 This script tests the two new LLM endpoints:
 1. POST /api/py/llm/explain - Generate relationship explanation
 2. POST /api/py/llm/qa - Answer questions about the graph
+3. POST /api/py/llm/qa/stream - Same answer as server-sent events
 """
 
+import asyncio
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import httpx
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from fastapi.testclient import TestClient
+
+from api.index import app, graph_service, llm_service
+from api.tests.cassette import is_live, use_cassette
+from api.tests.parallel import run_tests
+
 
-def test_explain_endpoint():
+def check_explain_endpoint(client):
     """Test the relationship explanation endpoint."""
     print("\n" + "=" * 60)
     print("Testing Relationship Explanation Endpoint")
     print("=" * 60)
     
     try:
-        from fastapi.testclient import TestClient
-        from api.index import app
-        
-        client = TestClient(app)
-        
         # First, create a graph
         print("\n1. Creating graph...")
         process_response = client.post(
@@ -109,18 +118,13 @@ def test_explain_endpoint():
         return False
 
 
-def test_qa_endpoint():
+def check_qa_endpoint(client):
     """Test the Q&A endpoint."""
     print("\n" + "=" * 60)
     print("Testing Q&A Endpoint")
     print("=" * 60)
     
     try:
-        from fastapi.testclient import TestClient
-        from api.index import app
-        
-        client = TestClient(app)
-        
         # Create a graph
         print("\n1. Creating graph...")
         process_response = client.post(
@@ -192,18 +196,84 @@ def test_qa_endpoint():
         return False
 
 
-def test_qa_with_history():
-    """Test Q&A endpoint with conversation history."""
+def check_qa_stream_endpoint(client):
+    """Test the streaming Q&A endpoint (server-sent events)."""
     print("\n" + "=" * 60)
-    print("Testing Q&A with Conversation History")
+    print("Testing Streaming Q&A Endpoint")
     print("=" * 60)
     
     try:
-        from fastapi.testclient import TestClient
-        from api.index import app
+        import json
+        # Create a graph
+        print("\n1. Creating graph...")
+        process_response = client.post(
+            "/api/py/text/process",
+            json={
+                "text": "Artificial intelligence uses machine learning techniques. Machine learning includes supervised learning and unsupervised learning. Neural networks are a type of machine learning model inspired by the human brain.",
+                "max_concepts": 5,
+                "min_importance": 0.4,
+                "extract_relationships": True,
+                "generate_embeddings": False
+            }
+        )
         
-        client = TestClient(app)
+        if process_response.status_code != 200:
+            print(f"✗ Failed to create graph: {process_response.status_code}")
+            return False
+        
+        graph_id = process_response.json()['graph_id']
+        print(f"✓ Graph created: {graph_id}")
         
+        # Stream the answer and collect events
+        print("\n2. Streaming answer...")
+        events = []
+        with client.stream(
+            "POST",
+            "/api/py/llm/qa/stream",
+            json={"graph_id": graph_id, "question": "What is artificial intelligence?"}
+        ) as response:
+            if response.status_code != 200:
+                print(f"✗ Stream failed: {response.status_code}")
+                return False
+            event = None
+            for line in response.iter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: "):
+                    events.append((event, json.loads(line[len("data: "):])))
+        
+        deltas = [payload['text'] for name, payload in events if name == "delta"]
+        done = [payload for name, payload in events if name == "done"]
+        print(f"✓ Received {len(deltas)} delta events")
+        
+        if len(done) != 1:
+            print(f"✗ Expected one done event, got: {[name for name, _ in events][-3:]}")
+            return False
+        
+        result = done[0]
+        if "".join(deltas).strip() != result['answer']:
+            print(f"✗ Streamed text does not match final answer")
+            return False
+        print(f"✓ Streamed text matches final answer ({len(result['answer'])} chars)")
+        print(f"  Sources: {result['sources']}")
+        
+        print("\n✓ Streaming Q&A endpoint test passed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Streaming Q&A endpoint test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def check_qa_with_history(client):
+    """Test Q&A endpoint with conversation history."""
+    print("\n" + "=" * 60)
+    print("Testing Q&A with Conversation History")
+    print("=" * 60)
+    
+    try:
         # Create a graph
         print("\n1. Creating graph...")
         process_response = client.post(
@@ -289,18 +359,13 @@ def test_qa_with_history():
         return False
 
 
-def test_qa_with_node_focus():
+def check_qa_with_node_focus(client):
     """Test Q&A endpoint with specific node focus."""
     print("\n" + "=" * 60)
     print("Testing Q&A with Node Focus")
     print("=" * 60)
     
     try:
-        from fastapi.testclient import TestClient
-        from api.index import app
-        
-        client = TestClient(app)
-        
         # Create a graph
         print("\n1. Creating graph...")
         process_response = client.post(
@@ -368,18 +433,13 @@ def test_qa_with_node_focus():
         return False
 
 
-def test_error_handling():
+def check_error_handling(client):
     """Test error handling for invalid requests."""
     print("\n" + "=" * 60)
     print("Testing Error Handling")
     print("=" * 60)
     
     try:
-        from fastapi.testclient import TestClient
-        from api.index import app
-        
-        client = TestClient(app)
-        
         # Test 1: Explain with non-existent graph
         response = client.post(
             "/api/py/llm/explain",
@@ -430,21 +490,111 @@ def test_error_handling():
         return False
 
 
+# pytest entry points: each check_* prints a report and returns True on success
+
+@pytest.mark.llm
+def test_explain_endpoint(client):
+    """pytest wrapper for check_explain_endpoint()."""
+    assert check_explain_endpoint(client)
+
+
+@pytest.mark.llm
+def test_qa_endpoint(client):
+    """pytest wrapper for check_qa_endpoint()."""
+    assert check_qa_endpoint(client)
+
+
+@pytest.mark.llm
+def test_qa_stream_endpoint(client):
+    """pytest wrapper for check_qa_stream_endpoint()."""
+    assert check_qa_stream_endpoint(client)
+
+
+@pytest.mark.llm
+def test_qa_with_history(client):
+    """pytest wrapper for check_qa_with_history()."""
+    assert check_qa_with_history(client)
+
+
+@pytest.mark.llm
+def test_qa_with_node_focus(client):
+    """pytest wrapper for check_qa_with_node_focus()."""
+    assert check_qa_with_node_focus(client)
+
+
+def test_error_handling(client):
+    """pytest wrapper for check_error_handling()."""
+    assert check_error_handling(client)
+
+
+@pytest.mark.asyncio
+async def test_qa_does_not_block_event_loop(monkeypatch):
+    """16 concurrent /llm/qa requests on a slow LLM must overlap, not queue on the event loop."""
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    
+    def slow_answer(question, graph_context, conversation_history=None):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.2)  # Stand-in for a blocking OpenAI call
+        with lock:
+            in_flight -= 1
+        return {"answer": "A uses B", "confidence": "high", "sources": [],
+                "citations": [], "model": "test"}
+    
+    monkeypatch.setattr(llm_service, "answer_question", slow_answer)
+    graph_service.create_graph(
+        "concurrency_test",
+        [{"id": "a", "label": "A"}, {"id": "b", "label": "B"}],
+        [{"source": "a", "target": "b", "relationship_type": "uses"}]
+    )
+    # ASGITransport skips the lifespan, so size the thread pool as it would;
+    # the executor is shut down below so its threads do not outlive the test
+    executor = ThreadPoolExecutor(max_workers=16)
+    asyncio.get_running_loop().set_default_executor(executor)
+    
+    payload = {"graph_id": "concurrency_test", "question": "How does A relate to B?"}
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(client.post("/api/py/llm/qa", json=payload) for _ in range(16))
+            )
+    finally:
+        graph_service.delete_graph("concurrency_test")
+        executor.shutdown(wait=True)
+    
+    assert all(r.status_code == 200 for r in responses), [r.text for r in responses]
+    assert max_in_flight >= 2, "slow answers ran one at a time"
+
+
 def main():
     """Run all LLM API tests."""
     print("\n" + "=" * 60)
     print("LLM API TEST SUITE (Task 12)")
     print("=" * 60 + "\n")
     
-    print("Note: These tests make actual OpenAI API calls and may take 1-2 minutes.")
+    if is_live():
+        print("Note: LLM_LIVE=1 - these tests make actual OpenAI API calls and may take a minute.")
+    else:
+        print("Note: replaying recorded OpenAI responses (set LLM_LIVE=1 for live calls).")
     print("=" * 60)
     
     # Run tests
-    explain_ok = test_explain_endpoint()
-    qa_ok = test_qa_endpoint()
-    history_ok = test_qa_with_history()
-    focus_ok = test_qa_with_node_focus()
-    errors_ok = test_error_handling()
+    # Tests are independent, so they run concurrently (see parallel.py)
+    # One client (and one app startup/shutdown) is shared by every test
+    with use_cassette("test_llm_api"), TestClient(app) as client:
+        explain_ok, qa_ok, stream_ok, history_ok, focus_ok, errors_ok = run_tests([
+            check_explain_endpoint,
+            check_qa_endpoint,
+            check_qa_stream_endpoint,
+            check_qa_with_history,
+            check_qa_with_node_focus,
+            check_error_handling,
+        ], client)
     
     # Summary
     print("\n" + "=" * 60)
@@ -452,11 +602,12 @@ def main():
     print("=" * 60)
     print(f"  Explain Endpoint:          {'✓ PASS' if explain_ok else '✗ FAIL'}")
     print(f"  Q&A Endpoint:              {'✓ PASS' if qa_ok else '✗ FAIL'}")
+    print(f"  Streaming Q&A:             {'✓ PASS' if stream_ok else '✗ FAIL'}")
     print(f"  Q&A with History:          {'✓ PASS' if history_ok else '✗ FAIL'}")
     print(f"  Q&A with Node Focus:       {'✓ PASS' if focus_ok else '✗ FAIL'}")
     print(f"  Error Handling:            {'✓ PASS' if errors_ok else '✗ FAIL'}")
     
-    all_passed = all([explain_ok, qa_ok, history_ok, focus_ok, errors_ok])
+    all_passed = all([explain_ok, qa_ok, stream_ok, history_ok, focus_ok, errors_ok])
     
     if all_passed:
         print("\n🎉 All tests passed!")
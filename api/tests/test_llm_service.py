@@ -5,15 +5,22 @@ This script tests the relationship explanation functionality
 using GPT-4 to generate natural language explanations.
 """
 
+import asyncio
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from api.tests.cassette import is_live, use_cassette
+from api.tests.parallel import run_tests
 
-def test_relationship_explanation():
+
+def check_relationship_explanation():
     """Test generating explanations for node relationships."""
     print("\n" + "=" * 60)
     print("Testing Relationship Explanation")
@@ -94,7 +101,7 @@ def test_relationship_explanation():
         return False
 
 
-def test_relationship_with_multiple_connections():
+def check_relationship_with_multiple_connections():
     """Test explanation for a node with multiple connections (as per Task 10 requirements)."""
     print("\n" + "=" * 60)
     print("Testing Node with 3+ Connections")
@@ -134,20 +141,16 @@ def test_relationship_with_multiple_connections():
         print(f"\nTesting explanations for {central_node['label']} with 3 connections:")
         
         all_mentioned = True
-        explanations = []
         
-        for i, related in enumerate(related_nodes, 1):
+        # Explain all connections concurrently (one round trip instead of three)
+        explanations = asyncio.run(service.explain_relationships_async(
+            central_node,
+            related_nodes,
+            relationship_type="includes"
+        ))
+        
+        for i, (related, explanation) in enumerate(zip(related_nodes, explanations), 1):
             print(f"\n  Connection {i}: {central_node['label']} → {related['label']}")
-            
-            path = [central_node, related]
-            explanation = service.explain_relationship(
-                central_node,
-                related,
-                path,
-                relationship_type="includes"
-            )
-            
-            explanations.append(explanation)
             print(f"  Explanation: {explanation[:100]}...")
             
             # Check if both nodes are mentioned
@@ -172,7 +175,7 @@ def test_relationship_with_multiple_connections():
         return False
 
 
-def test_qa_functionality():
+def check_qa_functionality():
     """Test Q&A functionality with graph context."""
     print("\n" + "=" * 60)
     print("Testing Q&A Functionality")
@@ -233,7 +236,58 @@ def test_qa_functionality():
         return False
 
 
-def test_conversation_history():
+def check_citations_beyond_top_k():
+    """Test that answers can cite nodes cut from a top-k Q&A context."""
+    print("\n" + "=" * 60)
+    print("Testing Citations Beyond the Top-K Context")
+    print("=" * 60)
+    
+    try:
+        from api.services.graph_service import GraphService
+        from api.services.llm_service import LLMService
+        
+        service = LLMService()
+        graph_service = GraphService()
+        
+        # Node 0 is the only core-tier node, so it ranks first
+        nodes = [
+            {"id": f"node_{i}", "label": f"Concept {i:02d}", "description": f"Concept number {i}",
+             "tier": 1 if i == 0 else 2, "confidence": 1.0 - i / 100}
+            for i in range(20)
+        ]
+        edges = [
+            {"source": "node_0", "target": f"node_{i}", "relationship_type": "related-to"}
+            for i in range(1, 20)
+        ]
+        graph_service.create_graph("citations_top_k", nodes, edges)
+        
+        context = service.select_context(graph_service, "citations_top_k", k=5)
+        print(f"✓ Prompt context keeps {len(context['nodes'])} of {len(context['citation_nodes'])} nodes")
+        if len(context['nodes']) != 5 or len(context['citation_nodes']) != 20:
+            print("✗ Expected 5 prompt nodes and 20 citation nodes")
+            return False
+        
+        # Concept 19 ranks last, so it is outside the prompt's top 5
+        result = service._qa_result("Concept 00 links to Concept 19.", context)
+        print(f"  Sources: {result['sources']}")
+        if result['sources'] != ["node_0", "node_19"]:
+            print("✗ Answer sources do not cover nodes outside the top-k")
+            return False
+        if [c['label'] for c in result['citations']] != ["Concept 00", "Concept 19"]:
+            print("✗ Citations do not cover nodes outside the top-k")
+            return False
+        print("✓ Sources and citations include a node outside the top-k")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Citation test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def check_conversation_history():
     """Test Q&A with conversation history (Task 11 requirement)."""
     print("\n" + "=" * 60)
     print("Testing Conversation History")
@@ -319,7 +373,7 @@ def test_conversation_history():
         return False
 
 
-def test_graph_summary():
+def check_graph_summary():
     """Test graph summary generation."""
     print("\n" + "=" * 60)
     print("Testing Graph Summary")
@@ -368,18 +422,127 @@ def test_graph_summary():
         return False
 
 
+def run_batch_mode():
+    """
+    Run the explanation, Q&A and summary checks as one OpenAI Batch API job.
+    
+    Enabled with BATCH_MODE=1. Half the cost of the live calls, but results
+    can take minutes. The multi-connection and conversation-history checks
+    need interactive round trips and are skipped here.
+    """
+    print("\n" + "=" * 60)
+    print("Running LLM checks via the Batch API (BATCH_MODE=1)")
+    print("=" * 60)
+    
+    try:
+        from api.services.llm_service import LLMService
+        
+        service = LLMService()
+        
+        python = {"id": "node_1", "label": "Python", "description": "Programming language"}
+        web = {"id": "node_2", "label": "Web Development", "description": "Building websites"}
+        data = {"id": "node_3", "label": "Data Science", "description": "Analyzing data"}
+        edges = [
+            {"source": "node_1", "target": "node_2", "relationship_type": "used-in"},
+            {"source": "node_1", "target": "node_3", "relationship_type": "used-in"}
+        ]
+        graph_context = {"nodes": [python, web, data], "edges": edges}
+        
+        jobs = {
+            "explanation": service.explanation_batch_request(
+                python, data, [python, data], relationship_type="used-in"
+            ),
+            "qa": service.qa_batch_request("What is Python used for?", graph_context),
+            "summary": service.summary_batch_request([python, web, data], edges),
+        }
+        # Minimum length each result must reach, per custom_id
+        min_lengths = {"explanation": 50, "qa": 20, "summary": 100}
+        
+        print(f"Submitting {len(jobs)} requests; polling every 10s...")
+        results = service.run_batch(jobs, poll_interval=10.0)
+        
+        all_ok = True
+        for custom_id, min_length in min_lengths.items():
+            text = results.get(custom_id, "")
+            if len(text) > min_length:
+                print(f"✓ {custom_id}: {len(text)} characters")
+            else:
+                print(f"✗ {custom_id}: missing or too short ({len(text)} characters)")
+                all_ok = False
+        
+        return all_ok
+        
+    except Exception as e:
+        print(f"✗ Batch mode failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+# pytest entry points: each check_* prints a report and returns True on success
+
+@pytest.mark.llm
+def test_relationship_explanation():
+    """pytest wrapper for check_relationship_explanation()."""
+    assert check_relationship_explanation()
+
+
+@pytest.mark.llm
+def test_relationship_with_multiple_connections():
+    """pytest wrapper for check_relationship_with_multiple_connections()."""
+    assert check_relationship_with_multiple_connections()
+
+
+@pytest.mark.llm
+def test_qa_functionality():
+    """pytest wrapper for check_qa_functionality()."""
+    assert check_qa_functionality()
+
+
+def test_citations_beyond_top_k():
+    """pytest wrapper for check_citations_beyond_top_k()."""
+    assert check_citations_beyond_top_k()
+
+
+@pytest.mark.llm
+def test_conversation_history():
+    """pytest wrapper for check_conversation_history()."""
+    assert check_conversation_history()
+
+
+@pytest.mark.llm
+def test_graph_summary():
+    """pytest wrapper for check_graph_summary()."""
+    assert check_graph_summary()
+
+
 def main():
     """Run all LLM service tests."""
+    if os.getenv("BATCH_MODE") == "1":
+        if run_batch_mode():
+            print("\n🎉 All batch checks passed!")
+            return True
+        print("\n⚠ Some batch checks failed. Please review the errors above.")
+        return False
+    
     print("\n" + "=" * 60)
     print("LLM SERVICE TEST SUITE (Task 10)")
     print("=" * 60 + "\n")
     
+    if not is_live():
+        print("Note: replaying recorded OpenAI responses (set LLM_LIVE=1 for live calls).")
+    
     # Run tests
-    explanation_ok = test_relationship_explanation()
-    multi_connection_ok = test_relationship_with_multiple_connections()
-    qa_ok = test_qa_functionality()
-    history_ok = test_conversation_history()
-    summary_ok = test_graph_summary()
+    # Tests are independent, so they run concurrently (see parallel.py)
+    with use_cassette("test_llm_service"):
+        explanation_ok, multi_connection_ok, qa_ok, citations_ok, history_ok, summary_ok = run_tests([
+            check_relationship_explanation,
+            check_relationship_with_multiple_connections,
+            check_qa_functionality,
+            check_citations_beyond_top_k,
+            check_conversation_history,
+            check_graph_summary,
+        ])
     
     # Summary
     print("\n" + "=" * 60)
@@ -388,10 +551,11 @@ def main():
     print(f"  Relationship Explanation:  {'✓ PASS' if explanation_ok else '✗ FAIL'}")
     print(f"  Multi-Connection Test:     {'✓ PASS' if multi_connection_ok else '✗ FAIL'}")
     print(f"  Q&A Functionality:         {'✓ PASS' if qa_ok else '✗ FAIL'}")
+    print(f"  Top-K Citations:           {'✓ PASS' if citations_ok else '✗ FAIL'}")
     print(f"  Conversation History:      {'✓ PASS' if history_ok else '✗ FAIL'}")
     print(f"  Graph Summary:             {'✓ PASS' if summary_ok else '✗ FAIL'}")
     
-    all_passed = all([explanation_ok, multi_connection_ok, qa_ok, history_ok, summary_ok])
+    all_passed = all([explanation_ok, multi_connection_ok, qa_ok, citations_ok, history_ok, summary_ok])
     
     if all_passed:
         print("\n🎉 All tests passed!")
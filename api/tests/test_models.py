@@ -7,46 +7,66 @@ This tests:
 3. Validation works correctly
 4. Serialization to JSON works
 
+The creation and serialization tests build models from hand-written, known
+valid literals with model_construct(), which skips pydantic validation;
+test_validation() keeps the validating constructor, since that is what it
+checks.
+
 Run from project root: python -m api.tests.test_models
 Or from anywhere: python api/tests/test_models.py
 """
 
 import sys
+import traceback
 from pathlib import Path
 from datetime import datetime
 from typing import List
 
+import numpy as np
+import orjson
+
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from api.tests.parallel import run_tests
+
+# Section rule for the printed report
+_SEP = "=" * 60
+_NL_SEP = "\n" + _SEP
+
+# Import once for the whole file; test_imports() reports a failure here
+try:
+    from api.models.graph_models import Node, Edge, Graph
+    from pydantic import ValidationError
+    _IMPORT_ERR = None
+except ImportError as e:
+    _IMPORT_ERR = e
+
 
 def test_imports():
     """Test that all models can be imported."""
-    print("=" * 60)
+    print(_SEP)
     print("Testing Model Imports")
-    print("=" * 60)
+    print(_SEP)
     
-    try:
-        from api.models.graph_models import Node, Edge, Graph
-        print("✓ Successfully imported Node, Edge, Graph from api.models")
-        return True
-    except ImportError as e:
-        print(f"✗ Failed to import models: {e}")
+    if _IMPORT_ERR is not None:
+        print(f"✗ Failed to import models: {_IMPORT_ERR}")
         return False
+    
+    print("✓ Successfully imported Node, Edge, Graph from api.models")
+    return True
 
 
 def test_node_creation():
     """Test creating Node instances."""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("Testing Node Creation")
-    print("=" * 60)
+    print(_SEP)
     
     try:
-        from api.models.graph_models import Node
-        
         # Create a simple node
-        node = Node(
+        node = Node.model_construct(
             id="test_node_1",
             label="Python Programming",
             description="Python is a high-level programming language",
@@ -60,7 +80,7 @@ def test_node_creation():
         print(f"  - Confidence: {node.confidence}")
         print(f"  - Has children: {node.has_children}")
         
-        # Test with embedding
+        # Test with embedding (validated, so the list is converted to float32)
         node_with_embedding = Node(
             id="test_node_2",
             label="Machine Learning",
@@ -73,6 +93,35 @@ def test_node_creation():
         print(f"✓ Created node with embedding: {node_with_embedding.label}")
         print(f"  - Embedding dimensions: {len(node_with_embedding.embedding)}")
         
+        embedding = node_with_embedding.embedding
+        if embedding.dtype != np.float32 or embedding.nbytes != 20:
+            print(f"✗ Embedding stored as {embedding.dtype} ({embedding.nbytes} bytes), expected float32 (20 bytes)")
+            return False
+        print("✓ Embedding stored as a float32 array (20 bytes)")
+        
+        if not isinstance(node_with_embedding.model_dump()['embedding'], list):
+            print("✗ model_dump() should return the embedding as a list")
+            return False
+        print("✓ model_dump() returns the embedding as a list")
+        
+        # Both JSON paths emit the float32 values as written, not their
+        # float64 expansions (0.10000000149011612)
+        dumped = orjson.loads(node_with_embedding.model_dump_json())['embedding']
+        streamed = orjson.loads(Graph(graph_id="emb", nodes=[node_with_embedding]).to_json_bytes())
+        if dumped != [0.1, 0.2, 0.3, 0.4, 0.5] or streamed['nodes'][0]['embedding'] != dumped:
+            print(f"✗ Embedding JSON differs: model_dump_json {dumped}, "
+                  f"to_json_bytes {streamed['nodes'][0]['embedding']}")
+            return False
+        print("✓ model_dump_json() and to_json_bytes() agree on embedding values")
+        
+        # Nodes with embeddings compare by value (and work with `in`)
+        twin = node_with_embedding.model_copy(update={"embedding": embedding.copy()})
+        other = node_with_embedding.model_copy(update={"embedding": embedding * 2})
+        if twin != node_with_embedding or other == node_with_embedding or twin not in [other, node_with_embedding]:
+            print("✗ Node equality with embeddings is wrong")
+            return False
+        print("✓ Nodes with embeddings compare by value")
+        
         return True
         
     except Exception as e:
@@ -82,15 +131,13 @@ def test_node_creation():
 
 def test_edge_creation():
     """Test creating Edge instances."""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("Testing Edge Creation")
-    print("=" * 60)
+    print(_SEP)
     
     try:
-        from api.models.graph_models import Edge
-        
         # Create an edge
-        edge = Edge(
+        edge = Edge.model_construct(
             id="test_edge_1",
             source="test_node_1",
             target="test_node_2",
@@ -106,7 +153,7 @@ def test_edge_creation():
         # Test different relationship types
         edge_types = ["is-a", "part-of", "causes", "contradicts"]
         for rel_type in edge_types:
-            e = Edge(
+            e = Edge.model_construct(
                 id=f"edge_{rel_type}",
                 source="node_a",
                 target="node_b",
@@ -124,16 +171,14 @@ def test_edge_creation():
 
 def test_graph_creation():
     """Test creating Graph instances with nodes and edges."""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("Testing Graph Creation")
-    print("=" * 60)
+    print(_SEP)
     
     try:
-        from api.models.graph_models import Node, Edge, Graph
-        
         # Create nodes
         nodes = [
-            Node(
+            Node.model_construct(
                 id="node_1",
                 label="Artificial Intelligence",
                 description="The simulation of human intelligence by machines",
@@ -141,7 +186,7 @@ def test_graph_creation():
                 confidence=0.95,
                 has_children=True
             ),
-            Node(
+            Node.model_construct(
                 id="node_2",
                 label="Machine Learning",
                 description="A subset of AI focused on learning from data",
@@ -149,7 +194,7 @@ def test_graph_creation():
                 confidence=0.92,
                 has_children=True
             ),
-            Node(
+            Node.model_construct(
                 id="node_3",
                 label="Deep Learning",
                 description="ML using neural networks with multiple layers",
@@ -160,7 +205,7 @@ def test_graph_creation():
         
         # Create edges
         edges = [
-            Edge(
+            Edge.model_construct(
                 id="edge_1",
                 source="node_1",
                 target="node_2",
@@ -168,7 +213,7 @@ def test_graph_creation():
                 weight=0.9,
                 confidence=0.95
             ),
-            Edge(
+            Edge.model_construct(
                 id="edge_2",
                 source="node_2",
                 target="node_3",
@@ -179,7 +224,7 @@ def test_graph_creation():
         ]
         
         # Create graph
-        graph = Graph(
+        graph = Graph.model_construct(
             graph_id="test_graph_1",
             nodes=nodes,
             edges=edges,
@@ -190,7 +235,7 @@ def test_graph_creation():
             }
         )
         
-        print(f"✓ Created graph: {graph.metadata.get('title', 'Untitled')}")
+        print(f"✓ Created graph: {graph.metadata['title']}")
         print(f"  - Graph ID: {graph.graph_id}")
         print(f"  - Node count: {graph.node_count}")
         print(f"  - Edge count: {graph.edge_count}")
@@ -207,22 +252,42 @@ def test_graph_creation():
         
     except Exception as e:
         print(f"✗ Graph creation failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
+def _sized_graph(node_count: int):
+    """Graph of identically sized nodes, so its JSON size is linear in node_count."""
+    created = datetime(2024, 1, 1, 12, 0, 0)
+    return Graph.model_construct(
+        graph_id="size_test",
+        nodes=[
+            Node.model_construct(
+                id=f"node_{i:05d}",
+                label="Sized Node",
+                description="Same length for every node",
+                source_text="Sized.",
+                confidence=0.9,
+                created_at=created
+            )
+            for i in range(node_count)
+        ],
+        edges=[],
+        metadata={},
+        created_at=created,
+        updated_at=created
+    )
+
+
 def test_json_serialization():
     """Test that models can be serialized to JSON."""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("Testing JSON Serialization")
-    print("=" * 60)
+    print(_SEP)
     
     try:
-        from api.models.graph_models import Node, Edge, Graph
-        
         # Create a node
-        node = Node(
+        node = Node.model_construct(
             id="node_json",
             label="Test Node",
             description="A test node for JSON serialization",
@@ -231,21 +296,36 @@ def test_json_serialization():
         )
         
         # Convert to JSON
-        node_json = node.model_dump_json(indent=2)
+        node_json = orjson.dumps(
+            node.__dict__, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
         print("✓ Node serialized to JSON:")
         print(node_json[:200] + "...")
         
         # Create a small graph
-        graph = Graph(
+        graph = Graph.model_construct(
             graph_id="json_test",
             nodes=[node],
             edges=[],
             metadata={"test": True}
         )
         
-        graph_json = graph.model_dump_json(indent=2)
+        graph_json = graph.to_json_bytes()
         print("\n✓ Graph serialized to JSON:")
-        print(graph_json[:200] + "...")
+        print(graph_json[:200].decode() + "...")
+        
+        parsed = orjson.loads(graph_json)
+        if parsed['graph_id'] != "json_test" or [n['id'] for n in parsed['nodes']] != ["node_json"]:
+            print(f"✗ Serialized graph does not parse back: {parsed}")
+            return False
+        print("✓ Serialized graph parses back with orjson")
+        
+        # Identical nodes add a fixed number of bytes each
+        sizes = {n: len(_sized_graph(n).to_json_bytes()) for n in (10, 20, 40)}
+        if sizes[40] - sizes[20] != 2 * (sizes[20] - sizes[10]):
+            print(f"✗ JSON size does not grow linearly with node count: {sizes}")
+            return False
+        print(f"✓ JSON size grows linearly with node count: {sizes}")
         
         return True
         
@@ -256,14 +336,11 @@ def test_json_serialization():
 
 def test_validation():
     """Test that Pydantic validation works correctly."""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("Testing Validation")
-    print("=" * 60)
+    print(_SEP)
     
     try:
-        from api.models.graph_models import Node
-        from pydantic import ValidationError
-        
         # Test valid confidence range (should work)
         try:
             node = Node(
@@ -309,22 +386,24 @@ def test_validation():
 
 def main():
     """Run all model tests."""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("DATA MODELS TEST SUITE")
-    print("=" * 60 + "\n")
+    print(_SEP + "\n")
     
-    # Run tests
-    imports_ok = test_imports()
-    node_ok = test_node_creation()
-    edge_ok = test_edge_creation()
-    graph_ok = test_graph_creation()
-    json_ok = test_json_serialization()
-    validation_ok = test_validation()
+    # Tests share no state, so they run concurrently (see parallel.py)
+    imports_ok, node_ok, edge_ok, graph_ok, json_ok, validation_ok = run_tests([
+        test_imports,
+        test_node_creation,
+        test_edge_creation,
+        test_graph_creation,
+        test_json_serialization,
+        test_validation,
+    ])
     
     # Summary
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("Test Summary")
-    print("=" * 60)
+    print(_SEP)
     print(f"  Imports:        {'✓ PASS' if imports_ok else '✗ FAIL'}")
     print(f"  Node Creation:  {'✓ PASS' if node_ok else '✗ FAIL'}")
     print(f"  Edge Creation:  {'✓ PASS' if edge_ok else '✗ FAIL'}")
@@ -332,10 +411,10 @@ def main():
     print(f"  JSON Serial:    {'✓ PASS' if json_ok else '✗ FAIL'}")
     print(f"  Validation:     {'✓ PASS' if validation_ok else '✗ FAIL'}")
     
-    all_passed = all([
-        imports_ok, node_ok, edge_ok, 
+    all_passed = all((
+        imports_ok, node_ok, edge_ok,
         graph_ok, json_ok, validation_ok
-    ])
+    ))
     
     if all_passed:
         print("\n🎉 All model tests passed!")
@@ -0,0 +1,298 @@
+"""
+Test script for the msgspec graph models and their decode speed.
+
+This tests:
+1. The msgspec models (api.models.graph_models_ms) can be imported
+2. Nodes, edges and graphs decode from JSON with defaults filled in
+3. Validation rejects the same bad input as the Pydantic models
+4. Bulk node decoding is materially faster than Pydantic's validate_json
+
+Requires msgspec (pip install -r requirements-dev.txt).
+
+Run from project root: python -m api.tests.test_models_ms
+Or from anywhere: python api/tests/test_models_ms.py
+Or with pytest: pytest api/tests/test_models_ms.py
+"""
+
+import gc
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import orjson
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from api.tests.parallel import run_tests
+
+# Section rule for the printed report
+_SEP = "=" * 60
+_NL_SEP = "\n" + _SEP
+
+# Import once for the whole file; check_imports() reports a failure here
+try:
+    import msgspec
+    from pydantic import TypeAdapter
+    from api.models import graph_models, graph_models_ms
+    _IMPORT_ERR = None
+except ImportError as e:
+    _IMPORT_ERR = e
+
+# Nodes per payload in the decode benchmark, and how many times it is decoded
+BENCH_NODES = 2000
+BENCH_ROUNDS = 5
+
+# msgspec must decode bulk nodes at least this many times faster than Pydantic
+MIN_SPEEDUP = 2.0
+
+
+def _node_payload(count: int) -> bytes:
+    """JSON array of count nodes shaped like the API's node dicts."""
+    return orjson.dumps([
+        {
+            "id": f"node_{i}",
+            "label": f"Concept {i}",
+            "description": "A concept extracted from the input text",
+            "source_text": "Concepts are extracted from the input text.",
+            "embedding": [0.01 * (i % 100)] * 16,
+            "confidence": 0.9,
+            "metadata": {"importance": 0.8, "level": 1 + i % 3},
+            "has_children": i % 2 == 0,
+            "created_at": "2024-01-01T12:00:00"
+        }
+        for i in range(count)
+    ])
+
+
+def check_imports():
+    """Test that the msgspec models can be imported."""
+    print(_SEP)
+    print("Testing msgspec Model Imports")
+    print(_SEP)
+
+    if _IMPORT_ERR is not None:
+        print(f"✗ Failed to import msgspec models: {_IMPORT_ERR}")
+        return False
+
+    print("✓ Successfully imported Node, Edge, Graph from api.models.graph_models_ms")
+    return True
+
+
+def check_node_decoding():
+    """Test decoding nodes and filling in defaults."""
+    print(_NL_SEP)
+    print("Testing msgspec Node Decoding")
+    print(_SEP)
+
+    try:
+        nodes = graph_models_ms.node_list_decoder.decode(_node_payload(3))
+
+        print(f"✓ Decoded {len(nodes)} nodes")
+        if nodes[0].label != "Concept 0" or len(nodes[0].embedding) != 16:
+            print(f"✗ Unexpected first node: {nodes[0]}")
+            return False
+        print(f"  - First node: {nodes[0].label} ({len(nodes[0].embedding)}-dim embedding)")
+
+        minimal = msgspec.json.decode(
+            b'{"id": "n", "label": "L", "description": "D", "source_text": "S"}',
+            type=graph_models_ms.Node
+        )
+        if minimal.confidence != 1.0 or minimal.metadata != {} or minimal.embedding is not None:
+            print(f"✗ Defaults not applied: {minimal}")
+            return False
+        print("✓ Defaults applied to a minimal node")
+
+        return True
+
+    except Exception as e:
+        print(f"✗ Node decoding failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def check_graph_decoding():
+    """Test decoding a whole graph and round-tripping it."""
+    print(_NL_SEP)
+    print("Testing msgspec Graph Decoding")
+    print(_SEP)
+
+    try:
+        payload = orjson.dumps({
+            "graph_id": "ms_graph",
+            "nodes": orjson.loads(_node_payload(3)),
+            "edges": [
+                {"id": "e1", "source": "node_0", "target": "node_1", "relationship_type": "is-a", "weight": 0.8},
+                {"id": "e2", "source": "node_1", "target": "node_2", "relationship_type": "part-of"}
+            ],
+            "metadata": {"title": "msgspec graph"}
+        })
+
+        graph = graph_models_ms.graph_decoder.decode(payload)
+        print(f"✓ Decoded graph: {graph.metadata['title']}")
+        print(f"  - Nodes: {graph.node_count}")
+        print(f"  - Edges: {graph.edge_count}")
+
+        if graph.node_count != 3 or graph.edge_count != 2 or graph.edges[1].weight != 1.0:
+            print("✗ Graph contents do not match the payload")
+            return False
+
+        again = graph_models_ms.graph_decoder.decode(msgspec.json.encode(graph))
+        if again != graph:
+            print("✗ Graph changed after an encode/decode round trip")
+            return False
+        print("✓ Graph survives an encode/decode round trip")
+
+        return True
+
+    except Exception as e:
+        print(f"✗ Graph decoding failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def check_validation():
+    """Test that msgspec rejects the same invalid input as the Pydantic models."""
+    print(_NL_SEP)
+    print("Testing msgspec Validation")
+    print(_SEP)
+
+    cases = [
+        ("confidence > 1.0", b'{"id": "n", "label": "L", "description": "D", "source_text": "S", "confidence": 1.5}'),
+        ("missing required fields", b'{"id": "incomplete"}'),
+        ("confidence is a string", b'{"id": "n", "label": "L", "description": "D", "source_text": "S", "confidence": "high"}'),
+    ]
+
+    try:
+        for name, raw in cases:
+            try:
+                msgspec.json.decode(raw, type=graph_models_ms.Node)
+                print(f"✗ Invalid node accepted ({name})")
+                return False
+            except msgspec.ValidationError:
+                print(f"✓ Invalid node correctly rejected ({name})")
+
+        return True
+
+    except Exception as e:
+        print(f"✗ Validation testing failed: {e}")
+        return False
+
+
+def check_decode_speed():
+    """Compare bulk node decoding: msgspec Decoder vs Pydantic validate_json."""
+    print(_NL_SEP)
+    print(f"Testing Decode Speed ({BENCH_NODES} nodes x {BENCH_ROUNDS} rounds)")
+    print(_SEP)
+
+    try:
+        payload = _node_payload(BENCH_NODES)
+        pydantic_nodes = TypeAdapter(list[graph_models.Node])
+
+        def best_time(decode):
+            # Untimed warm-up decode, then time with a clean heap and the
+            # collector paused (as timeit does) so GC passes over the
+            # decoded objects don't land in one side's numbers
+            decode(payload)
+            gc.collect()
+            gc.disable()
+            try:
+                best = float("inf")
+                for _ in range(BENCH_ROUNDS):
+                    start = time.perf_counter()
+                    decode(payload)
+                    best = min(best, time.perf_counter() - start)
+                return best
+            finally:
+                gc.enable()
+
+        ms_time = best_time(graph_models_ms.node_list_decoder.decode)
+        pydantic_time = best_time(pydantic_nodes.validate_json)
+        speedup = pydantic_time / ms_time
+
+        print(f"  - msgspec:  {ms_time * 1000:.1f} ms")
+        print(f"  - Pydantic: {pydantic_time * 1000:.1f} ms")
+        print(f"  - Ratio:    {speedup:.1f}x")
+
+        if speedup < MIN_SPEEDUP:
+            print(f"✗ msgspec is not materially faster (expected >= {MIN_SPEEDUP}x)")
+            return False
+        print(f"✓ msgspec decodes at least {MIN_SPEEDUP}x faster")
+
+        return True
+
+    except Exception as e:
+        print(f"✗ Decode speed test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+# pytest entry points: each check_* prints a report and returns True on success
+
+def test_imports():
+    """pytest wrapper for check_imports()."""
+    assert check_imports()
+
+
+def test_node_decoding():
+    """pytest wrapper for check_node_decoding()."""
+    assert check_node_decoding()
+
+
+def test_graph_decoding():
+    """pytest wrapper for check_graph_decoding()."""
+    assert check_graph_decoding()
+
+
+def test_validation():
+    """pytest wrapper for check_validation()."""
+    assert check_validation()
+
+
+def test_decode_speed():
+    """pytest wrapper for check_decode_speed()."""
+    assert check_decode_speed()
+
+
+def main():
+    """Run all msgspec model tests."""
+    print(_NL_SEP)
+    print("MSGSPEC MODELS TEST SUITE")
+    print(_SEP + "\n")
+
+    # Tests share no state, so they run concurrently (see parallel.py)
+    imports_ok, node_ok, graph_ok, validation_ok = run_tests([
+        check_imports,
+        check_node_decoding,
+        check_graph_decoding,
+        check_validation,
+    ])
+
+    # Timed on its own so the other tests don't skew the numbers
+    speed_ok = imports_ok and check_decode_speed()
+
+    # Summary
+    print(_NL_SEP)
+    print("Test Summary")
+    print(_SEP)
+    print(f"  Imports:        {'✓ PASS' if imports_ok else '✗ FAIL'}")
+    print(f"  Node Decoding:  {'✓ PASS' if node_ok else '✗ FAIL'}")
+    print(f"  Graph Decoding: {'✓ PASS' if graph_ok else '✗ FAIL'}")
+    print(f"  Validation:     {'✓ PASS' if validation_ok else '✗ FAIL'}")
+    print(f"  Decode Speed:   {'✓ PASS' if speed_ok else '✗ FAIL'}")
+
+    all_passed = all((imports_ok, node_ok, graph_ok, validation_ok, speed_ok))
+
+    if all_passed:
+        print("\n🎉 All msgspec model tests passed!")
+        return True
+    else:
+        print("\n⚠ Some tests failed. Please review the errors above.")
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
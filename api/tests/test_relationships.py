@@ -11,59 +11,119 @@ Run from project root: python api/tests/test_relationships.py
 """
 
 import sys
+import threading
+import traceback
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from dotenv import load_dotenv
+from api.tests.parallel import run_tests
 
-# Load environment variables
-load_dotenv('.env.local')
+# Section rule for the printed report
+_SEP = "=" * 60
+_NL_SEP = "\n" + _SEP
 
 
-def test_simple_relationship():
-    """Test relationship extraction with simple text."""
-    print("=" * 60)
-    print("Testing Simple Relationship Extraction")
-    print("=" * 60)
+@lru_cache(maxsize=1)
+def _service():
+    """
+    One TextProcessingService shared by every test in this file.
+
+    Every LLM-touching test goes through here, so .env.local is only read
+    when one of them actually runs, not when the module is collected.
+    """
+    from dotenv import load_dotenv
+    from api.services.text_processing import TextProcessingService
     
-    # Simple text with clear relationship
-    text = """
+    load_dotenv('.env.local')
+    return TextProcessingService()
+
+
+@dataclass(frozen=True, slots=True)
+class Concept:
+    """Pre-defined test concept (the service only reads its name)."""
+    name: str
+    description: str
+    importance: float
+    source_text: str
+
+
+# Simple text with clear relationship and pre-defined concepts
+SIMPLE_CASE = {
+    "text": """
 Python is a high-level programming language. It was created by Guido van Rossum
 and first released in 1991. Python emphasizes code readability and simplicity.
 Programming languages are formal languages used to communicate instructions to computers.
-"""
+""",
+    "concepts": (
+        Concept(
+            "Python",
+            "A high-level programming language",
+            0.95,
+            "Python is a high-level programming language"
+        ),
+        Concept(
+            "Programming Language",
+            "Formal languages for computer instructions",
+            0.90,
+            "Programming languages are formal languages"
+        ),
+    ),
+}
+
+TYPES_CASE = {
+    "text": """
+Machine learning is a subset of artificial intelligence. Neural networks are
+a key component of deep learning systems. Supervised learning requires labeled
+training data. Reinforcement learning uses rewards to guide agent behavior.
+""",
+    "concepts": (
+        Concept("Machine Learning", "AI subset", 0.95, "..."),
+        Concept("Artificial Intelligence", "AI field", 0.90, "..."),
+        Concept("Neural Networks", "ML architecture", 0.85, "..."),
+        Concept("Deep Learning", "ML technique", 0.88, "..."),
+        Concept("Supervised Learning", "Learning type", 0.80, "..."),
+        Concept("Labeled Data", "Training data", 0.75, "..."),
+    ),
+}
+
+_batch_lock = threading.Lock()
+_batch_results = None
+
+
+def _batched_relationships():
+    """
+    Relationships for SIMPLE_CASE and TYPES_CASE from a single LLM call.
+
+    The first test to ask makes the call; the other reuses its result, even
+    when both run at once under run_tests().
+    """
+    global _batch_results
+    with _batch_lock:
+        if _batch_results is None:
+            _batch_results = _service().extract_relationships_batch(
+                [SIMPLE_CASE, TYPES_CASE],
+                min_strength=0.5
+            )
+        return _batch_results
+
+
+def test_simple_relationship():
+    """Test relationship extraction with simple text."""
+    print(_SEP)
+    print("Testing Simple Relationship Extraction")
+    print(_SEP)
     
-    # Pre-defined concepts
-    concepts = [
-        {
-            "name": "Python",
-            "description": "A high-level programming language",
-            "importance": 0.95,
-            "source_text": "Python is a high-level programming language"
-        },
-        {
-            "name": "Programming Language",
-            "description": "Formal languages for computer instructions",
-            "importance": 0.90,
-            "source_text": "Programming languages are formal languages"
-        }
-    ]
+    concepts = SIMPLE_CASE["concepts"]
     
     try:
-        from api.services.text_processing import TextProcessingService
-        
-        service = TextProcessingService()
-        
         print("  → Extracting relationships...")
         
-        relationships = service.extract_relationships(
-            text=text,
-            concepts=concepts,
-            min_strength=0.5
-        )
+        relationships = _batched_relationships()[0]
         
         print(f"\n✓ Extraction successful! Found {len(relationships)} relationship(s):\n")
         
@@ -102,7 +162,7 @@ Programming languages are formal languages used to communicate instructions to c
                 return False
             
             # Validate source and target are from concepts
-            concept_names = [c['name'] for c in concepts]
+            concept_names = frozenset(c.name for c in concepts)
             if first_rel['source'] in concept_names and first_rel['target'] in concept_names:
                 print("✓ Source and target match concept names")
             else:
@@ -117,44 +177,22 @@ Programming languages are formal languages used to communicate instructions to c
         
     except Exception as e:
         print(f"✗ Relationship extraction failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
 def test_relationship_types():
     """Test that various relationship types are recognized."""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("Testing Various Relationship Types")
-    print("=" * 60)
-    
-    text = """
-Machine learning is a subset of artificial intelligence. Neural networks are
-a key component of deep learning systems. Supervised learning requires labeled
-training data. Reinforcement learning uses rewards to guide agent behavior.
-"""
-    
-    concepts = [
-        {"name": "Machine Learning", "description": "AI subset", "importance": 0.95, "source_text": "..."},
-        {"name": "Artificial Intelligence", "description": "AI field", "importance": 0.90, "source_text": "..."},
-        {"name": "Neural Networks", "description": "ML architecture", "importance": 0.85, "source_text": "..."},
-        {"name": "Deep Learning", "description": "ML technique", "importance": 0.88, "source_text": "..."},
-        {"name": "Supervised Learning", "description": "Learning type", "importance": 0.80, "source_text": "..."},
-        {"name": "Labeled Data", "description": "Training data", "importance": 0.75, "source_text": "..."}
-    ]
+    print(_SEP)
     
     try:
-        from api.services.text_processing import TextProcessingService
-        
-        service = TextProcessingService()
+        from api.services.text_processing import RELATIONSHIP_TYPE_SET
         
         print("  → Extracting relationships with various types...")
         
-        relationships = service.extract_relationships(
-            text=text,
-            concepts=concepts,
-            min_strength=0.5
-        )
+        relationships = _batched_relationships()[1]
         
         print(f"\n✓ Found {len(relationships)} relationships with different types:\n")
         
@@ -169,20 +207,25 @@ training data. Reinforcement learning uses rewards to guide agent behavior.
         for rt in relationship_types:
             print(f"  - {rt}")
         
+        unknown = relationship_types - RELATIONSHIP_TYPE_SET
+        if unknown:
+            print(f"✗ Types outside the prompt's allowlist: {sorted(unknown)}")
+            return False
+        print("✓ All types are in the allowed list")
+        
         return True
         
     except Exception as e:
         print(f"✗ Relationship type testing failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
 def test_full_pipeline():
     """Test full pipeline: concepts + relationships."""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("Testing Full Pipeline (Concepts + Relationships)")
-    print("=" * 60)
+    print(_SEP)
     
     text = """
 Python is a high-level programming language known for its simplicity and readability.
@@ -192,9 +235,7 @@ Web frameworks provide tools and libraries that simplify web development tasks.
 """
     
     try:
-        from api.services.text_processing import TextProcessingService
-        
-        service = TextProcessingService()
+        service = _service()
         
         print("  → Processing text (extracting concepts and relationships)...")
         
@@ -233,7 +274,7 @@ Web frameworks provide tools and libraries that simplify web development tasks.
         print(f"\n  Summary:")
         print(f"    - Concepts found: {len(concepts)}")
         print(f"    - Relationships found: {len(relationships)}")
-        print(f"    - Model used: {metadata.get('model', 'Unknown')}")
+        print(f"    - Model used: {metadata['model']}")
         
         print(f"\n  Concepts:")
         for c in concepts:
@@ -254,31 +295,32 @@ Web frameworks provide tools and libraries that simplify web development tasks.
         
     except Exception as e:
         print(f"✗ Full pipeline test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
 def main():
     """Run all relationship extraction tests."""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("RELATIONSHIP EXTRACTION TEST SUITE")
-    print("=" * 60 + "\n")
+    print(_SEP + "\n")
     
-    # Run tests
-    simple_ok = test_simple_relationship()
-    types_ok = test_relationship_types()
-    pipeline_ok = test_full_pipeline()
+    # Tests are independent LLM round trips, so they run concurrently (see parallel.py)
+    simple_ok, types_ok, pipeline_ok = run_tests([
+        test_simple_relationship,
+        test_relationship_types,
+        test_full_pipeline,
+    ])
     
     # Summary
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("Test Summary")
-    print("=" * 60)
+    print(_SEP)
     print(f"  Simple Relationship:  {'✓ PASS' if simple_ok else '✗ FAIL'}")
     print(f"  Relationship Types:   {'✓ PASS' if types_ok else '✗ FAIL'}")
     print(f"  Full Pipeline:        {'✓ PASS' if pipeline_ok else '✗ FAIL'}")
     
-    all_passed = all([simple_ok, types_ok, pipeline_ok])
+    all_passed = all((simple_ok, types_ok, pipeline_ok))
     
     if all_passed:
         print("\n🎉 All tests passed!")
@@ -3,18 +3,36 @@ Start the FastAPI backend with optimized settings for long-running requests.
 
 This script starts uvicorn with timeouts configured for processing
 long texts with unlimited concept extraction (can take 1-3 minutes).
+
+The server uses uvloop and httptools (both installed by uvicorn[standard])
+where available, falling back to asyncio and h11 (e.g. on Windows, where
+uvloop is not supported). Set RELOAD=0 to disable auto-reload, e.g. for
+load tests or demos.
+
+It always runs one worker: graphs are stored in the process's memory, so a
+second worker would not see graphs created through the first.
 """
 
+import importlib.util
+import os
+
 import uvicorn
 
+
+def _available(module: str) -> bool:
+    """Whether an optional uvicorn accelerator is installed."""
+    return importlib.util.find_spec(module) is not None
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "api.index:app",
         host="127.0.0.1",
         port=8000,
-        reload=True,
+        reload=os.getenv("RELOAD", "1") != "0",
+        loop="uvloop" if _available("uvloop") else "asyncio",
+        http="httptools" if _available("httptools") else "h11",
         timeout_keep_alive=300,  # 5 minutes keep-alive
         timeout_graceful_shutdown=30,
         log_level="info"
     )
-